@@ -2,22 +2,60 @@
 AI Advisor API routes.
 """
 import logging
-from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import re
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
+from app.core.cache import financial_context_cache
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
-from app.models.expense import Expense
 from app.models.budget import Budget
-from app.crud import expense, budget
-from sqlalchemy import func
+from app.models.expense_summary import ExpenseMonthlySummary
+from sqlalchemy import func, select
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Keywords that signal each advice intent
+INTENT_KEYWORDS = {
+    "budget": ("budget", "save", "spending", "limit"),
+    "category": ("category", "categories", "breakdown"),
+    "savings": ("save", "saving", "savings", "invest"),
+    "spending": ("spending", "expense", "expenses", "analysis"),
+    "alert": ("alert", "warning", "exceed", "over"),
+    "advice": ("advice", "recommend", "help", "tip", "tips"),
+}
+
+# Single-pass matcher over every keyword. The lookahead reports a match at
+# each position (so overlapping keywords are all seen), and longer keywords
+# are tried first so e.g. "savings" wins over "saving" at the same offset.
+_KEYWORDS = sorted({kw for kws in INTENT_KEYWORDS.values() for kw in kws}, key=len, reverse=True)
+_KEYWORD_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, _KEYWORDS)) + "))")
+_KEYWORD_INTENTS: dict[str, set[str]] = {}
+for _intent, _words in INTENT_KEYWORDS.items():
+    for _word in _words:
+        _KEYWORD_INTENTS.setdefault(_word, set()).add(_intent)
+
+
+def match_keywords(user_message: str) -> set[str]:
+    """Return the advice keywords contained in a lowercased message."""
+    return set(_KEYWORD_PATTERN.findall(user_message))
+
+
+def keyword_intents(keywords: set[str]) -> set[str]:
+    """Map matched keywords to the set of advice intents they signal."""
+    # Keywords nested in longer ones ("saving"/"savings", "tip"/"tips")
+    # share an intent, so seeing only the longest match loses nothing.
+    intents = set()
+    for word in keywords:
+        intents |= _KEYWORD_INTENTS[word]
+    return intents
+
 
 class ChatRequest(BaseModel):
     """Request schema for AI chat."""
@@ -35,7 +73,7 @@ class ChatResponse(BaseModel):
 async def ai_chat(
     chat_request: ChatRequest,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Chat with AI financial advisor.
@@ -48,87 +86,262 @@ async def ai_chat(
     Returns:
         AI advisor response
     """
-    try:
-        # Get user's financial data for context
-        user_expenses = expense.get_by_user(
-            db, user_id=current_user.id, skip=0, limit=50
-        )
-        
-        # Get user's budgets
-        user_budgets = budget.get_by_user(
-            db, user_id=current_user.id, skip=0, limit=50
+    # Financial context is cached per user/month for bursty chat sessions
+    context = await get_financial_context(db, user_id=current_user.id)
+    
+    # Generate AI response based on user message and financial data
+    user_message = chat_request.message.lower()
+    keywords = match_keywords(user_message)
+    response = generate_financial_advice(user_message, keywords=keywords, **context)
+    
+    # Generate suggestions
+    suggestions = generate_suggestions(user_message, context["budget_status"], keywords=keywords)
+    
+    logger.info(f"AI chat request from user {current_user.id}")
+    return ChatResponse(response=response, suggestions=suggestions)
+
+
+def _category_totals_statement(user_id: int):
+    """Build the all-time per-category totals query for a user, largest first."""
+    category_total = func.sum(ExpenseMonthlySummary.total_amount)
+    return (
+        select(
+            ExpenseMonthlySummary.category,
+            category_total,
+            func.sum(ExpenseMonthlySummary.txn_count),
         )
+        .where(ExpenseMonthlySummary.user_id == user_id)
+        .group_by(ExpenseMonthlySummary.category)
+        .order_by(category_total.desc())
+    )
+
+
+def _category_totals_from_rows(rows) -> tuple[dict[str, float], int]:
+    """Fold (category, total, count) rows into totals and an expense count."""
+    category_totals = {
+        category.value: float(total)
+        for category, total, _ in rows
+    }
+    return category_totals, sum(int(count) for _, _, count in rows)
+
+
+def format_category_breakdown(category_totals: dict[str, float]) -> str:
+    """Format the first five entries of totals already sorted largest first."""
+    return ", ".join([f"{k}: ${v:.2f}" for k, v in islice(category_totals.items(), 5)])
+
+
+async def get_financial_context(db: AsyncSession, *, user_id: int) -> dict:
+    """
+    Get the financial context used by the AI advisor, cached per user and month.
+    
+    On a cache miss the queries run one after another on the request's
+    session, so a chat request never holds more than one pooled connection.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
         
-        # Get budget status
-        from datetime import datetime
-        current_month = datetime.utcnow().strftime("%Y-%m")
-        budget_status_list = []
-        for budget_item in user_budgets:
-            if budget_item.month == current_month:
-                # Calculate spent for this budget
-                year, month_num = map(int, current_month.split('-'))
-                month_start = datetime(year, month_num, 1).date()
-                if month_num == 12:
-                    month_end = datetime(year + 1, 1, 1).date()
-                else:
-                    month_end = datetime(year, month_num + 1, 1).date()
-                
-                spent = (
-                    db.query(func.sum(Expense.amount))
-                    .filter(
-                        Expense.user_id == current_user.id,
-                        Expense.category == budget_item.category,
-                        func.date(Expense.date) >= month_start,
-                        func.date(Expense.date) < month_end
-                    )
-                    .scalar() or 0.0
-                )
-                
-                budget_status_list.append({
-                    "category": budget_item.category.value if hasattr(budget_item.category, 'value') else str(budget_item.category),
-                    "limit": budget_item.limit_amount,
-                    "spent": spent,
-                    "remaining": budget_item.limit_amount - spent,
-                })
-        
-        # Calculate totals
-        total_expenses = sum(e.amount for e in user_expenses)
-        total_budget = sum(b.limit_amount for b in user_budgets if b.month == current_month)
-        total_spent_this_month = sum(
-            e.amount for e in user_expenses
-            if e.date and e.date.strftime("%Y-%m") == current_month
+    Returns:
+        Dict of keyword arguments for generate_financial_advice
+    """
+    now = datetime.utcnow()
+    current_month = now.strftime("%Y-%m")
+    cache_key = (user_id, current_month)
+    
+    context = financial_context_cache.get(cache_key)
+    if context is not None:
+        return context
+    
+    # User's budgets for the current month
+    user_budgets = (
+        await db.execute(
+            select(Budget.category, Budget.limit_amount).where(
+                Budget.user_id == user_id,
+                Budget.month == current_month
+            )
         )
-        
-        # Get category breakdown
-        category_totals = {}
-        for e in user_expenses:
-            cat = e.category.value if hasattr(e.category, 'value') else str(e.category)
-            category_totals[cat] = category_totals.get(cat, 0) + e.amount
-        
-        # Generate AI response based on user message and financial data
-        user_message = chat_request.message.lower()
-        response = generate_financial_advice(
-            user_message,
-            total_expenses=total_expenses,
-            total_budget=total_budget,
-            total_spent_this_month=total_spent_this_month,
-            category_totals=category_totals,
-            budget_status=budget_status_list,
-            expenses_count=len(user_expenses),
+    ).all()
+    
+    # Spent per category for the current month from the summary table
+    spent_rows = (
+        await db.execute(
+            select(ExpenseMonthlySummary.category, ExpenseMonthlySummary.total_amount)
+            .where(
+                ExpenseMonthlySummary.user_id == user_id,
+                ExpenseMonthlySummary.year == now.year,
+                ExpenseMonthlySummary.month == now.month
+            )
         )
+    ).all()
+    
+    # All-time category breakdown
+    category_rows = (await db.execute(_category_totals_statement(user_id))).all()
+    spent_by_category = dict(spent_rows)
+    
+    budget_status_list = []
+    for budget_item in user_budgets:
+        spent = spent_by_category.get(budget_item.category) or 0.0
         
-        # Generate suggestions
-        suggestions = generate_suggestions(user_message, budget_status_list)
-        
-        logger.info(f"AI chat request from user {current_user.id}")
-        return ChatResponse(response=response, suggestions=suggestions)
-        
-    except Exception as e:
-        logger.error(f"Error in AI chat: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process AI chat request"
+        budget_status_list.append({
+            "category": budget_item.category.value,
+            "limit": budget_item.limit_amount,
+            "spent": spent,
+            "remaining": budget_item.limit_amount - spent,
+        })
+    
+    # Get category breakdown
+    category_totals, expenses_count = _category_totals_from_rows(category_rows)
+    
+    context = {
+        "total_expenses": sum(category_totals.values()),
+        "total_budget": sum(b.limit_amount for b in user_budgets),
+        "total_spent_this_month": sum(spent_by_category.values()),
+        "category_totals": category_totals,
+        "category_breakdown": format_category_breakdown(category_totals),
+        "budget_status": budget_status_list,
+        "expenses_count": expenses_count,
+    }
+    financial_context_cache.set(cache_key, context)
+    return context
+
+
+# Advice response templates, filled with str.format by the intent handlers
+ADVICE_TEMPLATES = {
+    "over_budget": "⚠️ You've exceeded your monthly budget by ${over:.2f}. I recommend reviewing your spending in the highest categories and cutting back on discretionary expenses. Consider adjusting your budget for next month based on actual needs.",
+    "near_budget": "💡 You've used {percentage:.1f}% of your monthly budget (${spent:.2f} of ${budget:.2f}). You have ${remaining:.2f} remaining. Be mindful of your spending to stay within budget.",
+    "on_track": "✅ Great job! You're on track with your budget. You've spent ${spent:.2f} out of ${budget:.2f} ({percentage_left:.1f}% remaining). Keep monitoring your spending to maintain this healthy pattern.",
+    "no_budget": "I recommend setting up budgets for different categories. Based on the 50/30/20 rule: allocate 50% for needs, 30% for wants, and 20% for savings. You can create budgets in the Budgets section.",
+    "top_category": "Your top spending category is {name} with ${total:.2f}. Here's your category breakdown: {breakdown}. Consider setting specific budgets for each category to better control your spending.",
+    "no_categories": "You haven't recorded many expenses yet. Start tracking your expenses to see category breakdowns and identify spending patterns.",
+    "savings_potential": "Based on your current spending, you could potentially save ${potential:.2f} this month. I recommend: 1) Automate savings transfers, 2) Review and cancel unused subscriptions, 3) Cook at home more often, 4) Use cashback apps for purchases.",
+    "savings_over_budget": "You're currently over budget. To start saving: 1) Identify your highest spending categories, 2) Set realistic budgets, 3) Track every expense, 4) Look for areas to cut back. Small changes add up quickly!",
+    "savings_general": "To build savings: 1) Set up automatic transfers to a savings account, 2) Follow the 50/30/20 rule (50% needs, 30% wants, 20% savings), 3) Build an emergency fund of 3-6 months expenses, 4) Review and optimize your spending regularly.",
+    "spending_summary": "You've recorded {count} expenses totaling ${total:.2f} (average: ${average:.2f} per transaction). Your monthly spending is ${monthly:.2f}. Review your spending patterns in the Analytics section for detailed insights.",
+    "no_spending": "Start tracking your expenses to get detailed spending analysis. Record your transactions regularly to see patterns, identify trends, and make informed financial decisions.",
+    "alert_exceeded": "⚠️ You've exceeded your budget in {count} categor{suffix}: {categories}. Review these categories and adjust your spending or budget limits.",
+    "alert_approaching": "💡 You're approaching your budget limit in {count} categor{suffix}: {categories}. Monitor your spending closely.",
+    "alert_on_track": "✅ All your budgets are on track! Keep monitoring your spending to maintain this healthy financial pattern.",
+    "alert_no_budget": "Set up budgets in the Budgets section to receive alerts when you're approaching or exceeding your spending limits.",
+}
+
+
+def _budget_advice(ctx: dict) -> str:
+    """Advice for budget-related questions."""
+    total_budget = ctx["total_budget"]
+    total_spent_this_month = ctx["total_spent_this_month"]
+    if total_budget <= 0:
+        return ADVICE_TEMPLATES["no_budget"]
+    
+    percentage_used = total_spent_this_month / total_budget * 100
+    remaining = total_budget - total_spent_this_month
+    if percentage_used > 100:
+        return ADVICE_TEMPLATES["over_budget"].format(over=abs(remaining))
+    if percentage_used > 80:
+        return ADVICE_TEMPLATES["near_budget"].format(
+            percentage=percentage_used,
+            spent=total_spent_this_month,
+            budget=total_budget,
+            remaining=remaining,
         )
+    return ADVICE_TEMPLATES["on_track"].format(
+        spent=total_spent_this_month,
+        budget=total_budget,
+        percentage_left=100 - percentage_used,
+    )
+
+
+def _category_advice(ctx: dict) -> str:
+    """Advice for category breakdown questions."""
+    category_totals = ctx["category_totals"]
+    if not category_totals:
+        return ADVICE_TEMPLATES["no_categories"]
+    
+    top_name, top_total = next(iter(category_totals.items()))
+    return ADVICE_TEMPLATES["top_category"].format(
+        name=top_name,
+        total=top_total,
+        breakdown=ctx["category_breakdown"],
+    )
+
+
+def _savings_advice(ctx: dict) -> str:
+    """Advice for savings questions."""
+    total_budget = ctx["total_budget"]
+    total_spent_this_month = ctx["total_spent_this_month"]
+    if total_budget <= 0 or total_spent_this_month <= 0:
+        return ADVICE_TEMPLATES["savings_general"]
+    
+    savings_potential = total_budget - total_spent_this_month
+    if savings_potential > 0:
+        return ADVICE_TEMPLATES["savings_potential"].format(potential=savings_potential)
+    return ADVICE_TEMPLATES["savings_over_budget"]
+
+
+def _spending_advice(ctx: dict) -> str:
+    """Advice for spending analysis questions."""
+    expenses_count = ctx["expenses_count"]
+    total_expenses = ctx["total_expenses"]
+    if expenses_count <= 0:
+        return ADVICE_TEMPLATES["no_spending"]
+    
+    return ADVICE_TEMPLATES["spending_summary"].format(
+        count=expenses_count,
+        total=total_expenses,
+        average=total_expenses / expenses_count,
+        monthly=ctx["total_spent_this_month"],
+    )
+
+
+def _category_list_advice(name: str, items: list) -> str:
+    """Fill an alert template listing the given budget categories."""
+    return ADVICE_TEMPLATES[name].format(
+        count=len(items),
+        suffix="y" if len(items) == 1 else "ies",
+        categories=", ".join([b["category"] for b in items]),
+    )
+
+
+def _alert_advice(ctx: dict) -> str:
+    """Advice for budget alert questions."""
+    budget_status = ctx["budget_status"]
+    if not budget_status:
+        return ADVICE_TEMPLATES["alert_no_budget"]
+    
+    exceeded = [b for b in budget_status if b.get("spent", 0) > b.get("limit", 0)]
+    if exceeded:
+        return _category_list_advice("alert_exceeded", exceeded)
+    
+    approaching = [b for b in budget_status if (b.get("spent", 0) / b.get("limit", 1) * 100) > 80]
+    if approaching:
+        return _category_list_advice("alert_approaching", approaching)
+    return ADVICE_TEMPLATES["alert_on_track"]
+
+
+_GENERAL_ADVICE = "Here are my top financial recommendations:\n\n" + "\n".join([
+    f"{i+1}. {point}"
+    for i, point in enumerate([
+        "Track every expense for at least a month to understand your spending patterns",
+        "Set category-wise budgets based on your income and financial goals",
+        "Review your spending weekly and adjust as needed",
+        "Automate savings transfers to build your emergency fund",
+        "Identify and cancel unused subscriptions",
+        "Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings",
+    ])
+])
+
+_DEFAULT_ADVICE = "I'm your AI Finance Advisor! I can help you with:\n\n• Budget planning and tracking\n• Spending analysis and insights\n• Savings strategies\n• Category-wise spending breakdowns\n• Budget alerts and warnings\n• Financial goal setting\n\nWhat would you like to know about your finances?"
+
+INTENT_HANDLERS: dict[str, Callable[[dict], str]] = {
+    "budget": _budget_advice,
+    "category": _category_advice,
+    "savings": _savings_advice,
+    "spending": _spending_advice,
+    "alert": _alert_advice,
+    "advice": lambda ctx: _GENERAL_ADVICE,
+}
+
+# Intents are answered in this order when a message matches several
+INTENT_PRIORITY = ("budget", "category", "savings", "spending", "alert", "advice")
 
 
 def generate_financial_advice(
@@ -139,114 +352,86 @@ def generate_financial_advice(
     category_totals: dict = None,
     budget_status: list = None,
     expenses_count: int = 0,
+    keywords: Optional[set[str]] = None,
+    category_breakdown: Optional[str] = None,
 ) -> str:
-    """Generate financial advice based on user message and financial data."""
-    if category_totals is None:
-        category_totals = {}
-    if budget_status is None:
-        budget_status = []
-    
-    # Budget-related questions
-    if any(word in user_message for word in ["budget", "save", "spending", "limit"]):
-        if total_budget > 0:
-            percentage_used = (total_spent_this_month / total_budget * 100) if total_budget > 0 else 0
-            remaining = total_budget - total_spent_this_month
-            
-            if percentage_used > 100:
-                return f"⚠️ You've exceeded your monthly budget by ${abs(remaining):.2f}. I recommend reviewing your spending in the highest categories and cutting back on discretionary expenses. Consider adjusting your budget for next month based on actual needs."
-            elif percentage_used > 80:
-                return f"💡 You've used {percentage_used:.1f}% of your monthly budget (${total_spent_this_month:.2f} of ${total_budget:.2f}). You have ${remaining:.2f} remaining. Be mindful of your spending to stay within budget."
-            else:
-                return f"✅ Great job! You're on track with your budget. You've spent ${total_spent_this_month:.2f} out of ${total_budget:.2f} ({(100-percentage_used):.1f}% remaining). Keep monitoring your spending to maintain this healthy pattern."
-        else:
-            return "I recommend setting up budgets for different categories. Based on the 50/30/20 rule: allocate 50% for needs, 30% for wants, and 20% for savings. You can create budgets in the Budgets section."
-    
-    # Category-specific questions
-    if any(word in user_message for word in ["category", "categories", "breakdown"]):
-        if category_totals:
-            top_category = max(category_totals.items(), key=lambda x: x[1])
-            return f"Your top spending category is {top_category[0]} with ${top_category[1]:.2f}. Here's your category breakdown: {', '.join([f'{k}: ${v:.2f}' for k, v in sorted(category_totals.items(), key=lambda x: x[1], reverse=True)[:5]])}. Consider setting specific budgets for each category to better control your spending."
-        else:
-            return "You haven't recorded many expenses yet. Start tracking your expenses to see category breakdowns and identify spending patterns."
-    
-    # Savings questions
-    if any(word in user_message for word in ["save", "saving", "savings", "invest"]):
-        if total_budget > 0 and total_spent_this_month > 0:
-            savings_potential = total_budget - total_spent_this_month
-            if savings_potential > 0:
-                return f"Based on your current spending, you could potentially save ${savings_potential:.2f} this month. I recommend: 1) Automate savings transfers, 2) Review and cancel unused subscriptions, 3) Cook at home more often, 4) Use cashback apps for purchases."
-            else:
-                return "You're currently over budget. To start saving: 1) Identify your highest spending categories, 2) Set realistic budgets, 3) Track every expense, 4) Look for areas to cut back. Small changes add up quickly!"
-        else:
-            return "To build savings: 1) Set up automatic transfers to a savings account, 2) Follow the 50/30/20 rule (50% needs, 30% wants, 20% savings), 3) Build an emergency fund of 3-6 months expenses, 4) Review and optimize your spending regularly."
+    """
+    Generate financial advice based on user message and financial data.
     
-    # Spending analysis
-    if any(word in user_message for word in ["spending", "expense", "expenses", "analysis"]):
-        if expenses_count > 0:
-            avg_expense = total_expenses / expenses_count if expenses_count > 0 else 0
-            return f"You've recorded {expenses_count} expenses totaling ${total_expenses:.2f} (average: ${avg_expense:.2f} per transaction). Your monthly spending is ${total_spent_this_month:.2f}. Review your spending patterns in the Analytics section for detailed insights."
-        else:
-            return "Start tracking your expenses to get detailed spending analysis. Record your transactions regularly to see patterns, identify trends, and make informed financial decisions."
+    ``category_totals`` is expected largest first, as produced by
+    get_financial_context; ``category_breakdown`` is its preformatted
+    top-five string. Both are derived here when not supplied that way.
+    """
+    if keywords is None:
+        keywords = match_keywords(user_message)
+    intents = keyword_intents(keywords)
     
-    # Budget alerts
-    if any(word in user_message for word in ["alert", "warning", "exceed", "over"]):
-        if budget_status:
-            exceeded = [b for b in budget_status if b.get("spent", 0) > b.get("limit", 0)]
-            if exceeded:
-                return f"⚠️ You've exceeded your budget in {len(exceeded)} categor{'y' if len(exceeded) == 1 else 'ies'}: {', '.join([b['category'] for b in exceeded])}. Review these categories and adjust your spending or budget limits."
-            else:
-                approaching = [b for b in budget_status if (b.get("spent", 0) / b.get("limit", 1) * 100) > 80]
-                if approaching:
-                    return f"💡 You're approaching your budget limit in {len(approaching)} categor{'y' if len(approaching) == 1 else 'ies'}: {', '.join([b['category'] for b in approaching])}. Monitor your spending closely."
-                else:
-                    return "✅ All your budgets are on track! Keep monitoring your spending to maintain this healthy financial pattern."
-        else:
-            return "Set up budgets in the Budgets section to receive alerts when you're approaching or exceeding your spending limits."
+    intent = next((name for name in INTENT_PRIORITY if name in intents), None)
+    if intent is None:
+        return _DEFAULT_ADVICE
     
-    # General advice
-    if any(word in user_message for word in ["advice", "recommend", "help", "tip", "tips"]):
-        advice_points = [
-            "Track every expense for at least a month to understand your spending patterns",
-            "Set category-wise budgets based on your income and financial goals",
-            "Review your spending weekly and adjust as needed",
-            "Automate savings transfers to build your emergency fund",
-            "Identify and cancel unused subscriptions",
-            "Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings",
-        ]
-        return f"Here are my top financial recommendations:\n\n" + "\n".join([f"{i+1}. {point}" for i, point in enumerate(advice_points)])
+    category_totals = category_totals or {}
+    if category_breakdown is None:
+        category_totals = dict(sorted(category_totals.items(), key=lambda x: x[1], reverse=True))
+        category_breakdown = format_category_breakdown(category_totals)
     
-    # Default response
-    return "I'm your AI Finance Advisor! I can help you with:\n\n• Budget planning and tracking\n• Spending analysis and insights\n• Savings strategies\n• Category-wise spending breakdowns\n• Budget alerts and warnings\n• Financial goal setting\n\nWhat would you like to know about your finances?"
+    ctx = {
+        "total_expenses": total_expenses,
+        "total_budget": total_budget,
+        "total_spent_this_month": total_spent_this_month,
+        "category_totals": category_totals,
+        "category_breakdown": category_breakdown,
+        "budget_status": budget_status or [],
+        "expenses_count": expenses_count,
+    }
+    return INTENT_HANDLERS[intent](ctx)
+
+
+_SAVINGS_SUGGESTIONS = (
+    "What are my top spending categories?",
+    "How much can I save this month?",
+)
+
+# Follow-up questions keyed by the message keyword that selects them
+SUGGESTIONS_BY_KEYWORD: dict[str, tuple[str, ...]] = {
+    "budget": (
+        "How can I reduce my spending?",
+        "What's my current budget status?",
+    ),
+    "save": _SAVINGS_SUGGESTIONS,
+    "saving": _SAVINGS_SUGGESTIONS,
+    "savings": _SAVINGS_SUGGESTIONS,
+}
+
+# The first keyword present in the message wins
+_SUGGESTION_PRIORITY = ("budget", "save", "saving", "savings")
 
+_DEFAULT_SUGGESTIONS = (
+    "What's my spending breakdown by category?",
+    "How can I improve my budget?",
+    "What are my spending trends?",
+)
 
-def generate_suggestions(user_message: str, budget_status: list) -> list[str]:
+
+def generate_suggestions(
+    user_message: str,
+    budget_status: list,
+    keywords: Optional[set[str]] = None,
+) -> list[str]:
     """Generate suggested follow-up questions."""
-    suggestions = []
-    
-    if "budget" in user_message.lower():
-        suggestions.extend([
-            "How can I reduce my spending?",
-            "What's my current budget status?",
-        ])
-    elif "save" in user_message.lower() or "saving" in user_message.lower():
-        suggestions.extend([
-            "What are my top spending categories?",
-            "How much can I save this month?",
-        ])
-    else:
-        suggestions.extend([
-            "What's my spending breakdown by category?",
-            "How can I improve my budget?",
-            "What are my spending trends?",
-        ])
+    if keywords is None:
+        keywords = match_keywords(user_message.lower())
     
-    return suggestions[:3]  # Return top 3 suggestions
+    for word in _SUGGESTION_PRIORITY:
+        if word in keywords:
+            return list(SUGGESTIONS_BY_KEYWORD[word][:3])
+    return list(_DEFAULT_SUGGESTIONS)
 
 
 @router.get("/insights")
 async def get_ai_insights(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Get AI-generated financial insights.
@@ -258,45 +443,44 @@ async def get_ai_insights(
     Returns:
         AI-generated insights
     """
-    try:
-        # Get user's financial data
-        user_expenses = expense.get_by_user(db, user_id=current_user.id, skip=0, limit=100)
-        user_budgets = budget.get_by_user(db, user_id=current_user.id, skip=0, limit=50)
-        
-        # Calculate insights
-        total_expenses = sum(e.amount for e in user_expenses)
-        expenses_count = len(user_expenses)
-        
-        # Category insights
-        category_totals = {}
-        for e in user_expenses:
-            cat = e.category.value if hasattr(e.category, 'value') else str(e.category)
-            category_totals[cat] = category_totals.get(cat, 0) + e.amount
-        
-        insights = []
-        
-        if category_totals:
-            top_category = max(category_totals.items(), key=lambda x: x[1])
-            insights.append({
-                "type": "top_category",
-                "title": "Top Spending Category",
-                "message": f"Your highest spending is in {top_category[0]} with ${top_category[1]:.2f}",
-            })
-        
-        if expenses_count > 0:
-            avg_expense = total_expenses / expenses_count
-            insights.append({
-                "type": "average_spending",
-                "title": "Average Transaction",
-                "message": f"Your average transaction amount is ${avg_expense:.2f}",
-            })
-        
-        return {"insights": insights}
-        
-    except Exception as e:
-        logger.error(f"Error generating AI insights: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to generate insights"
+    # Top category plus overall totals in one row: the window sums run
+    # over every category group before LIMIT 1 keeps the largest
+    category_total = func.sum(ExpenseMonthlySummary.total_amount)
+    top = (
+        await db.execute(
+            select(
+                ExpenseMonthlySummary.category,
+                category_total.label("category_total"),
+                func.sum(category_total).over().label("total_expenses"),
+                func.sum(func.sum(ExpenseMonthlySummary.txn_count)).over().label("expenses_count"),
+            )
+            .where(ExpenseMonthlySummary.user_id == current_user.id)
+            .group_by(ExpenseMonthlySummary.category)
+            .order_by(category_total.desc())
+            .limit(1)
         )
+    ).first()
+    
+    insights = []
+    if top is None:
+        return {"insights": insights}
+    
+    top_category = top.category.value
+    insights.append({
+        "type": "top_category",
+        "title": "Top Spending Category",
+        "message": f"Your highest spending is in {top_category} with ${float(top.category_total):.2f}",
+    })
+    
+    total_expenses = float(top.total_expenses)
+    expenses_count = int(top.expenses_count)
+    if expenses_count > 0:
+        avg_expense = total_expenses / expenses_count
+        insights.append({
+            "type": "average_spending",
+            "title": "Average Transaction",
+            "message": f"Your average transaction amount is ${avg_expense:.2f}",
+        })
+    
+    return {"insights": insights}
 
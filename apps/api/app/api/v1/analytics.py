@@ -3,28 +3,62 @@ Analytics API routes.
 """
 import logging
 from typing import Any, Optional
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract, case
+from datetime import date, datetime, timedelta, time
+from fastapi import APIRouter, Depends, Request, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, and_, case, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_json_response, encode_json, response_cache
+from app.core.config import get_settings
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.models.expense import Expense
 from app.models.budget import Budget
-from app.models.expense import CategoryEnum
+from app.models.expense_summary import ExpenseMonthlySummary
+from app.schemas.analytics import (
+    AnalyticsOverviewResponse,
+    TrendsResponse,
+    CategoriesResponse,
+    MonthlyResponse,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
+settings = get_settings()
 
+# Analytics tolerate being a little stale, so clients may reuse them
+# without revalidating; list endpoints always revalidate instead
+_CLIENT_MAX_AGE = settings.RESPONSE_CACHE_MAX_AGE
 
-@router.get("/overview")
+
+def _datetime_range(start_date, end_date) -> tuple[datetime, datetime]:
+    """
+    Turn an inclusive date range into half-open datetime bounds.
+    
+    Comparing the raw ``Expense.date`` column against these keeps the
+    (user_id, date) index usable, unlike wrapping it in ``DATE()``.
+    
+    Args:
+        start_date: First day included
+        end_date: Last day included
+        
+    Returns:
+        Tuple of (start inclusive, end exclusive) datetimes
+    """
+    return (
+        datetime.combine(start_date, time.min),
+        datetime.combine(end_date + timedelta(days=1), time.min),
+    )
+
+
+@router.get("/overview", response_model=AnalyticsOverviewResponse, response_class=ORJSONResponse)
 async def get_analytics_overview(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
-    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_async_db),
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
 ) -> Any:
     """
     Get analytics overview with summary statistics.
@@ -38,85 +72,83 @@ async def get_analytics_overview(
     Returns:
         Analytics overview data
     """
-    try:
-        # Default to last 30 days if no dates provided
-        if not end_date:
-            end_date = datetime.utcnow().date()
-        else:
-            end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
-        else:
-            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-        
-        # Build query
-        query = db.query(Expense).filter(Expense.user_id == current_user.id)
-        query = query.filter(
-            func.date(Expense.date) >= start_date,
-            func.date(Expense.date) <= end_date
-        )
-        
-        # Total expenses
-        total_expenses = query.with_entities(func.sum(Expense.amount)).scalar() or 0.0
-        
-        # Expense count
-        expense_count = query.count()
-        
-        # Average expense
-        avg_expense = total_expenses / expense_count if expense_count > 0 else 0.0
-        
-        # Get current month budgets
-        current_month = datetime.utcnow().strftime("%Y-%m")
-        budgets = db.query(Budget).filter(
+    # Default to last 30 days if no dates provided
+    if not end_date:
+        end_date = datetime.utcnow().date()
+    if not start_date:
+        start_date = end_date - timedelta(days=30)
+    
+    range_start, range_end = _datetime_range(start_date, end_date)
+    current_month = datetime.utcnow().strftime("%Y-%m")
+    current_month_start = datetime.combine(datetime.utcnow().replace(day=1).date(), time.min)
+    
+    # Range totals and current-month spend via conditional aggregation,
+    # with the current month's budget total as a scalar subquery,
+    # all in one round-trip
+    in_range = and_(Expense.date >= range_start, Expense.date < range_end)
+    budget_total = (
+        select(func.coalesce(func.sum(Budget.limit_amount), 0.0))
+        .where(
             Budget.user_id == current_user.id,
             Budget.month == current_month
-        ).all()
-        
-        total_budget = sum(budget.limit_amount for budget in budgets)
-        
-        # Get expenses for current month
-        current_month_start = datetime.utcnow().replace(day=1).date()
-        current_month_expenses = db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == current_user.id,
-            func.date(Expense.date) >= current_month_start
-        ).scalar() or 0.0
-        
-        return {
-            "period": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            },
-            "expenses": {
-                "total": float(total_expenses),
-                "count": expense_count,
-                "average": float(avg_expense),
-            },
-            "budget": {
-                "total": float(total_budget),
-                "spent": float(current_month_expenses),
-                "remaining": float(total_budget - current_month_expenses),
-                "percentage_used": float((current_month_expenses / total_budget * 100) if total_budget > 0 else 0),
-            },
-        }
-    except Exception as e:
-        logger.error(f"Error fetching analytics overview: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch analytics overview"
         )
+        .scalar_subquery()
+    )
+    total_expenses, expense_count, current_month_expenses, total_budget = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(case((in_range, Expense.amount), else_=0.0)), 0.0),
+                func.count(case((in_range, 1))),
+                func.coalesce(func.sum(case((Expense.date >= current_month_start, Expense.amount), else_=0.0)), 0.0),
+                budget_total,
+            )
+            .where(
+                Expense.user_id == current_user.id,
+                Expense.date >= min(range_start, current_month_start)
+            )
+        )
+    ).one()
+    
+    # Average expense
+    avg_expense = total_expenses / expense_count if expense_count > 0 else 0.0
+    
+    return {
+        "period": {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        },
+        "expenses": {
+            "total": float(total_expenses),
+            "count": expense_count,
+            "average": float(avg_expense),
+        },
+        "budget": {
+            "total": float(total_budget),
+            "spent": float(current_month_expenses),
+            "remaining": float(total_budget - current_month_expenses),
+            "percentage_used": float((current_month_expenses / total_budget * 100) if total_budget > 0 else 0),
+        },
+    }
 
 
-@router.get("/trends")
+@router.get("/trends", response_model=TrendsResponse, response_class=ORJSONResponse)
 async def get_analytics_trends(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     months: int = Query(6, ge=1, le=12, description="Number of months to analyze"),
 ) -> Any:
     """
     Get spending trends over time.
     
+    Covers whole calendar months, from the month containing the date
+    ``months * 30`` days ago through the current month. The first month is
+    counted in full, including days before that date, since totals come
+    from the monthly summary table. Results are cached per user until their
+    expenses change.
+    
     Args:
+        request: Incoming request
         current_user: Currently authenticated user
         db: Database session
         months: Number of months to analyze
@@ -124,59 +156,56 @@ async def get_analytics_trends(
     Returns:
         Spending trends data
     """
-    try:
-        # Calculate date range
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=months * 30)
-        
-        # Query expenses grouped by month (using extract for cross-database compatibility)
-        trends = (
-            db.query(
-                extract('year', Expense.date).label('year'),
-                extract('month', Expense.date).label('month'),
-                func.sum(Expense.amount).label('total'),
-                func.count(Expense.id).label('count'),
-            )
-            .filter(
-                Expense.user_id == current_user.id,
-                Expense.date >= start_date
-            )
-            .group_by(
-                extract('year', Expense.date),
-                extract('month', Expense.date)
+    # Calculate date range
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=months * 30)
+    
+    cache_key = f"analytics:trends:{months}:{start_date:%Y-%m}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached, max_age=_CLIENT_MAX_AGE)
+    
+    # Read whole-month buckets from the summary table, oldest first
+    period = ExpenseMonthlySummary.year * 100 + ExpenseMonthlySummary.month
+    trends = (
+        await db.execute(
+            select(
+                ExpenseMonthlySummary.year,
+                ExpenseMonthlySummary.month,
+                func.sum(ExpenseMonthlySummary.total_amount).label('total'),
+                func.sum(ExpenseMonthlySummary.txn_count).label('count'),
             )
-            .order_by(
-                extract('year', Expense.date),
-                extract('month', Expense.date)
+            .where(
+                ExpenseMonthlySummary.user_id == current_user.id,
+                period >= start_date.year * 100 + start_date.month
             )
-            .all()
-        )
-        
-        return {
-            "period_months": months,
-            "trends": [
-                {
-                    "month": f"{int(trend.year)}-{int(trend.month):02d}",
-                    "total": float(trend.total),
-                    "count": trend.count,
-                }
-                for trend in trends
-            ],
-        }
-    except Exception as e:
-        logger.error(f"Error fetching analytics trends: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch analytics trends"
+            .group_by(ExpenseMonthlySummary.year, ExpenseMonthlySummary.month)
+            .order_by(ExpenseMonthlySummary.year, ExpenseMonthlySummary.month)
         )
+    ).all()
+    
+    body = encode_json({
+        "period_months": months,
+        "trends": [
+            {
+                "month": f"{int(trend.year)}-{int(trend.month):02d}",
+                "total": float(trend.total),
+                "count": int(trend.count),
+            }
+            for trend in trends
+        ],
+    })
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body, max_age=_CLIENT_MAX_AGE)
 
 
-@router.get("/categories")
+@router.get("/categories", response_model=CategoriesResponse, response_class=ORJSONResponse)
 async def get_analytics_categories(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
-    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_async_db),
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
 ) -> Any:
     """
     Get spending breakdown by category.
@@ -190,71 +219,65 @@ async def get_analytics_categories(
     Returns:
         Category spending breakdown
     """
-    try:
-        # Default to last 30 days if no dates provided
-        if not end_date:
-            end_date = datetime.utcnow().date()
-        else:
-            end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
-        else:
-            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-        
-        # Query expenses grouped by category
-        category_stats = (
-            db.query(
+    # Default to last 30 days if no dates provided
+    if not end_date:
+        end_date = datetime.utcnow().date()
+    if not start_date:
+        start_date = end_date - timedelta(days=30)
+    
+    # Query expenses grouped by category
+    range_start, range_end = _datetime_range(start_date, end_date)
+    category_stats = (
+        await db.execute(
+            select(
                 Expense.category,
                 func.sum(Expense.amount).label('total'),
-                func.count(Expense.id).label('count'),
+                func.count().label('count'),
             )
-            .filter(
+            .where(
                 Expense.user_id == current_user.id,
-                func.date(Expense.date) >= start_date,
-                func.date(Expense.date) <= end_date
+                Expense.date >= range_start,
+                Expense.date < range_end
             )
             .group_by(Expense.category)
             .order_by(func.sum(Expense.amount).desc())
-            .all()
-        )
-        
-        total = sum(stat.total for stat in category_stats)
-        
-        return {
-            "period": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            },
-            "total": float(total),
-            "categories": [
-                {
-                    "category": stat.category.value if isinstance(stat.category, CategoryEnum) else stat.category,
-                    "total": float(stat.total),
-                    "count": stat.count,
-                    "percentage": float((stat.total / total * 100) if total > 0 else 0),
-                }
-                for stat in category_stats
-            ],
-        }
-    except Exception as e:
-        logger.error(f"Error fetching category analytics: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch category analytics"
         )
+    ).all()
+    
+    total = sum(stat.total for stat in category_stats)
+    
+    return {
+        "period": {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        },
+        "total": float(total),
+        "categories": [
+            {
+                "category": stat.category.value,
+                "total": float(stat.total),
+                "count": stat.count,
+                "percentage": float((stat.total / total * 100) if total > 0 else 0),
+            }
+            for stat in category_stats
+        ],
+    }
 
 
-@router.get("/monthly")
+@router.get("/monthly", response_model=MonthlyResponse, response_class=ORJSONResponse)
 async def get_analytics_monthly(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     year: Optional[int] = Query(None, description="Year to analyze"),
 ) -> Any:
     """
     Get monthly spending breakdown for a year.
     
+    Results are cached per user until their expenses change.
+    
     Args:
+        request: Incoming request
         current_user: Currently authenticated user
         db: Database session
         year: Year to analyze (defaults to current year)
@@ -262,41 +285,43 @@ async def get_analytics_monthly(
     Returns:
         Monthly spending breakdown
     """
-    try:
-        if not year:
-            year = datetime.utcnow().year
-        
-        # Query expenses grouped by month
-        monthly_stats = (
-            db.query(
-                extract('month', Expense.date).label('month'),
-                func.sum(Expense.amount).label('total'),
-                func.count(Expense.id).label('count'),
+    if not year:
+        year = datetime.utcnow().year
+    
+    cache_key = f"analytics:monthly:{year}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached, max_age=_CLIENT_MAX_AGE)
+    
+    # Query the pre-aggregated monthly summary for the year
+    monthly_stats = (
+        await db.execute(
+            select(
+                ExpenseMonthlySummary.month,
+                func.sum(ExpenseMonthlySummary.total_amount).label('total'),
+                func.sum(ExpenseMonthlySummary.txn_count).label('count'),
             )
-            .filter(
-                Expense.user_id == current_user.id,
-                extract('year', Expense.date) == year
+            .where(
+                ExpenseMonthlySummary.user_id == current_user.id,
+                ExpenseMonthlySummary.year == year
             )
-            .group_by(extract('month', Expense.date))
-            .order_by(extract('month', Expense.date))
-            .all()
-        )
-        
-        return {
-            "year": year,
-            "months": [
-                {
-                    "month": int(stat.month),
-                    "total": float(stat.total),
-                    "count": stat.count,
-                }
-                for stat in monthly_stats
-            ],
-        }
-    except Exception as e:
-        logger.error(f"Error fetching monthly analytics: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch monthly analytics"
+            .group_by(ExpenseMonthlySummary.month)
+            .order_by(ExpenseMonthlySummary.month)
         )
+    ).all()
+    
+    body = encode_json({
+        "year": year,
+        "months": [
+            {
+                "month": int(stat.month),
+                "total": float(stat.total),
+                "count": int(stat.count),
+            }
+            for stat in monthly_stats
+        ],
+    })
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body, max_age=_CLIENT_MAX_AGE)
 
@@ -7,12 +7,12 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.security import create_access_token, create_refresh_token, get_current_user
 from app.crud import user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.auth import TokenResponse, LoginRequest, RefreshTokenRequest
 from app.schemas.user import UserCreate, UserResponse
@@ -21,11 +21,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
+# Access token lifetime, fixed for the process
+_ACCESS_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Register a new user.
@@ -40,47 +43,39 @@ async def register(
     Raises:
         HTTPException: If email is already registered
     """
-    try:
-        # Check if user already exists
-        existing_user = user.get_by_email(db, email=user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Create new user
-        db_user = user.create(db, obj_in=user_data)
-        logger.info(f"New user registered: {db_user.email}")
-        
-        # Generate tokens
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": str(db_user.id)},
-            expires_delta=access_token_expires
-        )
-        refresh_token = create_refresh_token(data={"sub": str(db_user.id)})
-        
-        return TokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer"
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Registration error: {e}")
+    # Check if user already exists
+    existing_user = await user.get_by_email(db, email=user_data.email)
+    if existing_user:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Registration failed"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
         )
+    
+    # Create new user
+    db_user = await user.create(db, obj_in=user_data)
+    logger.info(f"New user registered: {db_user.email}")
+    
+    # Return the connection to the pool before signing tokens
+    await db.close()
+    
+    # Generate tokens
+    access_token = create_access_token(
+        data={"sub": str(db_user.id)},
+        expires_delta=_ACCESS_EXPIRES
+    )
+    refresh_token = create_refresh_token(data={"sub": str(db_user.id)})
+    
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer"
+    )
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Login with email and password.
@@ -95,54 +90,46 @@ async def login(
     Raises:
         HTTPException: If authentication fails
     """
-    try:
-        # Authenticate user
-        db_user = user.authenticate(
-            db, email=login_data.email, password=login_data.password
-        )
-        
-        if not db_user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
-        
-        if not user.is_active(db_user):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Inactive user"
-            )
-        
-        # Generate tokens
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": str(db_user.id)},
-            expires_delta=access_token_expires
-        )
-        refresh_token = create_refresh_token(data={"sub": str(db_user.id)})
-        
-        logger.info(f"User logged in: {db_user.email}")
-        
-        return TokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer"
+    # Authenticate user
+    db_user = await user.authenticate(
+        db, email=login_data.email, password=login_data.password
+    )
+    
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Login error: {e}")
+    
+    if not user.is_active(db_user):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Login failed"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
         )
+    
+    # Return the connection to the pool before signing tokens
+    await db.close()
+    
+    # Generate tokens
+    access_token = create_access_token(
+        data={"sub": str(db_user.id)},
+        expires_delta=_ACCESS_EXPIRES
+    )
+    refresh_token = create_refresh_token(data={"sub": str(db_user.id)})
+    
+    logger.info(f"User logged in: {db_user.email}")
+    
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer"
+    )
 
 
 @router.post("/login/form", response_model=TokenResponse)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests.
@@ -154,7 +141,7 @@ async def login_for_access_token(
     Returns:
         JWT tokens for authenticated user
     """
-    db_user = user.authenticate(
+    db_user = await user.authenticate(
         db, email=form_data.username, password=form_data.password
     )
     
@@ -171,9 +158,11 @@ async def login_for_access_token(
             detail="Inactive user"
         )
     
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Return the connection to the pool before signing tokens
+    await db.close()
+    
     access_token = create_access_token(
-        data={"sub": str(db_user.id)}, expires_delta=access_token_expires
+        data={"sub": str(db_user.id)}, expires_delta=_ACCESS_EXPIRES
     )
     
     return TokenResponse(access_token=access_token, token_type="bearer")
@@ -198,7 +187,7 @@ async def get_current_user_info(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Refresh access token using refresh token.
@@ -214,7 +203,7 @@ async def refresh_token(
         HTTPException: If refresh token is invalid
     """
     try:
-        from app.core.security import verify_token
+        from app.core.security import get_user_by_id, verify_token
         
         # Verify refresh token
         payload = verify_token(refresh_data.refresh_token)
@@ -228,7 +217,7 @@ async def refresh_token(
             )
         
         # Get user
-        db_user = user.get(db, id=int(user_id))
+        db_user = await get_user_by_id(db, int(user_id))
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -241,11 +230,13 @@ async def refresh_token(
                 detail="Inactive user"
             )
         
+        # Return the connection to the pool before signing tokens
+        await db.close()
+        
         # Generate new tokens
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"sub": str(db_user.id)},
-            expires_delta=access_token_expires
+            expires_delta=_ACCESS_EXPIRES
         )
         new_refresh_token = create_refresh_token(data={"sub": str(db_user.id)})
         
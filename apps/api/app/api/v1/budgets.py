@@ -2,34 +2,83 @@
 Budget management API routes.
 """
 import logging
-from typing import Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_json_response, encode_json, response_cache
 from app.core.security import get_current_active_user
-from app.crud import budget
-from app.db.session import get_db
+from app.crud import budget, expense
+from app.db.session import get_async_db
+from app.models.budget import Budget
+from app.models.expense import CategoryEnum
 from app.models.user import User
-from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
+from app.schemas.budget import MONTH_PATTERN, BudgetCreate, BudgetUpdate, BudgetResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Serializes whole list responses in one pass; built once at import time
+_BUDGET_LIST_ADAPTER = TypeAdapter(List[BudgetResponse])
+
+# Shared query parameter declarations, built once at import time
+_SKIP_QUERY = Query(0, ge=0, description="Number of records to skip")
+_LIMIT_QUERY = Query(100, ge=1, le=1000, description="Number of records to return")
+_MONTH_QUERY = Query(None, pattern=MONTH_PATTERN, description="Filter by month (YYYY-MM)")
+
+
+def build_budget_status(
+    budgets: List[Budget],
+    spent_by_category: Dict[CategoryEnum, float]
+) -> List[Dict[str, Any]]:
+    """
+    Combine budgets with their month's spending into status rows.
+    
+    Args:
+        budgets: Budgets of a single month
+        spent_by_category: Amount spent per category in that month
+        
+    Returns:
+        List of budget statuses with spent amounts
+    """
+    # The category column always loads CategoryEnum members, so .value is safe
+    status_list = []
+    for budget_item in budgets:
+        spent = float(spent_by_category.get(budget_item.category) or 0.0)
+        limit = float(budget_item.limit_amount)
+        
+        status_list.append({
+            "budget_id": budget_item.id,
+            "category": budget_item.category.value,
+            "month": budget_item.month,
+            "limit": limit,
+            "spent": spent,
+            "remaining": limit - spent,
+            "percentage_used": (spent / limit * 100) if limit > 0 else 0.0,
+        })
+    return status_list
+
 
 @router.get("", response_model=List[BudgetResponse])
 async def get_budgets(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"),
+    request: Request,
+    skip: int = _SKIP_QUERY,
+    limit: int = _LIMIT_QUERY,
+    month: Optional[str] = _MONTH_QUERY,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get user's budgets with optional filtering.
     
+    Results are cached per user until their budgets change.
+    
     Args:
+        request: Incoming request
         skip: Number of records to skip
         limit: Number of records to return
         month: Optional month filter (YYYY-MM format)
@@ -39,36 +88,38 @@ async def get_budgets(
     Returns:
         List of user's budgets
     """
-    try:
-        if month:
-            budgets = budget.get_by_user_and_month(
-                db, 
-                user_id=current_user.id, 
-                month=month
-            )
-        else:
-            budgets = budget.get_by_user(
-                db, 
-                user_id=current_user.id, 
-                skip=skip, 
-                limit=limit
-            )
-        
-        return budgets
-        
-    except Exception as e:
-        logger.error(f"Error fetching budgets: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch budgets"
+    cache_key = f"budgets:list:{month or ''}:{skip}:{limit}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+    
+    if month:
+        budgets = await budget.get_by_user_and_month(
+            db, 
+            user_id=current_user.id, 
+            month=month
+        )
+    else:
+        budgets = await budget.get_by_user(
+            db, 
+            user_id=current_user.id, 
+            skip=skip, 
+            limit=limit
         )
+    
+    body = _BUDGET_LIST_ADAPTER.dump_json(
+        _BUDGET_LIST_ADAPTER.validate_python(budgets, from_attributes=True)
+    )
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body)
 
 
 @router.post("/", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
 async def create_budget(
     budget_data: BudgetCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Create a new budget.
@@ -84,50 +135,36 @@ async def create_budget(
     Raises:
         HTTPException: If budget already exists for category and month
     """
-    try:
-        # Check if budget already exists for this category and month
-        existing_budget = budget.get_by_user_category_and_month(
-            db,
-            user_id=current_user.id,
-            category=budget_data.category.value,
-            month=budget_data.month
-        )
-        
-        if existing_budget:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Budget already exists for this category and month"
-            )
-        
-        db_budget = budget.create_for_user(
-            db, 
-            obj_in=budget_data, 
-            user_id=current_user.id
-        )
-        
-        logger.info(f"Budget created: {db_budget.id} for user {current_user.id}")
-        return db_budget
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error creating budget: {e}")
+    db_budget = await budget.create_for_user(
+        db, 
+        obj_in=budget_data, 
+        user_id=current_user.id
+    )
+    
+    if db_budget is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create budget"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Budget already exists for this category and month"
         )
+    
+    logger.info(f"Budget created: {db_budget.id} for user {current_user.id}")
+    return db_budget
 
 
 @router.get("/status")
 async def get_budget_status(
-    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"),
+    request: Request,
+    month: Optional[str] = _MONTH_QUERY,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get budget status (spent vs allocated) for all budgets.
     
+    Results are cached per user until their budgets or expenses change.
+    
     Args:
+        request: Incoming request
         month: Optional month filter (YYYY-MM format), defaults to current month
         current_user: Currently authenticated user
         db: Database session
@@ -135,69 +172,47 @@ async def get_budget_status(
     Returns:
         List of budget statuses with spent amounts
     """
-    try:
-        from app.models.expense import Expense
-        from sqlalchemy import func, extract
-        
-        # Default to current month if not specified
-        if not month:
-            month = datetime.utcnow().strftime("%Y-%m")
-        
-        # Get all budgets for the user and month
-        budgets = budget.get_by_user_and_month(
+    # Default to current month if not specified
+    if not month:
+        month = datetime.utcnow().strftime("%Y-%m")
+    
+    cache_key = f"budgets:status:{month}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+    
+    # Get all budgets for the user and month
+    budgets = await budget.get_by_user_and_month(
+        db,
+        user_id=current_user.id,
+        month=month
+    )
+    
+    # Spent amounts for every category of the month in one query,
+    # read from the pre-aggregated monthly summary
+    spent_by_category = {}
+    if budgets:
+        year, month_num = map(int, month.split('-'))
+        spent_by_category = await expense.get_spending_by_category(
             db,
             user_id=current_user.id,
-            month=month
-        )
-        
-        # Calculate spent amounts for each budget
-        status_list = []
-        for budget_item in budgets:
-            # Get start and end of month
-            year, month_num = map(int, month.split('-'))
-            month_start = datetime(year, month_num, 1)
-            if month_num == 12:
-                month_end = datetime(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                month_end = datetime(year, month_num + 1, 1) - timedelta(days=1)
-            
-            # Calculate spent amount for this category in this month
-            spent = (
-                db.query(func.sum(Expense.amount))
-                .filter(
-                    Expense.user_id == current_user.id,
-                    Expense.category == budget_item.category,
-                    func.date(Expense.date) >= month_start.date(),
-                    func.date(Expense.date) <= month_end.date()
-                )
-                .scalar() or 0.0
-            )
-            
-            status_list.append({
-                "budget_id": budget_item.id,
-                "category": budget_item.category.value if hasattr(budget_item.category, 'value') else str(budget_item.category),
-                "month": budget_item.month,
-                "limit": float(budget_item.limit_amount),
-                "spent": float(spent),
-                "remaining": float(budget_item.limit_amount - spent),
-                "percentage_used": float((spent / budget_item.limit_amount * 100) if budget_item.limit_amount > 0 else 0),
-            })
-        
-        return status_list
-        
-    except Exception as e:
-        logger.error(f"Error fetching budget status: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch budget status"
+            year=year,
+            month=month_num
         )
+    
+    status_list = build_budget_status(budgets, spent_by_category)
+    
+    body = encode_json(status_list)
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body)
 
 
 @router.get("/{budget_id}", response_model=BudgetResponse)
 async def get_budget(
     budget_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get a specific budget by ID.
@@ -211,9 +226,9 @@ async def get_budget(
         Budget data
         
     Raises:
-        HTTPException: If budget not found or access denied
+        HTTPException: If budget not found for the user
     """
-    db_budget = budget.get(db, id=budget_id)
+    db_budget = await budget.get_for_user(db, id=budget_id, user_id=current_user.id)
     
     if not db_budget:
         raise HTTPException(
@@ -221,12 +236,6 @@ async def get_budget(
             detail="Budget not found"
         )
     
-    if db_budget.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
     return db_budget
 
 
@@ -235,7 +244,7 @@ async def update_budget(
     budget_id: int,
     budget_update: BudgetUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Update an existing budget.
@@ -250,9 +259,10 @@ async def update_budget(
         Updated budget data
         
     Raises:
-        HTTPException: If budget not found or access denied
+        HTTPException: If budget not found for the user, or another budget
+            already covers the new category and month
     """
-    db_budget = budget.get(db, id=budget_id)
+    db_budget = await budget.get_for_user(db, id=budget_id, user_id=current_user.id)
     
     if not db_budget:
         raise HTTPException(
@@ -260,53 +270,30 @@ async def update_budget(
             detail="Budget not found"
         )
     
-    if db_budget.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
-    # Check for conflicts if category or month is being changed
-    if budget_update.category or budget_update.month:
-        new_category = budget_update.category.value if budget_update.category else db_budget.category
-        new_month = budget_update.month if budget_update.month else db_budget.month
-        
-        existing_budget = budget.get_by_user_category_and_month(
-            db,
-            user_id=current_user.id,
-            category=new_category,
-            month=new_month
-        )
-        
-        if existing_budget and existing_budget.id != budget_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Budget already exists for this category and month"
-            )
-    
+    # A category or month change that collides with another budget is
+    # rejected by the unique (user_id, category, month) constraint
     try:
-        updated_budget = budget.update(
+        updated_budget = await budget.update(
             db, 
             db_obj=db_budget, 
             obj_in=budget_update
         )
-        
-        logger.info(f"Budget updated: {budget_id} by user {current_user.id}")
-        return updated_budget
-        
-    except Exception as e:
-        logger.error(f"Error updating budget: {e}")
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update budget"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Budget already exists for this category and month"
         )
+    
+    logger.info(f"Budget updated: {budget_id} by user {current_user.id}")
+    return updated_budget
 
 
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_budget(
     budget_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> None:
     """
     Delete a budget.
@@ -320,29 +307,14 @@ async def delete_budget(
         None (204 No Content)
         
     Raises:
-        HTTPException: If budget not found or access denied
+        HTTPException: If budget not found for the user
     """
-    db_budget = budget.get(db, id=budget_id)
+    deleted = await budget.remove_for_user(db, id=budget_id, user_id=current_user.id)
     
-    if not db_budget:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Budget not found"
         )
     
-    if db_budget.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
-    try:
-        budget.remove(db, id=budget_id)
-        logger.info(f"Budget deleted: {budget_id} by user {current_user.id}")
-        
-    except Exception as e:
-        logger.error(f"Error deleting budget: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete budget"
-        )
\ No newline at end of file
+    logger.info(f"Budget deleted: {budget_id} by user {current_user.id}")
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Dashboard API routes.
+"""
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Depends, Path, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.budgets import build_budget_status
+from app.core.cache import cached_json_response, encode_json, response_cache
+from app.core.security import get_current_active_user
+from app.crud import budget, expense
+from app.db.session import get_async_db
+from app.models.user import User
+from app.schemas.budget import MONTH_PATTERN
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/{month}")
+async def get_dashboard(
+    request: Request,
+    month: str = Path(..., pattern=MONTH_PATTERN, description="Month (YYYY-MM)"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> Any:
+    """
+    Get a month's spending totals and budget status in one response.
+    
+    Combines what /expenses/stats/monthly and /budgets/status return, with
+    every total read from one monthly summary query. Results are cached per
+    user until their budgets or expenses change.
+    
+    Args:
+        request: Incoming request
+        month: Month to summarize (YYYY-MM format)
+        current_user: Currently authenticated user
+        db: Database session
+        
+    Returns:
+        Month total, spending per category and budget statuses
+    """
+    cache_key = f"dashboard:{month}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+    
+    year, month_num = map(int, month.split('-'))
+    spent_by_category = await expense.get_spending_by_category(
+        db,
+        user_id=current_user.id,
+        year=year,
+        month=month_num
+    )
+    budgets = await budget.get_by_user_and_month(
+        db,
+        user_id=current_user.id,
+        month=month
+    )
+    
+    body = encode_json({
+        "month": month,
+        "total_amount": float(sum(spent_by_category.values())),
+        "by_category": {
+            category.value: float(total)
+            for category, total in spent_by_category.items()
+        },
+        "budgets": build_budget_status(budgets, spent_by_category),
+    })
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body)
@@ -2,14 +2,17 @@
 Expense management API routes.
 """
 import logging
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_json_response, encode_json, response_cache
 from app.core.security import get_current_active_user
 from app.crud import expense
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.models.expense import CategoryEnum
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse
@@ -17,19 +20,31 @@ from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Serializes whole list responses in one pass; built once at import time
+_EXPENSE_LIST_ADAPTER = TypeAdapter(List[ExpenseResponse])
+
+# Shared query parameter declarations, built once at import time
+_SKIP_QUERY = Query(0, ge=0, description="Number of records to skip")
+_LIMIT_QUERY = Query(100, ge=1, le=1000, description="Number of records to return")
+_CATEGORY_QUERY = Query(None, description="Filter by category")
+
 
 @router.get("", response_model=List[ExpenseResponse])
 async def get_expenses(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    category: Optional[CategoryEnum] = Query(None, description="Filter by category"),
+    request: Request,
+    skip: int = _SKIP_QUERY,
+    limit: int = _LIMIT_QUERY,
+    category: Optional[CategoryEnum] = _CATEGORY_QUERY,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get user's expenses with optional filtering.
     
+    Results are cached per user until their expenses change.
+    
     Args:
+        request: Incoming request
         skip: Number of records to skip
         limit: Number of records to return
         category: Optional category filter
@@ -39,38 +54,40 @@ async def get_expenses(
     Returns:
         List of user's expenses
     """
-    try:
-        if category:
-            expenses = expense.get_by_user_and_category(
-                db, 
-                user_id=current_user.id, 
-                category=category.value,
-                skip=skip, 
-                limit=limit
-            )
-        else:
-            expenses = expense.get_by_user(
-                db, 
-                user_id=current_user.id, 
-                skip=skip, 
-                limit=limit
-            )
-        
-        return expenses
-        
-    except Exception as e:
-        logger.error(f"Error fetching expenses: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch expenses"
+    cache_key = f"expenses:list:{category.value if category else ''}:{skip}:{limit}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+    
+    if category:
+        expenses = await expense.get_by_user_and_category(
+            db, 
+            user_id=current_user.id, 
+            category=category.value,
+            skip=skip, 
+            limit=limit
         )
+    else:
+        expenses = await expense.get_by_user(
+            db, 
+            user_id=current_user.id, 
+            skip=skip, 
+            limit=limit
+        )
+    
+    body = _EXPENSE_LIST_ADAPTER.dump_json(
+        _EXPENSE_LIST_ADAPTER.validate_python(expenses, from_attributes=True)
+    )
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body)
 
 
 @router.post("", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
 async def create_expense(
     expense_data: ExpenseCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Create a new expense.
@@ -83,29 +100,92 @@ async def create_expense(
     Returns:
         Created expense data
     """
-    try:
-        db_expense = expense.create_for_user(
-            db, 
-            obj_in=expense_data, 
-            user_id=current_user.id
-        )
+    db_expense = await expense.create_for_user(
+        db, 
+        obj_in=expense_data, 
+        user_id=current_user.id
+    )
+    
+    logger.info(f"Expense created: {db_expense.id} for user {current_user.id}")
+    return db_expense
+
+
+@router.post("/bulk", response_model=List[ExpenseResponse], status_code=status.HTTP_201_CREATED)
+async def create_expenses_bulk(
+    expenses_data: List[ExpenseCreate] = Body(..., min_length=1, max_length=1000),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> Any:
+    """
+    Create up to 1000 expenses in a single transaction.
+    
+    Args:
+        expenses_data: Expenses to create
+        current_user: Currently authenticated user
+        db: Database session
         
-        logger.info(f"Expense created: {db_expense.id} for user {current_user.id}")
-        return db_expense
+    Returns:
+        Created expenses
+    """
+    db_expenses = await expense.create_many_for_user(
+        db,
+        objs_in=expenses_data,
+        user_id=current_user.id
+    )
+    
+    logger.info(f"{len(db_expenses)} expenses created in bulk for user {current_user.id}")
+    return db_expenses
+
+
+@router.get("/export", response_model=List[ExpenseResponse])
+async def export_expenses(
+    category: Optional[CategoryEnum] = _CATEGORY_QUERY,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> Any:
+    """
+    Export all of the user's expenses as a streamed JSON array.
+    
+    Rows are read from a server-side cursor and serialized one batch at a
+    time, so neither the ORM objects nor the response body are ever held
+    in memory all at once.
+    
+    Args:
+        category: Optional category filter
+        current_user: Currently authenticated user
+        db: Database session
         
-    except Exception as e:
-        logger.error(f"Error creating expense: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create expense"
-        )
+    Returns:
+        Streaming JSON response with every matching expense
+    """
+    # The injected session stays open until the body has been streamed only
+    # on FastAPI < 0.106; requirements.txt pins it for this reason
+    rows = await expense.stream_by_user(
+        db,
+        user_id=current_user.id,
+        category=category.value if category else None
+    )
+    
+    async def iter_json() -> AsyncIterator[bytes]:
+        yield b"["
+        separator = b""
+        async for batch in rows.partitions():
+            # Strip the brackets of each batch array so they join into one
+            chunk = _EXPENSE_LIST_ADAPTER.dump_json(
+                _EXPENSE_LIST_ADAPTER.validate_python(batch, from_attributes=True)
+            )[1:-1]
+            yield separator + chunk
+            separator = b","
+        yield b"]"
+    
+    return StreamingResponse(iter_json(), media_type="application/json")
 
 
 @router.get("/{expense_id}", response_model=ExpenseResponse)
 async def get_expense(
     expense_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get a specific expense by ID.
@@ -119,9 +199,9 @@ async def get_expense(
         Expense data
         
     Raises:
-        HTTPException: If expense not found or access denied
+        HTTPException: If expense not found for the user
     """
-    db_expense = expense.get(db, id=expense_id)
+    db_expense = await expense.get_for_user(db, id=expense_id, user_id=current_user.id)
     
     if not db_expense:
         raise HTTPException(
@@ -129,12 +209,6 @@ async def get_expense(
             detail="Expense not found"
         )
     
-    if db_expense.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
     return db_expense
 
 
@@ -143,7 +217,7 @@ async def update_expense(
     expense_id: int,
     expense_update: ExpenseUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Update an existing expense.
@@ -158,9 +232,9 @@ async def update_expense(
         Updated expense data
         
     Raises:
-        HTTPException: If expense not found or access denied
+        HTTPException: If expense not found for the user
     """
-    db_expense = expense.get(db, id=expense_id)
+    db_expense = await expense.get_for_user(db, id=expense_id, user_id=current_user.id)
     
     if not db_expense:
         raise HTTPException(
@@ -168,35 +242,21 @@ async def update_expense(
             detail="Expense not found"
         )
     
-    if db_expense.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    updated_expense = await expense.update(
+        db, 
+        db_obj=db_expense, 
+        obj_in=expense_update
+    )
     
-    try:
-        updated_expense = expense.update(
-            db, 
-            db_obj=db_expense, 
-            obj_in=expense_update
-        )
-        
-        logger.info(f"Expense updated: {expense_id} by user {current_user.id}")
-        return updated_expense
-        
-    except Exception as e:
-        logger.error(f"Error updating expense: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update expense"
-        )
+    logger.info(f"Expense updated: {expense_id} by user {current_user.id}")
+    return updated_expense
 
 
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_expense(
     expense_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> None:
     """
     Delete an expense.
@@ -210,45 +270,34 @@ async def delete_expense(
         None (204 No Content)
         
     Raises:
-        HTTPException: If expense not found or access denied
+        HTTPException: If expense not found for the user
     """
-    db_expense = expense.get(db, id=expense_id)
+    deleted = await expense.remove_for_user(db, id=expense_id, user_id=current_user.id)
     
-    if not db_expense:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Expense not found"
         )
     
-    if db_expense.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
-    try:
-        expense.remove(db, id=expense_id)
-        logger.info(f"Expense deleted: {expense_id} by user {current_user.id}")
-        
-    except Exception as e:
-        logger.error(f"Error deleting expense: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete expense"
-        )
+    logger.info(f"Expense deleted: {expense_id} by user {current_user.id}")
 
 
 @router.get("/stats/monthly", response_model=dict)
 async def get_monthly_stats(
+    request: Request,
     year: int = Query(..., ge=2020, le=2030, description="Year"),
     month: int = Query(..., ge=1, le=12, description="Month"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get monthly expense statistics.
     
+    Results are cached per user until their expenses change.
+    
     Args:
+        request: Incoming request
         year: Year for statistics
         month: Month for statistics
         current_user: Currently authenticated user
@@ -257,24 +306,24 @@ async def get_monthly_stats(
     Returns:
         Monthly expense statistics
     """
-    try:
-        total_amount = expense.get_total_by_user_and_month(
-            db, 
-            user_id=current_user.id, 
-            year=year, 
-            month=month
-        )
-        
-        return {
-            "year": year,
-            "month": month,
-            "total_amount": total_amount,
-            "user_id": current_user.id
-        }
-        
-    except Exception as e:
-        logger.error(f"Error fetching monthly stats: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch monthly statistics"
-        )
\ No newline at end of file
+    cache_key = f"expenses:monthly:{year}-{month:02d}"
+    cached = await response_cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+    
+    total_amount = await expense.get_total_by_user_and_month(
+        db, 
+        user_id=current_user.id, 
+        year=year, 
+        month=month
+    )
+    
+    body = encode_json({
+        "year": year,
+        "month": month,
+        "total_amount": total_amount,
+        "user_id": current_user.id
+    })
+    
+    await response_cache.set(current_user.id, cache_key, body)
+    return cached_json_response(request, body)
\ No newline at end of file
@@ -4,42 +4,81 @@ Provides endpoints for accessing real-time application logs
 """
 
 import logging
-from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-import json
+from typing import Any, Callable, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import asyncio
+import orjson
 
 from app.core.security import get_current_active_user
-from app.db.session import get_db
 from app.models.user import User
-from app.middleware.logging import get_recent_logs, clear_log_buffer, StructuredLogger
+from app.middleware.logging import (
+    MAX_BUFFER_SIZE,
+    get_recent_logs,
+    get_log_count,
+    get_log_sequence,
+    get_buffer_stats,
+    clear_log_buffer,
+    LogStats,
+    subscribe,
+    unsubscribe,
+    StructuredLogger,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Idle seconds before a stream sends an SSE comment to keep proxies from
+# closing the connection
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _log_etag(*parts: Any) -> str:
+    """Build a weak ETag from the buffer's write sequence and the query parameters."""
+    return 'W/"' + "-".join(str(part) for part in (get_log_sequence(), *parts)) + '"'
+
+
+def _etag_response(request: Request, etag: str, build_content: Callable[[], Any]) -> Response:
+    """
+    Return 304 if the client already holds this ETag, otherwise build the body.
+    
+    Args:
+        request: Incoming request, checked for a matching If-None-Match
+        etag: ETag for the current buffer state
+        build_content: Produces the JSON content on a miss
+        
+    Returns:
+        304 response, or a JSON response carrying the ETag
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag.removeprefix("W/") in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return ORJSONResponse(build_content(), headers=headers)
+
 
 @router.get("/recent")
 async def get_recent_logs_endpoint(
+    request: Request,
     limit: int = Query(100, ge=1, le=1000, description="Number of log entries to return"),
     log_type: Optional[str] = Query(None, description="Filter by log type (request, response, error, event)"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
 ) -> Any:
     """
     Get recent application logs.
     
     Args:
+        request: Incoming request
         limit: Number of log entries to return
         log_type: Optional filter by log type
         current_user: Currently authenticated user
-        db: Database session
         
     Returns:
         List of recent log entries
     """
-    try:
+    def build_content() -> dict:
         logs = get_recent_logs(limit=limit)
         
         # Filter by type if specified
@@ -49,14 +88,10 @@ async def get_recent_logs_endpoint(
         return {
             "logs": logs,
             "count": len(logs),
-            "total_available": len(get_recent_logs(limit=10000)),
+            "total_available": get_log_count(),
         }
-    except Exception as e:
-        logger.error(f"Error fetching logs: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch logs"
-        )
+    
+    return _etag_response(request, _log_etag(limit, log_type or "*"), build_content)
 
 
 @router.get("/stream")
@@ -73,29 +108,22 @@ async def stream_logs(
         StreamingResponse with SSE format
     """
     async def event_generator():
-        """Generate SSE events for log streaming."""
-        last_count = 0
-        
-        while True:
-            try:
-                # Get new logs
-                logs = get_recent_logs(limit=1000)
-                new_logs = logs[last_count:]
-                
-                if new_logs:
-                    for log_entry in new_logs:
-                        yield f"data: {json.dumps(log_entry)}\n\n"
-                    last_count = len(logs)
-                
-                # Wait before next check
-                await asyncio.sleep(1)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in log stream: {e}")
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                await asyncio.sleep(5)
+        """Generate SSE events as log entries are written."""
+        backlog, queue = subscribe(replay=MAX_BUFFER_SIZE)
+        try:
+            # Replay the current buffer, then follow new entries as they arrive
+            for log_entry in backlog:
+                yield b"data: " + orjson.dumps(log_entry) + b"\n\n"
+            
+            while True:
+                try:
+                    log_entry = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"data: " + orjson.dumps(log_entry) + b"\n\n"
+        finally:
+            unsubscribe(queue)
     
     return StreamingResponse(
         event_generator(),
@@ -122,73 +150,36 @@ async def clear_logs(
     Returns:
         Success message
     """
-    try:
-        clear_log_buffer()
-        StructuredLogger.log_event(
-            event_type="logs_cleared",
-            message=f"Log buffer cleared by user {current_user.id}",
-            user_id=current_user.id,
-        )
-        return {"message": "Log buffer cleared successfully"}
-    except Exception as e:
-        logger.error(f"Error clearing logs: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to clear logs"
-        )
+    clear_log_buffer()
+    StructuredLogger.log_event(
+        event_type="logs_cleared",
+        message=f"Log buffer cleared by user {current_user.id}",
+        user_id=current_user.id,
+    )
+    return {"message": "Log buffer cleared successfully"}
 
 
 @router.get("/stats")
 async def get_log_stats(
+    request: Request,
+    limit: int = Query(MAX_BUFFER_SIZE, ge=1, le=MAX_BUFFER_SIZE, description="Number of most recent log entries to aggregate"),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get log statistics.
     
     Args:
+        request: Incoming request
+        limit: Number of most recent log entries to aggregate
         current_user: Currently authenticated user
         
     Returns:
         Log statistics
     """
-    try:
-        logs = get_recent_logs(limit=10000)
-        
-        # Calculate statistics
-        stats = {
-            "total_logs": len(logs),
-            "by_type": {},
-            "by_status": {},
-            "error_count": 0,
-            "avg_response_time": 0,
-        }
-        
-        response_times = []
-        
-        for log in logs:
-            log_type = log.get("type", "unknown")
-            stats["by_type"][log_type] = stats["by_type"].get(log_type, 0) + 1
-            
-            if log_type == "error":
-                stats["error_count"] += 1
-            
-            if log_type == "response":
-                status_code = log.get("status_code", 0)
-                stats["by_status"][status_code] = stats["by_status"].get(status_code, 0) + 1
-                
-                process_time = log.get("process_time_ms", 0)
-                if process_time > 0:
-                    response_times.append(process_time)
-        
-        if response_times:
-            stats["avg_response_time"] = round(sum(response_times) / len(response_times), 2)
-        
-        return stats
-        
-    except Exception as e:
-        logger.error(f"Error calculating log stats: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to calculate log statistics"
-        )
-
+    def build_content() -> dict:
+        # Whole-buffer stats are maintained incrementally on every write
+        if limit >= get_log_count():
+            return get_buffer_stats()
+        return LogStats.from_entries(get_recent_logs(limit=limit)).snapshot()
+    
+    return _etag_response(request, _log_etag("stats", limit), build_content)
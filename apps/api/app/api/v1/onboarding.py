@@ -2,24 +2,27 @@
 Onboarding API routes.
 """
 import logging
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_current_active_user
-from app.crud import onboarding
-from app.db.session import get_db
+from app.crud import budget, onboarding
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.onboarding import (
     ProfileSetupCreate,
     ProfileSetupResponse,
+    ProfileSnapshotResponse,
     FinancialSetupCreate,
     FinancialSetupResponse,
     BudgetsCreate,
     GoalsCreate,
     GoalResponse,
     OnboardingStatusResponse,
+    OnboardingSnapshotResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,7 +33,7 @@ router = APIRouter()
 async def save_profile(
     profile_data: ProfileSetupCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Save user profile setup.
@@ -43,49 +46,28 @@ async def save_profile(
     Returns:
         Saved profile data
     """
-    try:
-        profile = onboarding.create_or_update_profile(
-            db, user_id=current_user.id, profile_in=profile_data
-        )
-        logger.info(f"Profile saved for user: {current_user.email}")
-        # Ensure profile is still attached to session before accessing attributes
-        db.refresh(profile)
-        # Refresh user to get updated full_name
-        db.refresh(current_user)
-        # Extract all values while objects are still in session
-        user_name = getattr(current_user, 'full_name', None) or profile_data.name
-        profile_id = getattr(profile, 'id', None)
-        profile_user_id = getattr(profile, 'user_id', None)
-        profile_currency = getattr(profile, 'currency', 'USD')
-        profile_theme = getattr(profile, 'theme', 'system') or 'system'
-        profile_created_at = getattr(profile, 'created_at', None)
-        profile_updated_at = getattr(profile, 'updated_at', None)
-        # Create response with extracted values
-        response = ProfileSetupResponse(
-            id=profile_id,
-            user_id=profile_user_id,
-            name=user_name,
-            currency=profile_currency,
-            theme=profile_theme,
-            created_at=profile_created_at,
-            updated_at=profile_updated_at,
-        )
-        return response
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Profile save error: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to save profile",
-        )
+    profile = await onboarding.create_or_update_profile(
+        db, user_id=current_user.id, profile_in=profile_data
+    )
+    logger.info("Profile saved for user: %s", current_user.email)
+    # The profile save stores the submitted name as the user's full_name
+    user_name = profile_data.name
+    return ProfileSetupResponse(
+        id=profile.id,
+        user_id=profile.user_id,
+        name=user_name,
+        currency=profile.currency,
+        theme=profile.theme or 'system',
+        created_at=profile.created_at,
+        updated_at=profile.updated_at,
+    )
 
 
 @router.post("/financial", response_model=FinancialSetupResponse)
 async def save_financial_setup(
     financial_data: FinancialSetupCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Save user financial setup.
@@ -98,32 +80,19 @@ async def save_financial_setup(
     Returns:
         Saved financial setup data
     """
-    try:
-        financial_setup = onboarding.create_or_update_financial_setup(
-            db, user_id=current_user.id, financial_in=financial_data
-        )
-        logger.info(f"Financial setup saved for user: {current_user.email}")
-        # Ensure financial_setup is still attached to session before returning
-        db.refresh(financial_setup)
-        # Eagerly load recurring_expenses while session is active
-        _ = list(financial_setup.recurring_expenses) if financial_setup.recurring_expenses else []
-        # Use the custom from_orm method to handle relationships safely
-        return FinancialSetupResponse.from_orm_with_expenses(financial_setup)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Financial setup save error: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to save financial setup",
-        )
+    financial_setup = await onboarding.create_or_update_financial_setup(
+        db, user_id=current_user.id, financial_in=financial_data
+    )
+    logger.info("Financial setup saved for user: %s", current_user.email)
+    # recurring_expenses is already populated by the save, so this is no extra query
+    return FinancialSetupResponse.model_validate(financial_setup, from_attributes=True)
 
 
 @router.post("/budgets")
 async def save_budgets(
     budgets_data: BudgetsCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Save user budgets.
@@ -136,27 +105,18 @@ async def save_budgets(
     Returns:
         Success message
     """
-    try:
-        budgets = onboarding.create_budgets(
-            db, user_id=current_user.id, budgets=budgets_data.budgets
-        )
-        logger.info(f"Budgets saved for user: {current_user.email}")
-        return {"message": "Budgets saved successfully", "count": len(budgets)}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Budgets save error: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to save budgets",
-        )
+    budgets = await onboarding.create_budgets(
+        db, user_id=current_user.id, budgets=budgets_data.budgets
+    )
+    logger.info("Budgets saved for user: %s", current_user.email)
+    return {"message": "Budgets saved successfully", "count": len(budgets)}
 
 
 @router.post("/goals", response_model=list[GoalResponse])
 async def save_goals(
     goals_data: GoalsCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Save user goals.
@@ -169,40 +129,20 @@ async def save_goals(
     Returns:
         List of saved goals
     """
-    try:
-        goals = onboarding.create_goals(
-            db, user_id=current_user.id, goals=goals_data.goals
-        )
-        logger.info(f"Goals saved for user: {current_user.email}")
-        # Extract all values while objects are still in session
-        goal_responses = []
-        for goal in goals:
-            db.refresh(goal)
-            goal_responses.append(GoalResponse(
-                id=getattr(goal, 'id', None),
-                user_id=getattr(goal, 'user_id', None),
-                title=getattr(goal, 'title', ''),
-                target_amount=getattr(goal, 'target_amount', 0.0),
-                target_date=getattr(goal, 'target_date', None),
-                is_completed=getattr(goal, 'is_completed', False),
-                created_at=getattr(goal, 'created_at', None),
-                updated_at=getattr(goal, 'updated_at', None),
-            ))
-        return goal_responses
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Goals save error: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to save goals",
-        )
+    goals = await onboarding.create_goals(
+        db, user_id=current_user.id, goals=goals_data.goals
+    )
+    logger.info("Goals saved for user: %s", current_user.email)
+    return [
+        GoalResponse.model_validate(goal, from_attributes=True)
+        for goal in goals
+    ]
 
 
 @router.post("/complete")
 async def complete_onboarding(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Complete onboarding process.
@@ -214,20 +154,11 @@ async def complete_onboarding(
     Returns:
         Success message
     """
-    try:
-        user = onboarding.complete_onboarding(db, user_id=current_user.id)
-        # Extract email while user is still in session
-        user_email = getattr(user, 'email', None) or current_user.email
-        logger.info(f"Onboarding completed for user: {user_email}")
-        return {"message": "Onboarding completed successfully", "is_onboarded": True}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Onboarding completion error: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to complete onboarding",
-        )
+    user = await onboarding.complete_onboarding(db, user_id=current_user.id)
+    # Extract email while user is still in session
+    user_email = getattr(user, 'email', None) or current_user.email
+    logger.info("Onboarding completed for user: %s", user_email)
+    return {"message": "Onboarding completed successfully", "is_onboarded": True}
 
 
 @router.get("/status", response_model=OnboardingStatusResponse)
@@ -246,3 +177,45 @@ async def get_onboarding_status(
     is_onboarded = getattr(current_user, 'is_onboarded', False) or False
     return OnboardingStatusResponse(is_onboarded=is_onboarded)
 
+
+@router.get("/snapshot", response_model=OnboardingSnapshotResponse)
+async def get_onboarding_snapshot(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> Any:
+    """
+    Get everything saved during onboarding in one response.
+    
+    Lets a client resume or review onboarding without a request per step.
+    
+    Args:
+        current_user: Currently authenticated user
+        db: Database session
+        
+    Returns:
+        Onboarding status, profile, financial setup, this month's budgets and goals
+    """
+    user = await onboarding.get_snapshot(db, user_id=current_user.id)
+    # Onboarding writes budgets for the month it runs in
+    budgets = await budget.get_by_user_and_month(
+        db, user_id=current_user.id, month=datetime.utcnow().strftime("%Y-%m")
+    )
+    
+    # profile and financial_setup are one-to-one backrefs, loaded as lists
+    profile = user.profile[0] if user.profile else None
+    financial_setup = user.financial_setup[0] if user.financial_setup else None
+    return OnboardingSnapshotResponse(
+        is_onboarded=bool(user.is_onboarded),
+        profile=ProfileSnapshotResponse(
+            id=profile.id,
+            user_id=profile.user_id,
+            name=user.full_name or "",
+            currency=profile.currency,
+            theme=profile.theme or "system",
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
+        ) if profile else None,
+        financial_setup=financial_setup,
+        budgets=budgets,
+        goals=user.goals,
+    )
@@ -5,25 +5,29 @@ import logging
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_current_active_user
 from app.crud import prediction
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
+from app.schemas.budget import MONTH_PATTERN
 from app.schemas.prediction import PredictionResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Month filter declaration, built once at import time
+_MONTH_QUERY = Query(None, pattern=MONTH_PATTERN, description="Filter by month (YYYY-MM)")
+
 
 @router.get("/", response_model=List[PredictionResponse])
 async def get_predictions(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"),
+    month: Optional[str] = _MONTH_QUERY,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get user's spending predictions with optional filtering.
@@ -38,36 +42,28 @@ async def get_predictions(
     Returns:
         List of user's predictions
     """
-    try:
-        if month:
-            predictions = prediction.get_by_user_and_month(
-                db, 
-                user_id=current_user.id, 
-                month=month
-            )
-        else:
-            predictions = prediction.get_by_user(
-                db, 
-                user_id=current_user.id, 
-                skip=skip, 
-                limit=limit
-            )
-        
-        return predictions
-        
-    except Exception as e:
-        logger.error(f"Error fetching predictions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch predictions"
+    if month:
+        predictions = await prediction.get_by_user_and_month(
+            db, 
+            user_id=current_user.id, 
+            month=month
         )
+    else:
+        predictions = await prediction.get_by_user(
+            db, 
+            user_id=current_user.id, 
+            skip=skip, 
+            limit=limit
+        )
+    
+    return predictions
 
 
 @router.get("/{prediction_id}", response_model=PredictionResponse)
 async def get_prediction(
     prediction_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get a specific prediction by ID.
@@ -83,7 +79,7 @@ async def get_prediction(
     Raises:
         HTTPException: If prediction not found or access denied
     """
-    db_prediction = prediction.get(db, id=prediction_id)
+    db_prediction = await prediction.get(db, id=prediction_id)
     
     if not db_prediction:
         raise HTTPException(
@@ -104,7 +100,7 @@ async def get_prediction(
 async def delete_prediction(
     prediction_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> None:
     """
     Delete a prediction.
@@ -118,29 +114,14 @@ async def delete_prediction(
         None (204 No Content)
         
     Raises:
-        HTTPException: If prediction not found or access denied
+        HTTPException: If prediction not found for the user
     """
-    db_prediction = prediction.get(db, id=prediction_id)
+    deleted = await prediction.remove_for_user(db, id=prediction_id, user_id=current_user.id)
     
-    if not db_prediction:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Prediction not found"
         )
     
-    if db_prediction.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
-    try:
-        prediction.remove(db, id=prediction_id)
-        logger.info(f"Prediction deleted: {prediction_id} by user {current_user.id}")
-        
-    except Exception as e:
-        logger.error(f"Error deleting prediction: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete prediction"
-        )
\ No newline at end of file
+    logger.info("Prediction deleted: %s by user %s", prediction_id, current_user.id)
\ No newline at end of file
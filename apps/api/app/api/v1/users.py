@@ -5,11 +5,11 @@ import logging
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_current_user, get_current_active_user
 from app.crud import user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
 
@@ -37,7 +37,7 @@ async def get_current_user_profile(
 async def update_current_user(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Update current user profile.
@@ -53,36 +53,26 @@ async def update_current_user(
     Raises:
         HTTPException: If email is already taken by another user
     """
-    try:
-        # Check if email is being changed to an existing email
-        if user_update.email and user_update.email != current_user.email:
-            existing_user = user.get_by_email(db, email=user_update.email)
-            if existing_user and existing_user.id != current_user.id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-        
-        # Update user
-        updated_user = user.update(db, db_obj=current_user, obj_in=user_update)
-        logger.info(f"User profile updated: {updated_user.email}")
-        
-        return updated_user
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"User update error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update user profile"
-        )
+    # Check if email is being changed to an existing email
+    if user_update.email and user_update.email != current_user.email:
+        existing_user = await user.get_by_email(db, email=user_update.email)
+        if existing_user and existing_user.id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+    
+    # Update user
+    updated_user = await user.update(db, db_obj=current_user, obj_in=user_update)
+    logger.info("User profile updated: %s", updated_user.email)
+    
+    return updated_user
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> None:
     """
     Delete current user account.
@@ -94,25 +84,17 @@ async def delete_current_user(
     Returns:
         None (204 No Content)
     """
-    try:
-        user.remove(db, id=current_user.id)
-        logger.info(f"User account deleted: {current_user.email}")
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"User deletion error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete user account"
-        )
+    await user.remove(db, id=current_user.id)
+    logger.info("User account deleted: %s", current_user.email)
+    
+    return None
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user_by_id(
     user_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """
     Get user by ID (admin only or self).
@@ -135,7 +117,7 @@ async def get_user_by_id(
             detail="Not enough permissions"
         )
     
-    db_user = user.get(db, id=user_id)
+    db_user = await user.get(db, id=user_id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
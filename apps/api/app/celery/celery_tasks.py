@@ -1,9 +1,30 @@
 from celery import Celery
 
+from app.core.config import get_settings
+
+settings = get_settings()
+
 celery_app = Celery(
     "finance",
-    broker="redis://redis:6379/0",
-    backend="redis://redis:6379/1",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+)
+
+# msgpack payloads are smaller and cheaper to encode than JSON; datetimes and
+# Decimals should be passed to tasks as ISO strings / floats
+celery_app.conf.update(
+    task_serializer=settings.CELERY_TASK_SERIALIZER,
+    result_serializer=settings.CELERY_RESULT_SERIALIZER,
+    accept_content=settings.CELERY_ACCEPT_CONTENT,
+    timezone=settings.CELERY_TIMEZONE,
+    # Reuse broker connections instead of reconnecting per publish
+    broker_pool_limit=settings.REDIS_POOL_SIZE,
+    broker_connection_retry_on_startup=True,
+    # Most tasks are fire-and-forget; ones whose return value is read opt in
+    # with @celery_app.task(ignore_result=False)
+    task_ignore_result=True,
+    task_acks_late=False,
+    worker_prefetch_multiplier=4,
 )
 
 celery_app.autodiscover_tasks(["app.services"])
@@ -0,0 +1,215 @@
+"""
+Caching utilities: in-process TTL caches and the Redis response cache.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+from fastapi import Request, Response
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Keys are tuples whose first element is the owning user ID, which lets
+    all entries for a user be dropped at once when their data changes.
+    A shorter TTL can be given for individual entries.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        """Initialize cache with entry TTL and maximum size."""
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every entry belonging to user_id."""
+        with self._lock:
+            for key in [k for k in self._data if k[0] == user_id]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class ResponseCache:
+    """
+    Redis-backed cache of serialized JSON response bodies, scoped per user.
+    
+    Each user's entries live in a single hash (``user:{id}:responses``), so
+    a write can drop all of them with one UNLINK. Redis failures are logged
+    and treated as misses; after a failure Redis is skipped for
+    ``retry_after`` seconds so an outage does not add latency to every
+    request.
+    """
+    
+    def __init__(self, url: str, ttl_seconds: int, pool_size: int, retry_after: float = 30.0):
+        """Initialize cache settings; clients connect lazily on first use."""
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.pool_size = pool_size
+        self.retry_after = retry_after
+        self._async_client: Optional[aioredis.Redis] = None
+        self._disabled_until = 0.0
+    
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f"user:{user_id}:responses"
+    
+    def _available(self) -> bool:
+        return settings.RESPONSE_CACHE_ENABLED and time.monotonic() >= self._disabled_until
+    
+    def _trip(self, exc: Exception) -> None:
+        logger.warning(f"Response cache unavailable, bypassing for {self.retry_after}s: {exc}")
+        self._disabled_until = time.monotonic() + self.retry_after
+    
+    @property
+    def _aio(self) -> aioredis.Redis:
+        if self._async_client is None:
+            self._async_client = aioredis.from_url(
+                self.url,
+                max_connections=self.pool_size,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._async_client
+    
+    async def get(self, user_id: int, key: str) -> Optional[bytes]:
+        """Return the cached body for a user's key, or None on miss or error."""
+        if not self._available():
+            return None
+        try:
+            return await self._aio.hget(self._user_key(user_id), key)
+        except (redis.RedisError, OSError) as e:
+            self._trip(e)
+            return None
+    
+    async def set(self, user_id: int, key: str, body: bytes) -> None:
+        """Store a response body under a user's key."""
+        if not self._available():
+            return
+        try:
+            async with self._aio.pipeline(transaction=False) as pipe:
+                pipe.hset(self._user_key(user_id), key, body)
+                pipe.expire(self._user_key(user_id), self.ttl_seconds)
+                await pipe.execute()
+        except (redis.RedisError, OSError) as e:
+            self._trip(e)
+    
+    async def invalidate_user_async(self, user_id: int) -> None:
+        """Drop every cached response for a user without blocking the event loop."""
+        if not self._available():
+            return
+        try:
+            await self._aio.unlink(self._user_key(user_id))
+        except (redis.RedisError, OSError) as e:
+            self._trip(e)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a payload the same way ORJSONResponse renders it."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def cached_json_response(request: Request, body: bytes, max_age: Optional[int] = None) -> Response:
+    """
+    Build a JSON response with ETag and private Cache-Control headers.
+    
+    By default clients must revalidate on every GET (``no-cache``), so a
+    write is visible on the next read and an unchanged body costs only a
+    304. A max_age lets clients reuse their copy without asking.
+    
+    Args:
+        request: Incoming request, checked for a matching If-None-Match
+        body: Serialized JSON body
+        max_age: Seconds clients may reuse the body without revalidating
+        
+    Returns:
+        200 response with the body, or 304 when the client copy is current
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if max_age is None else f"private, max-age={max_age}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Per-user financial context used by the AI advisor, keyed by (user_id, month)
+financial_context_cache = TTLCache(
+    ttl_seconds=settings.AI_CONTEXT_CACHE_TTL,
+    maxsize=settings.AI_CONTEXT_CACHE_SIZE,
+)
+
+
+# Column snapshots of authenticated users, keyed by (user_id,). Writes only
+# invalidate the worker that made them, so the short TTL is what bounds how
+# long other workers can see a stale or deactivated user
+user_cache = TTLCache(
+    ttl_seconds=settings.USER_CACHE_TTL,
+    maxsize=settings.USER_CACHE_SIZE,
+)
+
+
+# Verified JWT payloads, keyed by (token digest,); entries never outlive
+# the token's own expiry
+token_cache = TTLCache(
+    ttl_seconds=settings.TOKEN_CACHE_TTL,
+    maxsize=settings.TOKEN_CACHE_SIZE,
+)
+
+
+# Serialized API responses shared across workers
+response_cache = ResponseCache(
+    url=settings.REDIS_URL,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL,
+    pool_size=settings.REDIS_POOL_SIZE,
+)
+
+
+async def invalidate_user_cache_async(user_id: int) -> None:
+    """Invalidate cached data derived from a user's expenses and budgets."""
+    financial_context_cache.invalidate_user(user_id)
+    await response_cache.invalidate_user_async(user_id)
@@ -1,10 +1,13 @@
 """
 Core application configuration and settings.
 """
+import atexit
 import os
 import logging
-from functools import lru_cache
-from typing import List, Optional
+import logging.handlers
+import queue
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -30,6 +33,9 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = Field(default=20, description="Database pool size")
     DATABASE_MAX_OVERFLOW: int = Field(default=10, description="Database max overflow")
     DATABASE_ECHO: bool = Field(default=False, description="Database echo SQL queries")
+    DATABASE_QUERY_CACHE_SIZE: int = Field(default=1200, description="Compiled SQL statement cache size per engine")
+    DATABASE_POOL_PRE_PING: bool = Field(default=False, description="Ping each pooled connection before checkout")
+    DATABASE_POOL_RECYCLE: int = Field(default=900, description="Seconds before a pooled connection is replaced")
     
     # Security Configuration
     SECRET_KEY: str = Field(default="your-secret-key-change-in-production", description="Application secret key")
@@ -37,6 +43,8 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration in minutes")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, description="Refresh token expiration in days")
+    BCRYPT_COST: int = Field(default=10, ge=4, le=31, description="bcrypt work factor for new hashes; lower-cost hashes are upgraded on login, higher ones kept")
+    BCRYPT_MAX_STORED_COST: int = Field(default=12, ge=4, le=31, description="Highest bcrypt cost among stored hashes (legacy hashes use 12); logins for unknown emails verify a dummy hash at this cost")
     
     # CORS Configuration
     ALLOWED_ORIGINS: str = Field(
@@ -55,11 +63,22 @@ class Settings(BaseSettings):
     REDIS_POOL_SIZE: int = Field(default=10, description="Redis pool size")
     CELERY_BROKER_URL: str = Field(default="redis://redis:6379/0", description="Celery broker URL")
     CELERY_RESULT_BACKEND: str = Field(default="redis://redis:6379/1", description="Celery result backend")
-    CELERY_TASK_SERIALIZER: str = Field(default="json", description="Celery task serializer")
-    CELERY_RESULT_SERIALIZER: str = Field(default="json", description="Celery result serializer")
-    CELERY_ACCEPT_CONTENT: List[str] = Field(default=["json"], description="Celery accepted content types")
+    CELERY_TASK_SERIALIZER: str = Field(default="msgpack", description="Celery task serializer")
+    CELERY_RESULT_SERIALIZER: str = Field(default="msgpack", description="Celery result serializer")
+    CELERY_ACCEPT_CONTENT: List[str] = Field(default=["msgpack"], description="Celery accepted content types")
     CELERY_TIMEZONE: str = Field(default="UTC", description="Celery timezone")
     
+    # Caching
+    AI_CONTEXT_CACHE_TTL: int = Field(default=30, description="AI chat financial context cache TTL in seconds")
+    AI_CONTEXT_CACHE_SIZE: int = Field(default=1024, description="Max cached AI chat financial contexts")
+    RESPONSE_CACHE_ENABLED: bool = Field(default=True, description="Enable Redis response caching")
+    RESPONSE_CACHE_TTL: int = Field(default=300, description="Redis response cache TTL in seconds")
+    RESPONSE_CACHE_MAX_AGE: int = Field(default=60, description="Client Cache-Control max-age for cached analytics responses")
+    USER_CACHE_TTL: int = Field(default=5, description="Authenticated user lookup cache TTL in seconds; bounds how long other workers may serve a stale user")
+    USER_CACHE_SIZE: int = Field(default=10000, description="Max cached authenticated users")
+    TOKEN_CACHE_TTL: int = Field(default=300, description="Verified JWT payload cache TTL in seconds")
+    TOKEN_CACHE_SIZE: int = Field(default=10000, description="Max cached verified JWT payloads")
+    
     # Logging Configuration
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FILE: str = Field(default="logs/app.log", description="Log file path")
@@ -68,6 +87,7 @@ class Settings(BaseSettings):
     
     # Monitoring
     SENTRY_DSN: str = Field(default="", description="Sentry DSN for error tracking")
+    SENTRY_SAMPLE_RATE: float = Field(default=0.1, description="Sentry traces sample rate (0 disables tracing)")
     PROMETHEUS_ENABLED: bool = Field(default=True, description="Enable Prometheus metrics")
     
     # Rate Limiting
@@ -90,12 +110,17 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
-    @property
+    @cached_property
     def allowed_origins_list(self) -> List[str]:
-        """Convert ALLOWED_ORIGINS string to list."""
+        """Convert ALLOWED_ORIGINS string to list, parsed once per process."""
         if isinstance(self.ALLOWED_ORIGINS, str):
             return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
         return self.ALLOWED_ORIGINS
+    
+    @cached_property
+    def allowed_origins_set(self) -> FrozenSet[str]:
+        """Allowed origins as a frozenset, for O(1) per-request membership checks."""
+        return frozenset(self.allowed_origins_list)
 
 
 @lru_cache()
@@ -104,8 +129,23 @@ def get_settings() -> Settings:
     return Settings()
 
 
+# Background listener that owns the file and console handlers
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging() -> None:
-    """Configure application logging."""
+    """
+    Configure application logging.
+    
+    Log calls only put the record on a queue; a QueueListener thread does the
+    formatting and the file/console writes, so request handlers never block
+    on disk I/O. Called from the app lifespan rather than on import; safe to
+    call more than once.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
     settings = get_settings()
     
     # Create logs directory if it doesn't exist
@@ -113,22 +153,30 @@ def setup_logging() -> None:
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(settings.LOG_FILE),
-            logging.StreamHandler()
-        ]
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        settings.LOG_FILE,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT
+    )
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    # Configure logging; the root logger's only handler is the queue
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    _log_listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_log_listener.stop)
     
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy.engine").setLevel(
         logging.INFO if settings.DATABASE_ECHO else logging.WARNING
     )
-
-
-# Initialize logging on import
-setup_logging()
\ No newline at end of file
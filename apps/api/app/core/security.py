@@ -1,24 +1,64 @@
 """
 Security utilities including authentication, password hashing, and JWT handling.
 """
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
+import os
+import time
+from datetime import timedelta
 from typing import Optional, Union
 
 import bcrypt
 import jwt
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
+from app.core.cache import token_cache, user_cache
 from app.core.config import get_settings
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
+from app.schemas.user import normalize_email
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 security = HTTPBearer()
 
+# bcrypt is CPU-bound, so cap concurrent hashes at the core count; extra
+# requests wait on the loop instead of piling up in the thread pool
+_PASSWORD_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
+_BCRYPT_COST = settings.BCRYPT_COST
+
+# Verified against when a login email is unknown, so a missing account costs
+# the same bcrypt work as a wrong password and can't be told apart by timing.
+# Hashes above BCRYPT_COST are kept, not downgraded, so the dummy uses the
+# highest cost still stored rather than the cost of new hashes
+_DUMMY_PASSWORD_COST = max(_BCRYPT_COST, settings.BCRYPT_MAX_STORED_COST)
+_DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=_DUMMY_PASSWORD_COST)).decode("utf-8")
+
+# JWT signing parameters, resolved once instead of on every encode/decode
+_JWT_KEY = settings.JWT_SECRET_KEY.encode("utf-8")
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_ACCESS_TOKEN_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# Login lookup built once at import time; each call only binds the email
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+
+class _ORJSONEncoder(json.JSONEncoder):
+    """JSON encoder that lets PyJWT serialize token headers and claims with orjson."""
+    
+    def encode(self, o) -> str:
+        return orjson.dumps(o, option=orjson.OPT_SORT_KEYS if self.sort_keys else 0).decode()
+
 
 class SecurityError(Exception):
     """Base security exception."""
@@ -45,7 +85,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_BCRYPT_COST)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -71,6 +111,87 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a bcrypt hash was made with a cost below BCRYPT_COST.
+    
+    Hashes are only ever upgraded: lowering BCRYPT_COST makes new hashes
+    cheaper but leaves stronger existing ones alone.
+    
+    Args:
+        hashed_password: Hashed password from database, e.g. "$2b$12$..."
+        
+    Returns:
+        True if the hash should be regenerated at the configured cost
+    """
+    try:
+        return int(hashed_password.split("$")[2]) < _BCRYPT_COST
+    except (IndexError, ValueError):
+        return False
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in a worker thread without blocking the event loop.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+    """
+    async with _PASSWORD_SEMAPHORE:
+        return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread without blocking the event loop.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    async with _PASSWORD_SEMAPHORE:
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def verify_login_password(user: Optional[User], password: str) -> bool:
+    """
+    Check a login password, spending the same bcrypt work whether or not the user exists.
+    
+    Args:
+        user: User looked up by the login email, or None
+        password: Plain text password
+        
+    Returns:
+        True only if the user exists and the password matches
+    """
+    password_hash = user.hashed_password if user else _DUMMY_PASSWORD_HASH
+    return await verify_password_async(password, password_hash) and user is not None
+
+
+async def rehash_password_if_needed(db: AsyncSession, user: User, password: str) -> None:
+    """
+    Re-hash a just-verified password if its stored hash uses a lower cost.
+    
+    Lets BCRYPT_COST increases roll out as users log in, without resets.
+    
+    Args:
+        db: Database session the user belongs to
+        user: Authenticated user
+        password: Plain text password that was verified
+    """
+    if not password_needs_rehash(user.hashed_password):
+        return
+    user.hashed_password = await hash_password_async(password)
+    await db.commit()
+    user_cache.invalidate_user(user.id)
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None
@@ -85,22 +206,13 @@ def create_access_token(
     Returns:
         Encoded JWT token
     """
-    to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+    # Integer timestamps spare PyJWT its datetime conversion
+    now = int(time.time())
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_SECONDS
+    to_encode = {**data, "exp": now + lifetime, "iat": now}
     
     try:
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
-        return encoded_jwt
+        return jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM, json_encoder=_ORJSONEncoder)
     except Exception as e:
         logger.error(f"Token creation error: {e}")
         raise SecurityError("Failed to create access token")
@@ -116,17 +228,16 @@ def create_refresh_token(data: dict) -> str:
     Returns:
         Encoded JWT refresh token
     """
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "refresh"})
+    now = int(time.time())
+    to_encode = {
+        **data,
+        "exp": now + _REFRESH_TOKEN_SECONDS,
+        "iat": now,
+        "type": "refresh",
+    }
     
     try:
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
-        return encoded_jwt
+        return jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM, json_encoder=_ORJSONEncoder)
     except Exception as e:
         logger.error(f"Refresh token creation error: {e}")
         raise SecurityError("Failed to create refresh token")
@@ -136,18 +247,25 @@ def verify_token(token: str) -> Optional[dict]:
     """
     Verify and decode a JWT token.
     
+    Verified payloads are cached by token digest until the token expires,
+    so retried or repeated tokens skip the signature check.
+    
     Args:
         token: JWT token to verify
         
     Returns:
         Decoded token payload or None if invalid
     """
+    cache_key = (hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest(),)
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+    
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+        exp = payload.get("exp")
+        if exp is not None:
+            token_cache.set(cache_key, payload, ttl_seconds=exp - time.time())
         return payload
     except jwt.ExpiredSignatureError:
         logger.warning("Token has expired")
@@ -157,9 +275,63 @@ def verify_token(token: str) -> Optional[dict]:
         raise AuthenticationError("Invalid token")
 
 
-def get_current_user(
+def _user_snapshot(user: User) -> dict:
+    """Copy a user's column values into a plain dict safe to share across requests."""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def _user_from_snapshot(db: AsyncSession, snapshot: dict) -> User:
+    """
+    Rebuild a cached user as a persistent instance of this request's session.
+    
+    Every request gets its own instance, so handlers can update or delete
+    it exactly as if it had been loaded, without a SELECT.
+    
+    Args:
+        db: Database session of the current request
+        snapshot: Column values captured by _user_snapshot
+        
+    Returns:
+        User attached to the session
+    """
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Load a user from the lookup cache, falling back to the database.
+    
+    An instance already held by this request's session is returned as is,
+    so repeated lookups in one request neither query nor rebuild the user.
+    A change made through another worker is seen within USER_CACHE_TTL.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        
+    Returns:
+        User attached to the session, or None if not found
+    """
+    user = db.identity_map.get(identity_key(User, user_id))
+    if user is not None:
+        return user
+    
+    snapshot = user_cache.get((user_id,))
+    if snapshot is not None:
+        return _user_from_snapshot(db, snapshot)
+    
+    user = await db.get(User, user_id)
+    if user is not None:
+        user_cache.set((user_id,), _user_snapshot(user))
+    return user
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
     Get the current authenticated user from JWT token.
@@ -182,8 +354,7 @@ def get_current_user(
         if user_id is None:
             raise AuthenticationError("Invalid token payload")
         
-        # Get user from database
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = await get_user_by_id(db, int(user_id))
         if user is None:
             raise AuthenticationError("User not found")
         
@@ -204,12 +375,15 @@ def get_current_user(
         )
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """
     Get the current active user.
     
+    Declared async so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool on every request.
+    
     Args:
         current_user: Current authenticated user
         
@@ -227,7 +401,7 @@ def get_current_active_user(
     return current_user
 
 
-def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
+async def authenticate_user(email: str, password: str, db: AsyncSession) -> Optional[User]:
     """
     Authenticate a user with email and password.
     
@@ -240,13 +414,12 @@ def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
         User if authentication successful, None otherwise
     """
     try:
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            return None
-        
-        if not verify_password(password, user.hashed_password):
+        result = await db.execute(_SELECT_USER_BY_EMAIL, {"email": normalize_email(email)})
+        user = result.scalars().first()
+        if not await verify_login_password(user, password):
             return None
         
+        await rehash_password_if_needed(db, user, password)
         return user
         
     except Exception as e:
@@ -1,82 +1,159 @@
 """
 Budget CRUD operations.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Union
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_user_cache_async
 from app.crud.base import CRUDBase
 from app.models.budget import Budget
 from app.schemas.budget import BudgetCreate, BudgetUpdate
 
+# Dialect inserts that support ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Hot lookups built once at import time; each call only binds parameters
+_SELECT_FOR_USER = select(Budget).where(
+    Budget.id == bindparam("id"), Budget.user_id == bindparam("user_id")
+)
+_SELECT_BY_USER = (
+    select(Budget)
+    .where(Budget.user_id == bindparam("user_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SELECT_BY_USER_AND_MONTH = select(Budget).where(
+    Budget.user_id == bindparam("user_id"), Budget.month == bindparam("month")
+)
+_SELECT_BY_USER_CATEGORY_AND_MONTH = select(Budget).where(
+    Budget.user_id == bindparam("user_id"),
+    Budget.category == bindparam("category"),
+    Budget.month == bindparam("month")
+)
+
 
 class CRUDBudget(CRUDBase[Budget, BudgetCreate, BudgetUpdate]):
     """CRUD operations for Budget model."""
     
-    def get_by_user(
+    async def get_for_user(self, db: AsyncSession, *, id: int, user_id: int) -> Optional[Budget]:
+        """Get a budget by ID, only if it belongs to the given user."""
+        result = await db.execute(_SELECT_FOR_USER, {"id": id, "user_id": user_id})
+        return result.scalars().first()
+    
+    async def get_by_user(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         user_id: int, 
         skip: int = 0, 
         limit: int = 100
     ) -> List[Budget]:
         """Get budgets by user ID."""
-        return (
-            db.query(Budget)
-            .filter(Budget.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER, {"user_id": user_id, "skip": skip, "limit": limit}
         )
+        return list(result.scalars().all())
     
-    def get_by_user_and_month(
+    async def get_by_user_and_month(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         month: str
     ) -> List[Budget]:
         """Get budgets by user ID and month."""
-        return (
-            db.query(Budget)
-            .filter(Budget.user_id == user_id, Budget.month == month)
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER_AND_MONTH, {"user_id": user_id, "month": month}
         )
+        return list(result.scalars().all())
     
-    def get_by_user_category_and_month(
+    async def get_by_user_category_and_month(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         category: str,
         month: str
     ) -> Optional[Budget]:
         """Get budget by user, category, and month."""
-        return (
-            db.query(Budget)
-            .filter(
-                Budget.user_id == user_id,
-                Budget.category == category,
-                Budget.month == month
-            )
-            .first()
+        result = await db.execute(
+            _SELECT_BY_USER_CATEGORY_AND_MONTH,
+            {"user_id": user_id, "category": category, "month": month}
         )
+        return result.scalars().first()
     
-    def create_for_user(
+    async def create_for_user(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         obj_in: BudgetCreate, 
         user_id: int
-    ) -> Budget:
-        """Create budget for specific user."""
-        obj_in_data = obj_in.dict()
+    ) -> Optional[Budget]:
+        """
+        Create budget for specific user in a single round-trip.
+        
+        The unique (user_id, category, month) constraint resolves duplicates
+        with ON CONFLICT DO NOTHING instead of a separate existence check.
+        
+        Returns:
+            The created budget, or None if the user already has a budget
+            for that category and month
+        """
+        obj_in_data = obj_in.model_dump()
         obj_in_data["user_id"] = user_id
-        db_obj = Budget(**obj_in_data)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        insert = UPSERT_INSERTS[db.bind.dialect.name]
+        result = await db.execute(
+            insert(Budget)
+            .values(**obj_in_data)
+            .on_conflict_do_nothing(index_elements=["user_id", "category", "month"])
+            .returning(Budget)
+        )
+        db_obj = result.scalars().first()
+        await db.commit()
+        if db_obj is not None:
+            await invalidate_user_cache_async(user_id)
+        return db_obj
+    
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Budget,
+        obj_in: Union[BudgetUpdate, Dict[str, Any]]
+    ) -> Budget:
+        """Update budget and invalidate the owner's cached data."""
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        await invalidate_user_cache_async(db_obj.user_id)
         return db_obj
+    
+    async def remove_for_user(self, db: AsyncSession, *, id: int, user_id: int) -> bool:
+        """
+        Delete a budget owned by the given user without loading it.
+        
+        Returns:
+            True if a row was deleted, False if no such budget exists for the user
+        """
+        result = await db.execute(
+            delete(Budget)
+            .where(Budget.id == id, Budget.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted = result.rowcount
+        if deleted:
+            await invalidate_user_cache_async(user_id)
+        return bool(deleted)
+    
+    async def remove(self, db: AsyncSession, *, id: int) -> Budget:
+        """Remove budget and invalidate the owner's cached data."""
+        obj = await super().remove(db, id=id)
+        await invalidate_user_cache_async(obj.user_id)
+        return obj
 
 
 budget = CRUDBudget(Budget)
\ No newline at end of file
@@ -1,37 +1,59 @@
 """
 Expense CRUD operations.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Union
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
+from app.core.cache import invalidate_user_cache_async
 from app.crud.base import CRUDBase
-from app.models.expense import Expense
+from app.models.expense import CategoryEnum, Expense
+from app.models.expense_summary import ExpenseMonthlySummary
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate
 
+# Hot lookups built once at import time; each call only binds parameters
+_SELECT_FOR_USER = select(Expense).where(
+    Expense.id == bindparam("id"), Expense.user_id == bindparam("user_id")
+)
+_SELECT_BY_USER = (
+    select(Expense)
+    .where(Expense.user_id == bindparam("user_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SELECT_BY_USER_AND_CATEGORY = (
+    select(Expense)
+    .where(Expense.user_id == bindparam("user_id"), Expense.category == bindparam("category"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 
 class CRUDExpense(CRUDBase[Expense, ExpenseCreate, ExpenseUpdate]):
     """CRUD operations for Expense model."""
     
-    def get_by_user(
+    async def get_for_user(self, db: AsyncSession, *, id: int, user_id: int) -> Optional[Expense]:
+        """Get an expense by ID, only if it belongs to the given user."""
+        result = await db.execute(_SELECT_FOR_USER, {"id": id, "user_id": user_id})
+        return result.scalars().first()
+    
+    async def get_by_user(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         user_id: int, 
         skip: int = 0, 
         limit: int = 100
     ) -> List[Expense]:
         """Get expenses by user ID."""
-        return (
-            db.query(Expense)
-            .filter(Expense.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER, {"user_id": user_id, "skip": skip, "limit": limit}
         )
+        return list(result.scalars().all())
     
-    def get_by_user_and_category(
+    async def get_by_user_and_category(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         category: str,
@@ -39,51 +61,153 @@ class CRUDExpense(CRUDBase[Expense, ExpenseCreate, ExpenseUpdate]):
         limit: int = 100
     ) -> List[Expense]:
         """Get expenses by user ID and category."""
-        return (
-            db.query(Expense)
-            .filter(Expense.user_id == user_id, Expense.category == category)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER_AND_CATEGORY,
+            {"user_id": user_id, "category": category, "skip": skip, "limit": limit}
+        )
+        return list(result.scalars().all())
+    
+    async def stream_by_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        category: Optional[str] = None,
+        batch_size: int = 500
+    ) -> AsyncScalarResult[Expense]:
+        """
+        Stream all of a user's expenses, oldest first, from a server-side cursor.
+        
+        Rows are fetched batch_size at a time, so memory stays flat however
+        many expenses the user has.
+        """
+        stmt = select(Expense).where(Expense.user_id == user_id)
+        if category:
+            stmt = stmt.where(Expense.category == category)
+        return await db.stream_scalars(
+            stmt.order_by(Expense.date).execution_options(yield_per=batch_size)
         )
     
-    def create_for_user(
+    async def create_for_user(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         obj_in: ExpenseCreate, 
         user_id: int
     ) -> Expense:
         """Create expense for specific user."""
-        obj_in_data = obj_in.dict()
+        obj_in_data = obj_in.model_dump()
         obj_in_data["user_id"] = user_id
         db_obj = Expense(**obj_in_data)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        await invalidate_user_cache_async(user_id)
+        return db_obj
+    
+    async def create_many_for_user(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: List[ExpenseCreate],
+        user_id: int
+    ) -> List[Expense]:
+        """
+        Create several expenses for a user in one INSERT and one commit.
+        
+        Args:
+            db: Database session
+            objs_in: Expenses to create
+            user_id: Owner of the new expenses
+            
+        Returns:
+            Created expenses, in input order
+        """
+        rows = [
+            {**obj_in.model_dump(exclude_none=True), "user_id": user_id}
+            for obj_in in objs_in
+        ]
+        result = await db.scalars(insert(Expense).returning(Expense, sort_by_parameter_order=True), rows)
+        db_objs = list(result.all())
+        await db.commit()
+        await invalidate_user_cache_async(user_id)
+        return db_objs
+    
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Expense,
+        obj_in: Union[ExpenseUpdate, Dict[str, Any]]
+    ) -> Expense:
+        """Update expense and invalidate the owner's cached data."""
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        await invalidate_user_cache_async(db_obj.user_id)
         return db_obj
     
-    def get_total_by_user_and_month(
+    async def remove_for_user(self, db: AsyncSession, *, id: int, user_id: int) -> bool:
+        """
+        Delete an expense owned by the given user without loading it.
+        
+        Returns:
+            True if a row was deleted, False if no such expense exists for the user
+        """
+        result = await db.execute(
+            delete(Expense)
+            .where(Expense.id == id, Expense.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted = result.rowcount
+        if deleted:
+            await invalidate_user_cache_async(user_id)
+        return bool(deleted)
+    
+    async def remove(self, db: AsyncSession, *, id: int) -> Expense:
+        """Remove expense and invalidate the owner's cached data."""
+        obj = await super().remove(db, id=id)
+        await invalidate_user_cache_async(obj.user_id)
+        return obj
+    
+    async def get_total_by_user_and_month(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         year: int,
         month: int
     ) -> float:
         """Get total expenses for user in specific month."""
-        from sqlalchemy import func, extract
-        
-        result = (
-            db.query(func.sum(Expense.amount))
-            .filter(
-                Expense.user_id == user_id,
-                extract('year', Expense.date) == year,
-                extract('month', Expense.date) == month
+        # Primary-key lookup on the monthly summary instead of filtering
+        # expenses through per-row EXTRACT(year/month) expressions
+        result = await db.scalar(
+            select(func.coalesce(func.sum(ExpenseMonthlySummary.total_amount), 0.0))
+            .where(
+                ExpenseMonthlySummary.user_id == user_id,
+                ExpenseMonthlySummary.year == year,
+                ExpenseMonthlySummary.month == month
+            )
+        )
+        return float(result)
+    
+    async def get_spending_by_category(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        year: int,
+        month: int
+    ) -> Dict[CategoryEnum, float]:
+        """Get total expenses per category for user in specific month."""
+        result = await db.execute(
+            select(ExpenseMonthlySummary.category, ExpenseMonthlySummary.total_amount)
+            .where(
+                ExpenseMonthlySummary.user_id == user_id,
+                ExpenseMonthlySummary.year == year,
+                ExpenseMonthlySummary.month == month
             )
-            .scalar()
         )
-        return result or 0.0
+        return dict(result.all())
 
 
 expense = CRUDExpense(Expense)
\ No newline at end of file
@@ -1,10 +1,17 @@
 """
 Onboarding CRUD operations.
 """
+from datetime import datetime
 from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.cache import invalidate_user_cache_async, user_cache
+from app.crud.budget import UPSERT_INSERTS
+from app.models.budget import Budget
+from app.models.expense import CategoryEnum
 from app.models.onboarding import UserProfile, FinancialSetup, RecurringExpense, UserGoal
 from app.models.user import User
 from app.schemas.onboarding import (
@@ -19,29 +26,26 @@ class CRUDOnboarding:
     """CRUD operations for onboarding models."""
     
     # Profile Operations
-    def get_profile(self, db: Session, *, user_id: int) -> Optional[UserProfile]:
+    async def get_profile(self, db: AsyncSession, *, user_id: int) -> Optional[UserProfile]:
         """Get user profile by user ID."""
-        return db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+        result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
+        return result.scalars().first()
     
-    def create_or_update_profile(
-        self, db: Session, *, user_id: int, profile_in: ProfileSetupCreate
+    async def create_or_update_profile(
+        self, db: AsyncSession, *, user_id: int, profile_in: ProfileSetupCreate
     ) -> UserProfile:
-        """Create or update user profile."""
-        # Update user's full_name first (before creating profile)
-        user = db.query(User).filter(User.id == user_id).first()
+        """Create or update user profile, storing the name on the user."""
+        user = await db.get(User, user_id)
         if user:
             user.full_name = profile_in.name
             user.currency = profile_in.currency
             user.theme = profile_in.theme or "system"
-            db.commit()
         
-        profile = self.get_profile(db, user_id=user_id)
+        profile = await self.get_profile(db, user_id=user_id)
         
         if profile:
             profile.currency = profile_in.currency
             profile.theme = profile_in.theme or "system"
-            db.commit()
-            db.refresh(profile)
         else:
             profile = UserProfile(
                 user_id=user_id,
@@ -49,37 +53,44 @@ class CRUDOnboarding:
                 theme=profile_in.theme or "system",
             )
             db.add(profile)
-            db.commit()
-            db.refresh(profile)
         
+        # User and profile changes are saved together
+        await db.commit()
+        if user:
+            user_cache.invalidate_user(user_id)
         return profile
     
     # Financial Setup Operations
-    def get_financial_setup(
-        self, db: Session, *, user_id: int
+    async def get_financial_setup(
+        self, db: AsyncSession, *, user_id: int
     ) -> Optional[FinancialSetup]:
         """Get financial setup by user ID with eagerly loaded expenses."""
-        return (
-            db.query(FinancialSetup)
-            .options(joinedload(FinancialSetup.recurring_expenses))
-            .filter(FinancialSetup.user_id == user_id)
-            .first()
+        result = await db.execute(
+            select(FinancialSetup)
+            .options(selectinload(FinancialSetup.recurring_expenses))
+            .where(FinancialSetup.user_id == user_id)
         )
+        return result.scalars().first()
     
-    def create_or_update_financial_setup(
-        self, db: Session, *, user_id: int, financial_in: FinancialSetupCreate
+    async def create_or_update_financial_setup(
+        self, db: AsyncSession, *, user_id: int, financial_in: FinancialSetupCreate
     ) -> FinancialSetup:
-        """Create or update financial setup."""
-        financial_setup = self.get_financial_setup(db, user_id=user_id)
+        """
+        Create or update financial setup.
+        
+        Recurring expenses are replaced with one DELETE and one multi-row
+        INSERT ... RETURNING instead of per-object unit-of-work inserts, and
+        the returned rows are attached to the setup so it needs no re-query.
+        """
+        financial_setup = await self.get_financial_setup(db, user_id=user_id)
         
         if financial_setup:
             financial_setup.current_savings = financial_in.current_savings
             financial_setup.monthly_income = financial_in.monthly_income
-            # Delete existing recurring expenses
-            db.query(RecurringExpense).filter(
-                RecurringExpense.financial_setup_id == financial_setup.id
-            ).delete()
-            db.commit()
+            await db.execute(
+                delete(RecurringExpense)
+                .where(RecurringExpense.financial_setup_id == financial_setup.id)
+            )
         else:
             financial_setup = FinancialSetup(
                 user_id=user_id,
@@ -87,116 +98,125 @@ class CRUDOnboarding:
                 monthly_income=financial_in.monthly_income,
             )
             db.add(financial_setup)
-            db.commit()
-            db.refresh(financial_setup)
+            # The inserts below need the new setup's id
+            await db.flush()
         
-        # Add recurring expenses
-        for expense in financial_in.recurring_expenses:
-            recurring_expense = RecurringExpense(
-                financial_setup_id=financial_setup.id,
-                name=expense.name,
-                amount=expense.amount,
+        recurring_expenses = []
+        if financial_in.recurring_expenses:
+            result = await db.execute(
+                insert(RecurringExpense).returning(RecurringExpense),
+                [
+                    {
+                        "financial_setup_id": financial_setup.id,
+                        "name": expense.name,
+                        "amount": expense.amount,
+                    }
+                    for expense in financial_in.recurring_expenses
+                ],
             )
-            db.add(recurring_expense)
+            recurring_expenses = list(result.scalars().all())
+        set_committed_value(financial_setup, "recurring_expenses", recurring_expenses)
         
-        db.commit()
-        # Refresh financial_setup to ensure it's attached to session
-        db.refresh(financial_setup)
-        # Re-query with eager loading to avoid detached instance errors
-        financial_setup = (
-            db.query(FinancialSetup)
-            .options(joinedload(FinancialSetup.recurring_expenses))
-            .filter(FinancialSetup.id == financial_setup.id)
-            .first()
-        )
+        await db.commit()
         return financial_setup
     
     # Budget Operations
-    def create_budgets(
-        self, db: Session, *, user_id: int, budgets: List[CategoryBudgetCreate]
-    ) -> List:
-        """Create budgets for user from onboarding."""
-        from app.models.budget import Budget
-        from app.models.expense import CategoryEnum
-        from datetime import datetime
+    async def create_budgets(
+        self, db: AsyncSession, *, user_id: int, budgets: List[CategoryBudgetCreate]
+    ) -> List[Budget]:
+        """
+        Create or update the current month's budgets from onboarding.
         
-        created_budgets = []
-        current_month = datetime.utcnow().strftime("%Y-%m")
+        All categories are written with one INSERT ... ON CONFLICT DO UPDATE
+        and a single commit.
+        """
+        if not budgets:
+            return []
         
+        now = datetime.utcnow()
+        current_month = now.strftime("%Y-%m")
+        limits = {}
         for budget_data in budgets:
-            # Convert category string to enum if needed
+            # Convert category string to enum, falling back to 'other'
             try:
                 category_enum = CategoryEnum(budget_data.category)
             except ValueError:
-                # If category doesn't match enum, skip or use 'other'
-                category_enum = CategoryEnum.other
-            
-            # Check if budget already exists for this month
-            existing = (
-                db.query(Budget)
-                .filter(
-                    and_(
-                        Budget.user_id == user_id,
-                        Budget.category == category_enum,
-                        Budget.month == current_month,
-                    )
-                )
-                .first()
-            )
-            
-            if existing:
-                existing.limit_amount = budget_data.limit
-                db.commit()
-                db.refresh(existing)
-                created_budgets.append(existing)
-            else:
-                budget = Budget(
-                    user_id=user_id,
-                    category=category_enum,
-                    limit_amount=budget_data.limit,
-                    month=current_month,
-                )
-                db.add(budget)
-                db.commit()
-                db.refresh(budget)
-                created_budgets.append(budget)
+                category_enum = CategoryEnum.OTHER
+            # One row per category; a statement may not update a row twice
+            limits[category_enum] = budget_data.limit
         
+        upsert_insert = UPSERT_INSERTS[db.bind.dialect.name]
+        stmt = upsert_insert(Budget).values([
+            {
+                "user_id": user_id,
+                "category": category_enum,
+                "limit_amount": limit,
+                "month": current_month,
+            }
+            for category_enum, limit in limits.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "category", "month"],
+            # onupdate defaults don't fire for ON CONFLICT, so set updated_at here
+            set_={"limit_amount": stmt.excluded.limit_amount, "updated_at": now},
+        ).returning(Budget)
+        result = await db.execute(stmt)
+        created_budgets = list(result.scalars().all())
+        await db.commit()
+        
+        await invalidate_user_cache_async(user_id)
         return created_budgets
     
     # Goal Operations
-    def create_goals(
-        self, db: Session, *, user_id: int, goals: List[GoalCreate]
+    async def create_goals(
+        self, db: AsyncSession, *, user_id: int, goals: List[GoalCreate]
     ) -> List[UserGoal]:
-        """Create goals for user from onboarding."""
+        """Create goals for user from onboarding with one multi-row INSERT."""
         if not goals:
             return []
         
-        created_goals = []
-        
-        for goal_data in goals:
-            goal = UserGoal(
-                user_id=user_id,
-                title=goal_data.title,
-                target_amount=goal_data.target_amount,
-                target_date=goal_data.target_date,
-            )
-            db.add(goal)
-            created_goals.append(goal)
-        
-        db.commit()
-        # Refresh all goals to ensure they're attached to session
-        for goal in created_goals:
-            db.refresh(goal)
+        result = await db.execute(
+            insert(UserGoal).returning(UserGoal),
+            [
+                {
+                    "user_id": user_id,
+                    "title": goal_data.title,
+                    "target_amount": goal_data.target_amount,
+                    "target_date": goal_data.target_date,
+                }
+                for goal_data in goals
+            ],
+        )
+        created_goals = list(result.scalars().all())
         
+        await db.commit()
         return created_goals
     
-    def complete_onboarding(self, db: Session, *, user_id: int) -> User:
+    async def get_snapshot(self, db: AsyncSession, *, user_id: int) -> Optional[User]:
+        """
+        Load a user with everything onboarding has saved for them.
+        
+        Profile, financial setup (with its recurring expenses) and goals are
+        selectin-loaded alongside the user, one query per table.
+        """
+        result = await db.execute(
+            select(User)
+            .options(
+                selectinload(User.profile),
+                selectinload(User.financial_setup),
+                selectinload(User.goals),
+            )
+            .where(User.id == user_id)
+        )
+        return result.scalars().first()
+    
+    async def complete_onboarding(self, db: AsyncSession, *, user_id: int) -> User:
         """Mark user as onboarded."""
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if user:
             user.is_onboarded = True
-            db.commit()
-            db.refresh(user)
+            await db.commit()
+            user_cache.invalidate_user(user_id)
         else:
             raise ValueError(f"User with id {user_id} not found")
         return user
@@ -2,53 +2,59 @@
 Prediction CRUD operations.
 """
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
 from app.models.prediction import SpendingPrediction
 from app.schemas.prediction import PredictionResponse
 
+# Hot lookups built once at import time; each call only binds parameters
+_SELECT_BY_USER = (
+    select(SpendingPrediction)
+    .where(SpendingPrediction.user_id == bindparam("user_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SELECT_BY_USER_AND_MONTH = select(SpendingPrediction).where(
+    SpendingPrediction.user_id == bindparam("user_id"),
+    SpendingPrediction.month == bindparam("month")
+)
+
 
 class CRUDPrediction(CRUDBase[SpendingPrediction, None, None]):
     """CRUD operations for SpendingPrediction model."""
     
-    def get_by_user(
+    async def get_by_user(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         user_id: int, 
         skip: int = 0, 
         limit: int = 100
     ) -> List[SpendingPrediction]:
         """Get predictions by user ID."""
-        return (
-            db.query(SpendingPrediction)
-            .filter(SpendingPrediction.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER, {"user_id": user_id, "skip": skip, "limit": limit}
         )
+        return list(result.scalars().all())
     
-    def get_by_user_and_month(
+    async def get_by_user_and_month(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         month: str
     ) -> List[SpendingPrediction]:
         """Get predictions by user ID and month."""
-        return (
-            db.query(SpendingPrediction)
-            .filter(
-                SpendingPrediction.user_id == user_id,
-                SpendingPrediction.month == month
-            )
-            .all()
+        result = await db.execute(
+            _SELECT_BY_USER_AND_MONTH, {"user_id": user_id, "month": month}
         )
+        return list(result.scalars().all())
     
-    def create_prediction(
+    async def create_prediction(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         category: str,
@@ -67,27 +73,43 @@ class CRUDPrediction(CRUDBase[SpendingPrediction, None, None]):
             model_version=model_version
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
     
-    def get_latest_by_user_and_category(
+    async def get_latest_by_user_and_category(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         user_id: int,
         category: str
-    ) -> SpendingPrediction:
+    ) -> Optional[SpendingPrediction]:
         """Get latest prediction for user and category."""
-        return (
-            db.query(SpendingPrediction)
-            .filter(
+        result = await db.execute(
+            select(SpendingPrediction)
+            .where(
                 SpendingPrediction.user_id == user_id,
                 SpendingPrediction.category == category
             )
             .order_by(SpendingPrediction.created_at.desc())
-            .first()
+            .limit(1)
+        )
+        return result.scalars().first()
+    
+    async def remove_for_user(self, db: AsyncSession, *, id: int, user_id: int) -> bool:
+        """
+        Delete a prediction owned by the given user without loading it.
+        
+        Returns:
+            True if a row was deleted, False if no such prediction exists for the user
+        """
+        result = await db.execute(
+            delete(SpendingPrediction)
+            .where(SpendingPrediction.id == id, SpendingPrediction.user_id == user_id)
+            .execution_options(synchronize_session=False)
         )
+        await db.commit()
+        return bool(result.rowcount)
 
 
 prediction = CRUDPrediction(SpendingPrediction)
\ No newline at end of file
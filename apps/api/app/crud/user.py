@@ -1,54 +1,81 @@
 """
 User CRUD operations.
 """
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Any, Optional
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import user_cache
 from app.crud.base import CRUDBase
 from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import hash_password, verify_password
+from app.schemas.user import UserCreate, UserUpdate, normalize_email
+from app.core.security import (
+    get_user_by_id,
+    hash_password_async,
+    rehash_password_if_needed,
+    verify_login_password,
+)
+
+# Built once at import time so the compiled form is reused from the cache
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """CRUD operations for User model."""
     
-    def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
+    async def get(self, db: AsyncSession, id: Any) -> Optional[User]:
+        """Get user by ID through the shared user lookup cache."""
+        return await get_user_by_id(db, id)
+    
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
         """Get user by email address."""
-        return db.query(User).filter(User.email == email).first()
+        result = await db.execute(_SELECT_BY_EMAIL, {"email": normalize_email(email)})
+        return result.scalars().first()
     
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """Create a new user with hashed password."""
+        # bcrypt is CPU-bound, keep it off the event loop
+        hashed_password = await hash_password_async(obj_in.password)
         db_obj = User(
             email=obj_in.email,
-            hashed_password=hash_password(obj_in.password),
+            hashed_password=hashed_password,
             full_name=obj_in.full_name,
             is_active=obj_in.is_active,
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
     
-    def update(self, db: Session, *, db_obj: User, obj_in: UserUpdate) -> User:
+    async def update(self, db: AsyncSession, *, db_obj: User, obj_in: UserUpdate) -> User:
         """Update user information."""
-        update_data = obj_in.dict(exclude_unset=True)
+        update_data = obj_in.model_dump(exclude_unset=True)
         
         # Hash password if provided
         if "password" in update_data:
-            hashed_password = hash_password(update_data["password"])
+            hashed_password = await hash_password_async(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
         
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        user_cache.invalidate_user(db_obj.id)
+        return db_obj
     
-    def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
+    async def remove(self, db: AsyncSession, *, id: int) -> User:
+        """Remove user and drop their cached lookup."""
+        obj = await super().remove(db, id=id)
+        user_cache.invalidate_user(id)
+        return obj
+    
+    async def authenticate(self, db: AsyncSession, *, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password."""
-        user = self.get_by_email(db, email=email)
-        if not user:
-            return None
-        if not verify_password(password, user.hashed_password):
+        user = await self.get_by_email(db, email=email)
+        # End the read transaction so the connection goes back to the pool
+        # while bcrypt runs; loaded attributes stay usable after commit
+        await db.commit()
+        if not await verify_login_password(user, password):
             return None
+        await rehash_password_if_needed(db, user, password)
         return user
     
     def is_active(self, user: User) -> bool:
@@ -2,6 +2,15 @@
 Database module for session management and utilities.
 """
 
-from .session import Base, engine, get_db, create_tables, drop_tables, SessionLocal
+from .session import (
+    Base, engine, get_db, create_tables, drop_tables, SessionLocal,
+    async_engine, get_async_db, AsyncSessionLocal,
+)
+from .functions import utcnow
+from .types import Money, SmallIntEnum, YearMonth
 
-__all__ = ["Base", "engine", "get_db", "create_tables", "drop_tables", "SessionLocal"]
\ No newline at end of file
+__all__ = [
+    "Base", "engine", "get_db", "create_tables", "drop_tables", "SessionLocal",
+    "async_engine", "get_async_db", "AsyncSessionLocal", "Money", "SmallIntEnum", "YearMonth",
+    "utcnow",
+]
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Custom SQL functions.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, evaluated by the database.
+    
+    Used as the server default for created_at/updated_at so inserts can
+    leave those columns out instead of binding a Python datetime per row.
+    Timestamps stay naive UTC, matching the datetime.utcnow() values the
+    application compares them with.
+    """
+    
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP is UTC but only to the second; keep fractional seconds
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
@@ -2,56 +2,106 @@
 Database configuration and session management.
 """
 import logging
+from typing import AsyncIterator
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# TCP keepalives let psycopg2 notice dead connections without a pre-ping
+_SYNC_CONNECT_ARGS = (
+    {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 3}
+    if make_url(settings.DATABASE_URL).get_backend_name() == "postgresql"
+    else {}
+)
+
 # Create database engine
+# Pre-ping costs a round trip on every checkout, so by default connections
+# are instead recycled before server idle timeouts can close them; a
+# connection that still fails is invalidated along with the rest of the pool
 engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    # LIFO reuse keeps the most recently used connections warm and lets
+    # surplus ones idle out
+    pool_use_lifo=True,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    connect_args=_SYNC_CONNECT_ARGS,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
     echo=settings.DATABASE_ECHO,
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Loaded attributes stay valid after commit, so handlers can build
+# responses from committed objects without refresh() round-trips
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Map a sync database URL onto its asyncio driver.
+    
+    Args:
+        database_url: Database URL using a sync driver (psycopg2, pysqlite)
+        
+    Returns:
+        Equivalent URL using asyncpg or aiosqlite
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+# Create async database engine for non-blocking request handlers
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_use_lifo=True,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    echo=settings.DATABASE_ECHO,
+)
+
+# Create async session factory; objects stay usable after commit
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Create declarative base
 Base = declarative_base()
 
 
-# Database event listeners
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Set SQLite pragmas on connection."""
-    if "sqlite" in settings.DATABASE_URL:
+# Database event listeners; SQLite needs foreign keys switched on for every
+# new connection, other backends register nothing
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        """Set SQLite pragmas on connection."""
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
 
-@event.listens_for(engine, "connect")
-def receive_connect(dbapi_connection, connection_record):
-    """Log database connections."""
-    logger.info("Database connection established")
-
-
-@event.listens_for(engine, "close")
-def receive_close(dbapi_connection, connection_record):
-    """Log database disconnections."""
-    logger.info("Database connection closed")
-
-
 def get_db() -> Session:
     """
     Get database session.
@@ -70,6 +120,22 @@ def get_db() -> Session:
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Get async database session.
+    
+    Yields:
+        Async database session
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
+
+
 def create_tables():
     """Create all database tables."""
     try:
@@ -0,0 +1,77 @@
+"""
+Custom column types.
+"""
+import enum
+from typing import Optional, Type
+
+from sqlalchemy import Integer, Numeric, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+# Currency amounts: fixed-point NUMERIC(12, 2) in the database so sums are
+# exact, loaded as float so schemas and arithmetic stay unchanged
+Money = Numeric(12, 2, asdecimal=False)
+
+
+class YearMonth(TypeDecorator):
+    """
+    Calendar month stored as a YYYYMM integer and exposed as a "YYYY-MM" string.
+    
+    Fixed-width integer keys make month indexes smaller and cheaper to
+    compare than VARCHAR, while models, schemas and queries keep using the
+    "YYYY-MM" form.
+    """
+    
+    impl = Integer
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        """Convert "YYYY-MM" to YYYYMM on the way into the database."""
+        if value is None or isinstance(value, int):
+            return value
+        year, month = value.split("-")
+        return int(year) * 100 + int(month)
+    
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        """Convert YYYYMM back to "YYYY-MM" on the way out."""
+        if value is None:
+            return None
+        return f"{value // 100:04d}-{value % 100:02d}"
+
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Enum stored as a SMALLINT code and exposed as its Python enum member.
+    
+    Codes are the 1-based declaration order of the enum's members, so new
+    members must only ever be appended. Two-byte codes keep rows and
+    category indexes narrow and make GROUP BY compare integers instead of
+    text, while models, schemas and API payloads keep the enum values.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: Type[enum.Enum], *args, **kwargs):
+        """
+        Initialize the type for an enum class.
+        
+        Args:
+            enum_class: Enum whose members are stored
+        """
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members, start=1)}
+    
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        """Convert an enum member (or its value) to its code."""
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+    
+    def process_result_value(self, value, dialect) -> Optional[enum.Enum]:
+        """Convert a stored code back to its enum member."""
+        if value is None:
+            return None
+        return self._members[value - 1]
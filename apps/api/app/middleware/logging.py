@@ -3,11 +3,15 @@ Real-time Logging Middleware
 Provides structured logging with real-time log streaming capabilities
 """
 
+import asyncio
 import logging
 import json
+import threading
 import time
+from collections import Counter, deque
+from itertools import islice
 from datetime import datetime
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Iterable, Tuple
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import StreamingResponse
@@ -17,8 +21,87 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 # In-memory log buffer for real-time streaming (in production, use Redis or similar)
-log_buffer: list[Dict[str, Any]] = []
 MAX_BUFFER_SIZE = 1000
+log_buffer: "deque[Dict[str, Any]]" = deque(maxlen=MAX_BUFFER_SIZE)
+
+
+class LogStats:
+    """
+    Running aggregates over a set of log entries.
+    
+    The buffer's instance counts entries as they are appended and uncounts
+    them as they are evicted, so reading its stats never rescans the buffer.
+    """
+    
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.reset()
+    
+    def reset(self) -> None:
+        """Drop all counted entries."""
+        self.total = 0
+        self.by_type: Counter = Counter()
+        self.by_status: Counter = Counter()
+        self.error_count = 0
+        self.response_time_sum = 0.0
+        self.response_time_count = 0
+    
+    def apply(self, log_entry: Dict[str, Any], sign: int = 1) -> None:
+        """Count a log entry, or uncount it with sign=-1."""
+        self.total += sign
+        log_type = log_entry.get("type", "unknown")
+        self.by_type[log_type] += sign
+        
+        if log_type == "error":
+            self.error_count += sign
+        
+        if log_type == "response":
+            self.by_status[log_entry.get("status_code", 0)] += sign
+            
+            process_time = log_entry.get("process_time_ms", 0)
+            if process_time > 0:
+                self.response_time_sum += sign * process_time
+                self.response_time_count += sign
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the aggregates in the /logs/stats response shape."""
+        avg_response_time = 0
+        if self.response_time_count:
+            avg_response_time = round(self.response_time_sum / self.response_time_count, 2)
+        return {
+            "total_logs": self.total,
+            # Unary plus drops categories whose entries were all evicted
+            "by_type": dict(+self.by_type),
+            "by_status": dict(+self.by_status),
+            "error_count": self.error_count,
+            "avg_response_time": avg_response_time,
+        }
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, Any]]) -> "LogStats":
+        """Aggregate an arbitrary collection of log entries."""
+        stats = cls()
+        for log_entry in entries:
+            stats.apply(log_entry)
+        return stats
+
+
+# Aggregates of everything in log_buffer; guarded with it by _buffer_lock
+_buffer_stats = LogStats()
+_buffer_lock = threading.Lock()
+
+# Bumped on every buffer write or clear, so readers can tell whether the
+# buffer changed since they last looked
+_log_sequence = 0
+
+# Requests to the logs API itself are not buffered, otherwise every poll of
+# /logs/recent or /logs/stats would change the data it reads
+_UNBUFFERED_PATH_PREFIX = f"{settings.API_V1_STR}/logs/"
+
+# Queues of connected log stream clients, each paired with the event loop
+# that owns it; every buffered entry is pushed to all of them
+_subscribers: set[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Dict[str, Any]]"]] = set()
+SUBSCRIBER_QUEUE_SIZE = 1024
 
 
 class RealTimeLoggingMiddleware(BaseHTTPMiddleware):
@@ -28,7 +111,8 @@ class RealTimeLoggingMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        buffered = not request.url.path.startswith(_UNBUFFERED_PATH_PREFIX)
         
         # Log request
         request_id = f"{int(time.time() * 1000)}-{id(request)}"
@@ -44,56 +128,68 @@ class RealTimeLoggingMiddleware(BaseHTTPMiddleware):
         }
         
         # Add to buffer
-        add_to_log_buffer(log_entry)
+        if buffered:
+            add_to_log_buffer(log_entry)
         
-        # Log request details
-        logger.info(
-            f"Request: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": dict(request.query_params),
-            }
-        )
+        # Log request details; skip building the extra dict when INFO is off
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Request: %s %s",
+                request.method,
+                request.url.path,
+                extra={
+                    "request_id": request_id,
+                    "method": request.method,
+                    "path": request.url.path,
+                    "query_params": log_entry["query_params"],
+                }
+            )
         
         try:
             # Process request
             response = await call_next(request)
             
-            # Calculate processing time
-            process_time = time.time() - start_time
+            # Calculate processing time in integer nanoseconds
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            process_time_ms = elapsed_ns / 1e6
             
             # Log response
             response_log = {
                 "timestamp": datetime.utcnow().isoformat(),
                 "request_id": request_id,
                 "status_code": response.status_code,
-                "process_time_ms": round(process_time * 1000, 2),
+                "process_time_ms": round(process_time_ms, 2),
                 "type": "response",
             }
             
             # Add to buffer
-            add_to_log_buffer(response_log)
+            if buffered:
+                add_to_log_buffer(response_log)
             
-            # Add X-Process-Time header
-            response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
+            # Add X-Process-Time header (seconds)
+            response.headers["X-Process-Time"] = f"{elapsed_ns / 1e9:.4f}"
             response.headers["X-Request-ID"] = request_id
             
             # Log response details
-            logger.info(
-                f"Response: {request.method} {request.url.path} - {response.status_code} ({process_time*1000:.2f}ms)",
-                extra={
-                    "request_id": request_id,
-                    "status_code": response.status_code,
-                    "process_time_ms": round(process_time * 1000, 2),
-                }
-            )
+            if log_info:
+                logger.info(
+                    "Response: %s %s - %s (%.2fms)",
+                    request.method,
+                    request.url.path,
+                    response.status_code,
+                    process_time_ms,
+                    extra={
+                        "request_id": request_id,
+                        "status_code": response.status_code,
+                        "process_time_ms": response_log["process_time_ms"],
+                    }
+                )
             
             return response
             
         except Exception as e:
-            process_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
             # Log error
             error_log = {
@@ -101,14 +197,18 @@ class RealTimeLoggingMiddleware(BaseHTTPMiddleware):
                 "request_id": request_id,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "process_time_ms": round(process_time * 1000, 2),
+                "process_time_ms": round(elapsed_ns / 1e6, 2),
                 "type": "error",
             }
             
-            add_to_log_buffer(error_log)
+            if buffered:
+                add_to_log_buffer(error_log)
             
             logger.error(
-                f"Error: {request.method} {request.url.path} - {str(e)}",
+                "Error: %s %s - %s",
+                request.method,
+                request.url.path,
+                e,
                 exc_info=True,
                 extra={
                     "request_id": request_id,
@@ -122,23 +222,95 @@ class RealTimeLoggingMiddleware(BaseHTTPMiddleware):
 
 def add_to_log_buffer(log_entry: Dict[str, Any]) -> None:
     """Add log entry to buffer, maintaining max size."""
-    global log_buffer
-    log_buffer.append(log_entry)
+    global _log_sequence
+    with _buffer_lock:
+        _log_sequence += 1
+        # The deque's maxlen drops the oldest entry once the buffer is full
+        if len(log_buffer) == log_buffer.maxlen:
+            _buffer_stats.apply(log_buffer[0], -1)
+        log_buffer.append(log_entry)
+        _buffer_stats.apply(log_entry)
+        # Taken with the append so a client subscribing in between gets the
+        # entry from its replay or its queue, never from both
+        subscribers = list(_subscribers)
     
-    # Keep buffer size manageable
-    if len(log_buffer) > MAX_BUFFER_SIZE:
-        log_buffer = log_buffer[-MAX_BUFFER_SIZE:]
+    if not subscribers:
+        return
+    try:
+        current_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        current_loop = None
+    for loop, queue in subscribers:
+        if loop is current_loop:
+            _push_to_subscriber(queue, log_entry)
+        else:
+            # asyncio queues are not thread-safe; hand off to the owning loop
+            loop.call_soon_threadsafe(_push_to_subscriber, queue, log_entry)
+
+
+def _push_to_subscriber(queue: "asyncio.Queue[Dict[str, Any]]", log_entry: Dict[str, Any]) -> None:
+    """Enqueue an entry for a stream client, dropping its oldest entry if the client lags."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(log_entry)
+
+
+def subscribe(replay: int = 0) -> Tuple[list[Dict[str, Any]], "asyncio.Queue[Dict[str, Any]]"]:
+    """
+    Register a queue that receives every log entry added from now on.
+    
+    Must be called from the event loop that will consume the queue.
+    
+    Args:
+        replay: Number of buffered entries to return for replay
+        
+    Returns:
+        The last `replay` buffered entries, oldest first, and the queue;
+        each entry is in exactly one of the two
+    """
+    queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    with _buffer_lock:
+        _subscribers.add((asyncio.get_running_loop(), queue))
+        return get_recent_logs(limit=replay) if replay else [], queue
+
+
+def unsubscribe(queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+    """Stop delivering log entries to a queue returned by subscribe()."""
+    with _buffer_lock:
+        for subscriber in [s for s in _subscribers if s[1] is queue]:
+            _subscribers.discard(subscriber)
 
 
 def get_recent_logs(limit: int = 100) -> list[Dict[str, Any]]:
-    """Get recent log entries."""
-    return log_buffer[-limit:]
+    """Get recent log entries, oldest first, copying only the last `limit` of them."""
+    entries = list(islice(reversed(log_buffer), limit))
+    entries.reverse()
+    return entries
+
+
+def get_log_count() -> int:
+    """Get the number of entries currently in the buffer."""
+    return len(log_buffer)
+
+
+def get_log_sequence() -> int:
+    """Get a counter that increases whenever the buffer is written or cleared."""
+    return _log_sequence
+
+
+def get_buffer_stats() -> Dict[str, Any]:
+    """Get statistics over the whole log buffer without scanning it."""
+    with _buffer_lock:
+        return _buffer_stats.snapshot()
 
 
 def clear_log_buffer() -> None:
     """Clear the log buffer."""
-    global log_buffer
-    log_buffer = []
+    global _log_sequence
+    with _buffer_lock:
+        _log_sequence += 1
+        log_buffer.clear()
+        _buffer_stats.reset()
 
 
 class StructuredLogger:
@@ -178,7 +350,9 @@ class StructuredLogger:
         
         log_method = getattr(logger, level.lower(), logger.info)
         log_method(
-            f"[{event_type}] {message}",
+            "[%s] %s",
+            event_type,
+            message,
             extra={
                 "event_type": event_type,
                 "user_id": user_id,
@@ -4,11 +4,12 @@ Database models initialization.
 
 from .user import User
 from .expense import Expense, CategoryEnum
+from .expense_summary import ExpenseMonthlySummary
 from .budget import Budget
 from .prediction import SpendingPrediction
 from .onboarding import UserProfile, FinancialSetup, RecurringExpense, UserGoal
 
 __all__ = [
-    "User", "Expense", "CategoryEnum", "Budget", "SpendingPrediction",
+    "User", "Expense", "CategoryEnum", "ExpenseMonthlySummary", "Budget", "SpendingPrediction",
     "UserProfile", "FinancialSetup", "RecurringExpense", "UserGoal"
 ]
\ No newline at end of file
@@ -2,10 +2,12 @@
 Budget model definition.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
+from app.db.functions import utcnow
 from app.db.session import Base
+from app.db.types import Money, SmallIntEnum, YearMonth
 from app.models.expense import CategoryEnum
 
 
@@ -13,14 +15,18 @@ class Budget(Base):
     """Budget model for tracking spending limits by category."""
     
     __tablename__ = "budgets"
+    __table_args__ = (
+        Index("ix_budget_user_month", "user_id", "month"),
+        UniqueConstraint("user_id", "category", "month", name="uq_budget_user_category_month"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    category = Column(SQLEnum(CategoryEnum), nullable=False)
-    limit_amount = Column(Float, nullable=False)
-    month = Column(String, nullable=False)  # YYYY-MM format
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    category = Column(SmallIntEnum(CategoryEnum), nullable=False)
+    limit_amount = Column(Money, nullable=False)
+    month = Column(YearMonth, nullable=False)  # YYYY-MM, stored as YYYYMM
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
     user = relationship("User", back_populates="budgets")
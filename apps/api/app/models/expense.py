@@ -3,14 +3,21 @@ Expense model and category enumeration.
 """
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
+from app.db.functions import utcnow
 from app.db.session import Base
+from app.db.types import Money, SmallIntEnum
 
 
 class CategoryEnum(str, enum.Enum):
-    """Expense category enumeration."""
+    """
+    Expense category enumeration.
+    
+    Stored as a SMALLINT code by declaration order (see SmallIntEnum), so
+    add new categories at the end only.
+    """
     FOOD = "food"
     TRANSPORT = "transport"
     ENTERTAINMENT = "entertainment"
@@ -32,17 +39,23 @@ class Expense(Base):
     """Expense model for tracking user spending."""
     
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Covering indexes for per-user date-range and category filters;
+        # INCLUDE (amount) makes date-range sums index-only on PostgreSQL
+        Index("ix_expense_user_date_cat", "user_id", "date", "category", postgresql_include=["amount"]),
+        Index("ix_expense_user_cat_date", "user_id", "category", "date"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     description = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
-    category = Column(SQLEnum(CategoryEnum), nullable=False)
+    amount = Column(Money, nullable=False)
+    category = Column(SmallIntEnum(CategoryEnum), nullable=False)
     ai_suggested_category = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
     date = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
     user = relationship("User", back_populates="expenses")
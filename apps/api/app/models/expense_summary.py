@@ -0,0 +1,165 @@
+"""
+Monthly expense summary model.
+
+``expense_monthly_summary`` holds one row per (user, year, month, category)
+with the running total and transaction count for that bucket. It is kept in
+step with ``expenses`` by database triggers, so every write path (ORM, bulk
+statements, raw SQL) updates it and analytics reads never have to re-scan
+the expenses table.
+"""
+from sqlalchemy import Column, Integer, ForeignKey, DDL, event
+
+from app.db.session import Base
+from app.db.types import Money, SmallIntEnum
+from app.models.expense import Expense, CategoryEnum
+
+
+class ExpenseMonthlySummary(Base):
+    """Pre-aggregated spending per user, month and category."""
+
+    __tablename__ = "expense_monthly_summary"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    category = Column(SmallIntEnum(CategoryEnum), primary_key=True)
+    total_amount = Column(Money, nullable=False, default=0.0)
+    txn_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<ExpenseMonthlySummary(user_id={self.user_id}, "
+            f"period='{self.year}-{self.month:02d}', category='{self.category}', "
+            f"total_amount={self.total_amount}, txn_count={self.txn_count})>"
+        )
+
+
+# Triggers reference ``expenses``, so make sure it exists before this table.
+ExpenseMonthlySummary.__table__.add_is_dependent_on(Expense.__table__)
+
+_POSTGRESQL_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION expense_monthly_summary_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.date IS NOT NULL THEN
+            UPDATE expense_monthly_summary
+            SET total_amount = total_amount - OLD.amount,
+                txn_count = txn_count - 1
+            WHERE user_id = OLD.user_id
+              AND year = EXTRACT(YEAR FROM OLD.date)::int
+              AND month = EXTRACT(MONTH FROM OLD.date)::int
+              AND category = OLD.category;
+
+            DELETE FROM expense_monthly_summary
+            WHERE user_id = OLD.user_id
+              AND year = EXTRACT(YEAR FROM OLD.date)::int
+              AND month = EXTRACT(MONTH FROM OLD.date)::int
+              AND category = OLD.category
+              AND txn_count <= 0;
+        END IF;
+
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.date IS NOT NULL THEN
+            INSERT INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+            VALUES (
+                NEW.user_id,
+                EXTRACT(YEAR FROM NEW.date)::int,
+                EXTRACT(MONTH FROM NEW.date)::int,
+                NEW.category,
+                NEW.amount,
+                1
+            )
+            ON CONFLICT (user_id, year, month, category) DO UPDATE
+            SET total_amount = expense_monthly_summary.total_amount + EXCLUDED.total_amount,
+                txn_count = expense_monthly_summary.txn_count + 1;
+        END IF;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_expense_monthly_summary ON expenses",
+    """
+    CREATE TRIGGER trg_expense_monthly_summary
+    AFTER INSERT OR DELETE OR UPDATE OF user_id, amount, category, date ON expenses
+    FOR EACH ROW EXECUTE FUNCTION expense_monthly_summary_apply()
+    """,
+    """
+    INSERT INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+    SELECT user_id, EXTRACT(YEAR FROM date)::int, EXTRACT(MONTH FROM date)::int,
+           category, SUM(amount), COUNT(*)
+    FROM expenses
+    WHERE date IS NOT NULL
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+# SQLite (development and tests) has no procedural triggers, so the
+# insert/delete halves are spelled out and UPDATE fires both. ``%%`` is the
+# DDL() escape for a literal percent sign.
+_SQLITE_REMOVE_OLD = """
+    UPDATE expense_monthly_summary
+    SET total_amount = total_amount - OLD.amount, txn_count = txn_count - 1
+    WHERE user_id = OLD.user_id
+      AND year = CAST(strftime('%%Y', OLD.date) AS INTEGER)
+      AND month = CAST(strftime('%%m', OLD.date) AS INTEGER)
+      AND category = OLD.category;
+    DELETE FROM expense_monthly_summary
+    WHERE user_id = OLD.user_id
+      AND year = CAST(strftime('%%Y', OLD.date) AS INTEGER)
+      AND month = CAST(strftime('%%m', OLD.date) AS INTEGER)
+      AND category = OLD.category
+      AND txn_count <= 0;
+"""
+
+_SQLITE_ADD_NEW = """
+    INSERT INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+    SELECT NEW.user_id,
+           CAST(strftime('%%Y', NEW.date) AS INTEGER),
+           CAST(strftime('%%m', NEW.date) AS INTEGER),
+           NEW.category, NEW.amount, 1
+    WHERE NEW.date IS NOT NULL
+    ON CONFLICT (user_id, year, month, category) DO UPDATE
+    SET total_amount = total_amount + excluded.total_amount,
+        txn_count = txn_count + 1;
+"""
+
+_SQLITE_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_expense_monthly_summary_insert
+    AFTER INSERT ON expenses
+    BEGIN {_SQLITE_ADD_NEW} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_expense_monthly_summary_delete
+    AFTER DELETE ON expenses
+    BEGIN {_SQLITE_REMOVE_OLD} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_expense_monthly_summary_update
+    AFTER UPDATE OF user_id, amount, category, date ON expenses
+    BEGIN {_SQLITE_REMOVE_OLD} {_SQLITE_ADD_NEW} END
+    """,
+    """
+    INSERT OR IGNORE INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+    SELECT user_id, CAST(strftime('%%Y', date) AS INTEGER), CAST(strftime('%%m', date) AS INTEGER),
+           category, SUM(amount), COUNT(*)
+    FROM expenses
+    WHERE date IS NOT NULL
+    GROUP BY 1, 2, 3, 4
+    """,
+]
+
+for _statement in _POSTGRESQL_DDL:
+    event.listen(
+        ExpenseMonthlySummary.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+
+for _statement in _SQLITE_DDL:
+    event.listen(
+        ExpenseMonthlySummary.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
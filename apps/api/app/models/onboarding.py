@@ -2,10 +2,22 @@
 Onboarding model definitions.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, text
+from sqlalchemy.orm import backref, relationship
 
+from app.db.functions import utcnow
 from app.db.session import Base
+from app.db.types import Money
+
+
+def _user_backref(name: str):
+    """
+    Backref from User to an onboarding table.
+    
+    Only loaded on request (see the onboarding snapshot), and deleting a
+    user leaves the rows to ON DELETE CASCADE instead of loading them.
+    """
+    return backref(name, lazy="raise_on_sql", passive_deletes=True)
 
 
 class UserProfile(Base):
@@ -17,20 +29,14 @@ class UserProfile(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     currency = Column(String, default="USD")
     theme = Column(String, default="system")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", backref="profile")
+    user = relationship("User", backref=_user_backref("profile"))
     
     def __repr__(self):
-        # Safe repr that handles detached instances
-        try:
-            id_val = getattr(self, 'id', None)
-            user_id_val = getattr(self, 'user_id', None)
-            return f"<UserProfile(id={id_val}, user_id={user_id_val})>"
-        except Exception:
-            return f"<UserProfile(id=None, user_id=None)>"
+        return f"<UserProfile(id={self.id}, user_id={self.user_id})>"
 
 
 class FinancialSetup(Base):
@@ -40,23 +46,25 @@ class FinancialSetup(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
-    current_savings = Column(Float, default=0.0)
-    monthly_income = Column(Float, default=0.0)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    current_savings = Column(Money, default=0.0)
+    monthly_income = Column(Money, default=0.0)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", backref="financial_setup")
-    recurring_expenses = relationship("RecurringExpense", back_populates="financial_setup", cascade="all, delete-orphan")
+    user = relationship("User", backref=_user_backref("financial_setup"))
+    # Always needed with the setup; selectin loads them in one extra query
+    # instead of repeating the parent row per child, and never lazy-loads
+    # under the async session
+    recurring_expenses = relationship(
+        "RecurringExpense",
+        back_populates="financial_setup",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
     
     def __repr__(self):
-        # Safe repr that handles detached instances
-        try:
-            id_val = getattr(self, 'id', None)
-            user_id_val = getattr(self, 'user_id', None)
-            return f"<FinancialSetup(id={id_val}, user_id={user_id_val})>"
-        except Exception:
-            return f"<FinancialSetup(id=None, user_id=None)>"
+        return f"<FinancialSetup(id={self.id}, user_id={self.user_id})>"
 
 
 class RecurringExpense(Base):
@@ -67,47 +75,46 @@ class RecurringExpense(Base):
     id = Column(Integer, primary_key=True, index=True)
     financial_setup_id = Column(Integer, ForeignKey("financial_setups.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    amount = Column(Money, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     financial_setup = relationship("FinancialSetup", back_populates="recurring_expenses")
     
     def __repr__(self):
-        # Safe repr that handles detached instances
-        try:
-            id_val = getattr(self, 'id', None)
-            name_val = getattr(self, 'name', 'N/A')
-            amount_val = getattr(self, 'amount', None)
-            return f"<RecurringExpense(id={id_val}, name='{name_val}', amount={amount_val})>"
-        except Exception:
-            return f"<RecurringExpense(id=None, name='N/A', amount=None)>"
+        return f"<RecurringExpense(id={self.id}, name='{self.name}', amount={self.amount})>"
 
 
 class UserGoal(Base):
     """User financial goals from onboarding."""
     
     __tablename__ = "user_goals"
+    __table_args__ = (
+        # Open goals only: completed goals are never looked up per user, so
+        # leaving them out keeps the index small
+        Index(
+            "ix_goals_open",
+            "user_id",
+            postgresql_where=text("is_completed = false"),
+            sqlite_where=text("is_completed = 0"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=False)
-    target_amount = Column(Float, nullable=False)
+    target_amount = Column(Money, nullable=False)
     target_date = Column(DateTime, nullable=False)
     is_completed = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", backref="goals")
+    user = relationship("User", backref=_user_backref("goals"))
     
     def __repr__(self):
-        # Safe repr that handles detached instances
-        try:
-            id_val = getattr(self, 'id', None)
-            title_val = getattr(self, 'title', 'N/A')
-            target_amount_val = getattr(self, 'target_amount', None)
-            return f"<UserGoal(id={id_val}, title='{title_val}', target_amount={target_amount_val})>"
-        except Exception:
-            return f"<UserGoal(id=None, title='N/A', target_amount=None)>"
+        return (
+            f"<UserGoal(id={self.id}, title='{self.title}', "
+            f"target_amount={self.target_amount})>"
+        )
 
@@ -1,11 +1,12 @@
 """
 Spending prediction model definition.
 """
-from datetime import datetime
-from sqlalchemy import Column, Integer, Float, DateTime, String, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, DateTime, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
+from app.db.functions import utcnow
 from app.db.session import Base
+from app.db.types import Money, SmallIntEnum, YearMonth
 from app.models.expense import CategoryEnum
 
 
@@ -13,15 +14,20 @@ class SpendingPrediction(Base):
     """Spending prediction model for AI-generated forecasts."""
     
     __tablename__ = "spending_predictions"
+    __table_args__ = (
+        # Month listings, and the latest prediction per category
+        Index("ix_prediction_user_month", "user_id", "month"),
+        Index("ix_prediction_user_cat_created", "user_id", "category", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    category = Column(SQLEnum(CategoryEnum), nullable=False)
-    predicted_amount = Column(Float, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    category = Column(SmallIntEnum(CategoryEnum), nullable=False)
+    predicted_amount = Column(Money, nullable=False)
     confidence_score = Column(Float, nullable=False)  # 0.0 to 1.0
     model_version = Column(String, nullable=True)
-    month = Column(String, nullable=False)  # YYYY-MM format
-    created_at = Column(DateTime, default=datetime.utcnow)
+    month = Column(YearMonth, nullable=False)  # YYYY-MM, stored as YYYYMM
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="predictions")
@@ -2,9 +2,10 @@
 User model definition.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, CheckConstraint
 from sqlalchemy.orm import relationship
 
+from app.db.functions import utcnow
 from app.db.session import Base
 
 
@@ -12,6 +13,10 @@ class User(Base):
     """User model for authentication and profile management."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails are stored normalized so lookups are plain equality on the unique index
+        CheckConstraint("email = lower(email)", name="ck_users_email_lower"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -22,23 +27,28 @@ class User(Base):
     is_onboarded = Column(Boolean, default=False)
     currency = Column(String, default="USD")
     theme = Column(String, default="system")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=datetime.utcnow)
     
-    # Relationships
-    expenses = relationship("Expense", back_populates="user", cascade="all, delete-orphan")
-    budgets = relationship("Budget", back_populates="user", cascade="all, delete-orphan")
-    predictions = relationship("SpendingPrediction", back_populates="user", cascade="all, delete-orphan")
+    # Relationships; always queried explicitly, so loading one by attribute
+    # access is a bug. Deleting a user leaves the children to ON DELETE CASCADE
+    # instead of loading them first.
+    expenses = relationship(
+        "Expense", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True,
+    )
+    budgets = relationship(
+        "Budget", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True,
+    )
+    predictions = relationship(
+        "SpendingPrediction", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True,
+    )
     
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', full_name='{self.full_name}')>"
     
-    @property
-    def is_authenticated(self) -> bool:
-        """Check if user is authenticated."""
-        return True
-    
-    @property
-    def is_anonymous(self) -> bool:
-        """Check if user is anonymous."""
-        return False
\ No newline at end of file
+    # Constant auth flags; plain class attributes, not per-access properties
+    is_authenticated = True
+    is_anonymous = False
\ No newline at end of file
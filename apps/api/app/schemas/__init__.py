@@ -6,6 +6,10 @@ from .user import UserCreate, UserUpdate, UserResponse, UserInDB
 from .expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse
 from .budget import BudgetCreate, BudgetUpdate, BudgetResponse
 from .prediction import PredictionResponse
+from .analytics import (
+    AnalyticsOverviewResponse, TrendsResponse,
+    CategoriesResponse, MonthlyResponse
+)
 from .auth import TokenResponse, TokenData
 from .onboarding import (
     ProfileSetupCreate, ProfileSetupResponse,
@@ -19,6 +23,8 @@ __all__ = [
     "ExpenseCreate", "ExpenseUpdate", "ExpenseResponse",
     "BudgetCreate", "BudgetUpdate", "BudgetResponse",
     "PredictionResponse",
+    "AnalyticsOverviewResponse", "TrendsResponse",
+    "CategoriesResponse", "MonthlyResponse",
     "TokenResponse", "TokenData",
     "ProfileSetupCreate", "ProfileSetupResponse",
     "FinancialSetupCreate", "FinancialSetupResponse",
@@ -0,0 +1,74 @@
+"""
+Analytics schemas for API responses.
+"""
+from typing import List
+from pydantic import BaseModel
+
+
+class AnalyticsPeriod(BaseModel):
+    """Inclusive date range covered by an analytics response."""
+    start_date: str
+    end_date: str
+
+
+class ExpenseTotals(BaseModel):
+    """Expense totals for the requested period."""
+    total: float
+    count: int
+    average: float
+
+
+class BudgetUsage(BaseModel):
+    """Budget usage for the current month."""
+    total: float
+    spent: float
+    remaining: float
+    percentage_used: float
+
+
+class AnalyticsOverviewResponse(BaseModel):
+    """Schema for the analytics overview response."""
+    period: AnalyticsPeriod
+    expenses: ExpenseTotals
+    budget: BudgetUsage
+
+
+class TrendPoint(BaseModel):
+    """Spending for one calendar month."""
+    month: str
+    total: float
+    count: int
+
+
+class TrendsResponse(BaseModel):
+    """Schema for the spending trends response."""
+    period_months: int
+    trends: List[TrendPoint]
+
+
+class CategoryStat(BaseModel):
+    """Spending for one category in the requested period."""
+    category: str
+    total: float
+    count: int
+    percentage: float
+
+
+class CategoriesResponse(BaseModel):
+    """Schema for the category analytics response."""
+    period: AnalyticsPeriod
+    total: float
+    categories: List[CategoryStat]
+
+
+class MonthlyStat(BaseModel):
+    """Spending for one month of the requested year."""
+    month: int
+    total: float
+    count: int
+
+
+class MonthlyResponse(BaseModel):
+    """Schema for the monthly analytics response."""
+    year: int
+    months: List[MonthlyStat]
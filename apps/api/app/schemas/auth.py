@@ -2,7 +2,9 @@
 Authentication schemas for API requests and responses.
 """
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from app.schemas.user import normalize_email
 
 
 class TokenData(BaseModel):
@@ -21,6 +23,8 @@ class LoginRequest(BaseModel):
     """Schema for login requests."""
     email: str
     password: str
+    
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
 
 
 class RefreshTokenRequest(BaseModel):
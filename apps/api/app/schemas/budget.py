@@ -3,16 +3,21 @@ Budget schemas for API requests and responses.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.expense import CategoryEnum
 
+# YYYY-MM month format shared by budget schemas and month query filters.
+# pydantic-core compiles it once per field at import and matches it in
+# Rust, so a hand-written Python validator would only be slower.
+MONTH_PATTERN = r"^\d{4}-\d{2}$"
+
 
 class BudgetBase(BaseModel):
     """Base budget schema with common fields."""
     category: CategoryEnum
     limit_amount: float = Field(..., gt=0, description="Budget limit must be positive")
-    month: str = Field(..., pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format")
+    month: str = Field(..., pattern=MONTH_PATTERN, description="Month in YYYY-MM format")
 
 
 class BudgetCreate(BudgetBase):
@@ -24,7 +29,7 @@ class BudgetUpdate(BaseModel):
     """Schema for updating budget information."""
     category: Optional[CategoryEnum] = None
     limit_amount: Optional[float] = Field(None, gt=0)
-    month: Optional[str] = Field(None, pattern=r"^\d{4}-\d{2}$")
+    month: Optional[str] = Field(None, pattern=MONTH_PATTERN)
 
 
 class BudgetResponse(BudgetBase):
@@ -34,5 +39,4 @@ class BudgetResponse(BudgetBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -3,7 +3,7 @@ Expense schemas for API requests and responses.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.expense import CategoryEnum
 
@@ -39,5 +39,4 @@ class ExpenseResponse(ExpenseBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
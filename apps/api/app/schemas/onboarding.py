@@ -2,20 +2,32 @@
 Onboarding schemas for API requests and responses.
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 from pydantic import BaseModel, Field, ConfigDict
+from pydantic.alias_generators import to_camel
 
+from app.schemas.budget import BudgetResponse
 
-class ProfileSetupBase(BaseModel):
+
+class _CamelModel(BaseModel):
+    """Request schema base that accepts camelCase or snake_case keys."""
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+# Response subclasses of the request bases keep snake_case keys for the
+# fields they add, as the API has always returned them
+_RESPONSE_CONFIG = ConfigDict(alias_generator=None, from_attributes=True)
+
+
+class ProfileSetupBase(_CamelModel):
     """Base profile setup schema."""
     name: str = Field(..., min_length=2, description="User's full name")
-    currency: str = Field(default="USD", description="Preferred currency")
-    theme: Optional[str] = Field(default="system", description="Theme preference")
+    currency: str = Field(default="USD", min_length=3, max_length=3, description="ISO 4217 currency code")
+    theme: Optional[Literal["system", "light", "dark"]] = Field(default="system", description="Theme preference")
 
 
 class ProfileSetupCreate(ProfileSetupBase):
     """Schema for creating profile setup."""
-    model_config = ConfigDict(populate_by_name=True)
     pass
 
 
@@ -26,40 +38,29 @@ class ProfileSetupResponse(ProfileSetupBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
-        
-    @classmethod
-    def from_profile_and_user(cls, profile, user_name: str):
-        """Create response from UserProfile and user name."""
-        # Safely access attributes to avoid detached instance errors
-        try:
-            return cls(
-                id=getattr(profile, 'id', None),
-                user_id=getattr(profile, 'user_id', None),
-                name=user_name or "",
-                currency=getattr(profile, 'currency', 'USD'),
-                theme=getattr(profile, 'theme', 'system') or "system",
-                created_at=getattr(profile, 'created_at', None),
-                updated_at=getattr(profile, 'updated_at', None),
-            )
-        except Exception as e:
-            # Fallback if profile is detached
-            return cls(
-                id=None,
-                user_id=None,
-                name=user_name or "",
-                currency='USD',
-                theme='system',
-                created_at=None,
-                updated_at=None,
-            )
-
-
-class RecurringExpenseBase(BaseModel):
-    """Base recurring expense schema."""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _RESPONSE_CONFIG
+
+
+class ProfileSnapshotResponse(BaseModel):
+    """
+    Schema for the profile block of the onboarding snapshot.
+    
+    The name is read back from the user's full_name, which can be cleared
+    or shortened after onboarding, so input length rules are not applied.
+    """
+    id: int
+    user_id: int
+    name: str
+    currency: str
+    theme: str
+    created_at: datetime
+    updated_at: datetime
     
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RecurringExpenseBase(_CamelModel):
+    """Base recurring expense schema."""
     name: str = Field(..., min_length=1, description="Expense name")
     amount: float = Field(..., gt=0, description="Expense amount")
 
@@ -75,37 +76,14 @@ class RecurringExpenseResponse(RecurringExpenseBase):
     financial_setup_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
-        
-    @classmethod
-    def from_attributes(cls, obj):
-        """Create response from model instance safely."""
-        try:
-            return cls(
-                id=getattr(obj, 'id', None),
-                financial_setup_id=getattr(obj, 'financial_setup_id', None),
-                name=getattr(obj, 'name', ''),
-                amount=getattr(obj, 'amount', 0.0),
-                created_at=getattr(obj, 'created_at', None),
-            )
-        except Exception:
-            return cls(
-                id=None,
-                financial_setup_id=None,
-                name='',
-                amount=0.0,
-                created_at=None,
-            )
-
-
-class FinancialSetupBase(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
+
+class FinancialSetupBase(_CamelModel):
     """Base financial setup schema."""
-    model_config = ConfigDict(populate_by_name=True)  # Allow both alias and original name
-    
-    current_savings: float = Field(default=0.0, ge=0, description="Current savings amount", alias="currentSavings")
-    monthly_income: float = Field(..., gt=0, description="Monthly income", alias="monthlyIncome")
-    recurring_expenses: List[RecurringExpenseCreate] = Field(default_factory=list, description="List of recurring expenses", alias="recurringExpenses")
+    current_savings: float = Field(default=0.0, ge=0, description="Current savings amount")
+    monthly_income: float = Field(..., gt=0, description="Monthly income")
+    recurring_expenses: List[RecurringExpenseCreate] = Field(default_factory=list, description="List of recurring expenses")
 
 
 class FinancialSetupCreate(FinancialSetupBase):
@@ -123,47 +101,10 @@ class FinancialSetupResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
-        
-    @classmethod
-    def from_orm_with_expenses(cls, obj):
-        """Create response with eagerly loaded expenses."""
-        try:
-            # Safely access attributes
-            recurring_expenses_list = []
-            if hasattr(obj, 'recurring_expenses') and obj.recurring_expenses:
-                try:
-                    recurring_expenses_list = [
-                        RecurringExpenseResponse.from_attributes(exp)
-                        for exp in obj.recurring_expenses
-                    ]
-                except Exception:
-                    recurring_expenses_list = []
-            
-            return cls(
-                id=getattr(obj, 'id', None),
-                user_id=getattr(obj, 'user_id', None),
-                current_savings=getattr(obj, 'current_savings', 0.0),
-                monthly_income=getattr(obj, 'monthly_income', 0.0),
-                recurring_expenses=recurring_expenses_list,
-                created_at=getattr(obj, 'created_at', None),
-                updated_at=getattr(obj, 'updated_at', None),
-            )
-        except Exception:
-            # Fallback if anything fails
-            return cls(
-                id=None,
-                user_id=None,
-                current_savings=0.0,
-                monthly_income=0.0,
-                recurring_expenses=[],
-                created_at=None,
-                updated_at=None,
-            )
-
-
-class CategoryBudgetBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CategoryBudgetBase(_CamelModel):
     """Base category budget schema."""
     category: str = Field(..., description="Expense category")
     limit: float = Field(..., gt=0, description="Budget limit")
@@ -171,7 +112,6 @@ class CategoryBudgetBase(BaseModel):
 
 class CategoryBudgetCreate(CategoryBudgetBase):
     """Schema for creating category budget."""
-    model_config = ConfigDict(populate_by_name=True)
     pass
 
 
@@ -180,18 +120,15 @@ class BudgetsCreate(BaseModel):
     budgets: List[CategoryBudgetCreate] = Field(..., description="List of category budgets")
 
 
-class GoalBase(BaseModel):
+class GoalBase(_CamelModel):
     """Base goal schema."""
-    model_config = ConfigDict(populate_by_name=True)
-    
     title: str = Field(..., min_length=1, description="Goal title")
-    target_amount: float = Field(..., gt=0, description="Target amount", alias="targetAmount")
-    target_date: datetime = Field(..., description="Target date", alias="targetDate")
+    target_amount: float = Field(..., gt=0, description="Target amount")
+    target_date: datetime = Field(..., description="Target date")
 
 
 class GoalCreate(GoalBase):
     """Schema for creating goal."""
-    model_config = ConfigDict(populate_by_name=True)
     pass
 
 
@@ -203,8 +140,7 @@ class GoalResponse(GoalBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class GoalsCreate(BaseModel):
@@ -216,6 +152,13 @@ class OnboardingStatusResponse(BaseModel):
     """Schema for onboarding status response."""
     is_onboarded: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
 
+class OnboardingSnapshotResponse(BaseModel):
+    """Schema for everything saved during onboarding, in one response."""
+    is_onboarded: bool
+    profile: Optional[ProfileSnapshotResponse] = None
+    financial_setup: Optional[FinancialSetupResponse] = None
+    budgets: List[BudgetResponse] = []
+    goals: List[GoalResponse] = []
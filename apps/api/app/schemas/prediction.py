@@ -3,7 +3,7 @@ Prediction schemas for API responses.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.models.expense import CategoryEnum
 
@@ -19,5 +19,4 @@ class PredictionResponse(BaseModel):
     month: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -3,7 +3,14 @@ User schemas for API requests and responses.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Strip and lowercase an email address so it matches the stored form."""
+    if isinstance(email, str):
+        return email.strip().lower()
+    return email
 
 
 class UserBase(BaseModel):
@@ -11,6 +18,8 @@ class UserBase(BaseModel):
     email: EmailStr
     full_name: Optional[str] = None
     is_active: bool = True
+    
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
 
 
 class UserCreate(UserBase):
@@ -24,6 +33,8 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     password: Optional[str] = Field(None, min_length=8, description="Password must be at least 8 characters")
     is_active: Optional[bool] = None
+    
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
 
 
 class UserResponse(UserBase):
@@ -35,8 +46,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(UserBase):
@@ -47,5 +57,4 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -5,7 +5,7 @@ import logging
 from datetime import timedelta
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.security import create_access_token, create_refresh_token, authenticate_user
@@ -24,7 +24,7 @@ class AuthService:
     def __init__(self):
         self.settings = settings
     
-    async def register_user(self, db: Session, user_data: UserCreate) -> tuple[User, TokenResponse]:
+    async def register_user(self, db: AsyncSession, user_data: UserCreate) -> tuple[User, TokenResponse]:
         """
         Register a new user and return user with tokens.
         
@@ -39,12 +39,12 @@ class AuthService:
             ValueError: If email is already registered
         """
         # Check if user already exists
-        existing_user = user.get_by_email(db, email=user_data.email)
+        existing_user = await user.get_by_email(db, email=user_data.email)
         if existing_user:
             raise ValueError("Email already registered")
         
         # Create new user
-        db_user = user.create(db, obj_in=user_data)
+        db_user = await user.create(db, obj_in=user_data)
         logger.info(f"New user registered: {db_user.email}")
         
         # Generate tokens
@@ -52,7 +52,7 @@ class AuthService:
         
         return db_user, tokens
     
-    async def login_user(self, db: Session, email: str, password: str) -> tuple[User, TokenResponse]:
+    async def login_user(self, db: AsyncSession, email: str, password: str) -> tuple[User, TokenResponse]:
         """
         Authenticate user and return user with tokens.
         
@@ -68,7 +68,7 @@ class AuthService:
             ValueError: If authentication fails
         """
         # Authenticate user
-        db_user = authenticate_user(email, password, db)
+        db_user = await authenticate_user(email, password, db)
         
         if not db_user:
             raise ValueError("Invalid email or password")
@@ -82,7 +82,7 @@ class AuthService:
         logger.info(f"User logged in: {db_user.email}")
         return db_user, tokens
     
-    async def refresh_user_token(self, db: Session, user_id: int) -> TokenResponse:
+    async def refresh_user_token(self, db: AsyncSession, user_id: int) -> TokenResponse:
         """
         Generate new tokens for user.
         
@@ -97,7 +97,7 @@ class AuthService:
             ValueError: If user not found or inactive
         """
         # Get user
-        db_user = user.get(db, id=user_id)
+        db_user = await user.get(db, id=user_id)
         if not db_user:
             raise ValueError("User not found")
         
@@ -1,5 +1,5 @@
 from app.celery_tasks import celery_app
 
-@celery_app.task
+@celery_app.task(ignore_result=False)
 def test_task(x, y):
     return x + y
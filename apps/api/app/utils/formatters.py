@@ -4,6 +4,12 @@ Formatting utilities for display and output.
 from datetime import datetime
 from typing import Optional
 
+# Prefix symbols for currencies shown without their code
+_CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£"}
+
+# Two-digit month strings indexed by month number; index 0 is unused
+_MONTH_DIGITS = tuple(f"{month:02d}" for month in range(13))
+
 
 def format_currency(amount: float, currency: str = "USD", locale: str = "en_US") -> str:
     """
@@ -17,14 +23,10 @@ def format_currency(amount: float, currency: str = "USD", locale: str = "en_US")
     Returns:
         Formatted currency string
     """
-    if currency == "USD":
-        return f"${amount:,.2f}"
-    elif currency == "EUR":
-        return f"€{amount:,.2f}"
-    elif currency == "GBP":
-        return f"£{amount:,.2f}"
-    else:
-        return f"{currency} {amount:,.2f}"
+    symbol = _CURRENCY_SYMBOLS.get(currency)
+    if symbol:
+        return f"{symbol}{amount:,.2f}"
+    return f"{currency} {amount:,.2f}"
 
 
 def format_percentage(value: float, decimal_places: int = 2) -> str:
@@ -56,6 +58,12 @@ def format_date(date: datetime, format_string: str = "%Y-%m-%d") -> str:
     """
     if not date:
         return ""
+    
+    # Build the common formats directly instead of going through strftime
+    if format_string == "%Y-%m-%d":
+        return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+    if format_string == "%Y-%m-%dT%H:%M:%S" and date.tzinfo is None:
+        return date.isoformat(timespec="seconds")
     return date.strftime(format_string)
 
 
@@ -70,4 +78,6 @@ def format_month(year: int, month: int) -> str:
     Returns:
         Formatted month string
     """
+    if 0 < month < 13:
+        return f"{year:04d}-{_MONTH_DIGITS[month]}"
     return f"{year:04d}-{month:02d}"
\ No newline at end of file
@@ -3,18 +3,25 @@ Helper utilities and miscellaneous functions.
 """
 import uuid
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
+# Characters sanitize_filename drops: anything but word characters,
+# whitespace, dots and hyphens. ASCII names use the translate table.
+_FILENAME_DROP_RE = re.compile(r'[^\w\s.-]')
+_ASCII_FILENAME_DROP = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _FILENAME_DROP_RE.match(c)
+))
+
 
 def generate_unique_id() -> str:
     """
     Generate a unique identifier.
     
     Returns:
-        UUID string
+        UUID4 as 32 hex characters, without dashes
     """
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
 
 def sanitize_filename(filename: str) -> str:
@@ -27,34 +34,38 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove special characters
-    filename = re.sub(r'[^\w\s.-]', '', filename)
-    # Replace spaces with underscores
-    filename = re.sub(r'\s+', '_', filename)
+    # Remove special characters; translate is one C pass for ASCII names
+    if filename.isascii():
+        filename = filename.translate(_ASCII_FILENAME_DROP)
+    else:
+        filename = _FILENAME_DROP_RE.sub('', filename)
+    # Replace each run of whitespace with an underscore
+    filename = '_'.join(filename.split())
     # Remove leading/trailing underscores
     filename = filename.strip('_')
     
     return filename
 
 
-def calculate_age(birth_date: datetime) -> int:
+def calculate_age(birth_date: datetime, today: Optional[date] = None) -> int:
     """
     Calculate age from birth date.
     
     Args:
         birth_date: Birth date
+        today: Date to measure the age at; defaults to today. Pass it in when
+            computing many ages so the clock is read once.
         
     Returns:
         Age in years
     """
-    today = datetime.now()
-    age = today.year - birth_date.year
-    
-    # Adjust if birthday hasn't occurred this year
-    if (today.month, today.day) < (birth_date.month, birth_date.day):
-        age -= 1
+    if today is None:
+        today = date.today()
     
-    return age
+    # The comparison is 1 if the birthday hasn't occurred this year
+    return today.year - birth_date.year - (
+        (today.month, today.day) < (birth_date.month, birth_date.day)
+    )
 
 
 def truncate_string(text: str, max_length: int = 50, suffix: str = "...") -> str:
@@ -85,17 +96,47 @@ def parse_month_string(month_str: str) -> Optional[tuple[int, int]]:
     Returns:
         Tuple of (year, month) or None if invalid
     """
+    # Fixed-width format: slice the fields instead of splitting into a list
+    if len(month_str) != 7 or month_str[4] != '-':
+        return None
+    
     try:
-        parts = month_str.split('-')
-        if len(parts) != 2:
-            return None
-        
-        year = int(parts[0])
-        month = int(parts[1])
-        
-        if month < 1 or month > 12:
-            return None
+        year = int(month_str[:4])
+        month = int(month_str[5:])
+    except ValueError:
+        return None
+    
+    if month < 1 or month > 12:
+        return None
+    
+    return (year, month)
+
+
+def parse_and_validate_month(
+    month_str: str, min_year: int = 2000, max_year: int = 2100
+) -> Optional[tuple[int, int]]:
+    """
+    Parse and range-check a month string (YYYY-MM) in one pass.
+    
+    Args:
+        month_str: Month string in YYYY-MM format
+        min_year: Earliest accepted year
+        max_year: Latest accepted year
         
-        return (year, month)
-    except (ValueError, IndexError):
-        return None
\ No newline at end of file
+    Returns:
+        Tuple of (year, month) or None if invalid or out of range
+    """
+    if not isinstance(month_str, str) or len(month_str) != 7 or month_str[4] != '-':
+        return None
+    
+    year_part = month_str[:4]
+    month_part = month_str[5:]
+    if not (year_part.isdecimal() and month_part.isdecimal()):
+        return None
+    
+    year = int(year_part)
+    month = int(month_part)
+    if year < min_year or year > max_year or month < 1 or month > 12:
+        return None
+    
+    return (year, month)
\ No newline at end of file
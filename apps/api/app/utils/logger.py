@@ -1,9 +1,11 @@
 """
 Logging utilities and configuration.
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
 
 from app.core.config import get_settings
@@ -37,7 +39,11 @@ def setup_file_logging(
     level: str = "INFO"
 ) -> logging.Handler:
     """
-    Set up rotating file logging handler.
+    Set up rotating file logging behind a queue.
+    
+    The returned handler only puts records on a queue; a QueueListener thread
+    formats them and does the file writes and rotation, the same way
+    setup_logging wires the root logger.
     
     Args:
         log_file: Path to log file
@@ -46,7 +52,7 @@ def setup_file_logging(
         level: Logging level
         
     Returns:
-        Configured file handler
+        Queue handler feeding the rotating file handler
     """
     # Create directory if it doesn't exist
     log_dir = os.path.dirname(log_file)
@@ -54,7 +60,7 @@ def setup_file_logging(
         os.makedirs(log_dir, exist_ok=True)
     
     # Create rotating file handler
-    handler = logging.handlers.RotatingFileHandler(
+    file_handler = logging.handlers.RotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count
@@ -64,7 +70,19 @@ def setup_file_logging(
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    handler.setFormatter(formatter)
-    handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+    file_handler.setFormatter(formatter)
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    file_handler.setLevel(log_level)
+    
+    # Hand records to a background listener that owns the file handler
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setLevel(log_level)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
     
-    return handler
\ No newline at end of file
+    return handler
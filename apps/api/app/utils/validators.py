@@ -2,9 +2,21 @@
 Validation utilities for data validation.
 """
 import re
+import string
 from datetime import datetime
 from typing import Optional
 
+from app.utils.helpers import parse_and_validate_month
+
+# Patterns compiled once at import instead of looked up in re's cache per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Password character classes, checked against the password's character set
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_SPECIALS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 
 def validate_email(email: str) -> bool:
     """
@@ -19,8 +31,7 @@ def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_password(password: str, min_length: int = 8) -> tuple[bool, list[str]]:
@@ -43,16 +54,20 @@ def validate_password(password: str, min_length: int = 8) -> tuple[bool, list[st
     if len(password) < min_length:
         errors.append(f"Password must be at least {min_length} characters long")
     
-    if not re.search(r'[A-Z]', password):
+    # One pass builds the character set; each class check is then a C-level
+    # disjointness test instead of another scan of the password
+    chars = set(password)
+    
+    if chars.isdisjoint(_UPPERCASE):
         errors.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r'[a-z]', password):
+    if chars.isdisjoint(_LOWERCASE):
         errors.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r'\d', password):
+    if chars.isdisjoint(_DIGITS):
         errors.append("Password must contain at least one digit")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if chars.isdisjoint(_SPECIALS):
         errors.append("Password must contain at least one special character")
     
     return len(errors) == 0, errors
@@ -85,27 +100,7 @@ def validate_month_format(month: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    if not month or not isinstance(month, str):
-        return False
-    
-    pattern = r'^\d{4}-\d{2}$'
-    if not re.match(pattern, month):
-        return False
-    
-    try:
-        year, month_num = month.split('-')
-        year = int(year)
-        month_num = int(month_num)
-        
-        # Validate ranges
-        if year < 2000 or year > 2100:
-            return False
-        if month_num < 1 or month_num > 12:
-            return False
-        
-        return True
-    except (ValueError, IndexError):
-        return False
+    return parse_and_validate_month(month) is not None
 
 
 def validate_amount(amount: float, min_value: float = 0.01) -> bool:
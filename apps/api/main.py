@@ -7,30 +7,63 @@ and error handling.
 """
 
 import logging
-import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1 import api_router
 from app.core.config import get_settings, setup_logging
-from app.db.session import create_tables
+from app.db.session import async_engine, create_tables
 from app.middleware.logging import RealTimeLoggingMiddleware
 
-# Initialize logging
-setup_logging()
 logger = logging.getLogger(__name__)
 
 # Get settings
 settings = get_settings()
 
 
+def _init_sentry() -> bool:
+    """
+    Initialize Sentry if a DSN is configured.
+    
+    Runs once at import, before the application is built, so its integrations
+    are in place for the first request.
+    
+    Returns:
+        Whether Sentry was initialized
+    """
+    if not settings.SENTRY_DSN:
+        return False
+    
+    try:
+        import sentry_sdk
+        from sentry_sdk.integrations.fastapi import FastApiIntegration
+        from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+        
+        sentry_sdk.init(
+            dsn=settings.SENTRY_DSN,
+            integrations=[
+                FastApiIntegration(auto_enabling=True),
+                SqlalchemyIntegration(),
+            ],
+            traces_sample_rate=settings.SENTRY_SAMPLE_RATE,
+            environment=settings.ENVIRONMENT,
+        )
+    except Exception as e:
+        logger.warning("Failed to initialize Sentry: %s", e)
+        return False
+    return True
+
+
+sentry_enabled = _init_sentry()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -40,42 +73,28 @@ async def lifespan(app: FastAPI):
         app: FastAPI application instance
     """
     # Startup
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+    setup_logging()
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    logger.info("Debug mode: %s", settings.DEBUG)
     
     # Create database tables
     try:
         create_tables()
         logger.info("Database tables created/verified successfully")
     except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
+        logger.error("Failed to create database tables: %s", e)
         raise
     
-    # Initialize Sentry if configured
-    if settings.SENTRY_DSN:
-        try:
-            import sentry_sdk
-            from sentry_sdk.integrations.fastapi import FastApiIntegration
-            from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-            
-            sentry_sdk.init(
-                dsn=settings.SENTRY_DSN,
-                integrations=[
-                    FastApiIntegration(auto_enabling=True),
-                    SqlalchemyIntegration(),
-                ],
-                traces_sample_rate=0.1,
-                environment=settings.ENVIRONMENT,
-            )
-            logger.info("Sentry initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Sentry: {e}")
+    # Sentry itself is initialized at import, before the app is built
+    if sentry_enabled:
+        logger.info("Sentry initialized successfully")
     
     yield
     
     # Shutdown
-    logger.info(f"Shutting down {settings.APP_NAME}")
+    logger.info("Shutting down %s", settings.APP_NAME)
+    await async_engine.dispose()
 
 
 def create_application() -> FastAPI:
@@ -93,6 +112,7 @@ def create_application() -> FastAPI:
         docs_url=f"{settings.API_V1_STR}/docs" if settings.DEBUG else None,
         redoc_url=f"{settings.API_V1_STR}/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add security middleware
@@ -105,49 +125,21 @@ def create_application() -> FastAPI:
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.allowed_origins_list,
+        allow_origins=settings.allowed_origins_set,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
         max_age=settings.CORS_MAX_AGE,
     )
     
-    # Add compression middleware
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-    
-    # Add real-time logging middleware
+    # Add real-time logging middleware; it also times every request and
+    # sets X-Process-Time, so no separate timing/logging middleware is needed
     app.add_middleware(RealTimeLoggingMiddleware)
     
-    # Add request timing middleware
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
-    
-    # Add request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        start_time = time.time()
-        
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
-        
-        response = await call_next(request)
-        
-        # Log response
-        process_time = time.time() - start_time
-        logger.info(
-            f"Response: {response.status_code} "
-            f"({process_time:.4f}s)"
-        )
-        
-        return response
+    # Add compression middleware last so it is the outermost layer: responses
+    # are compressed once, after every other middleware has handled them.
+    # Bodies that fit in one packet (~1500 bytes) are sent uncompressed.
+    app.add_middleware(GZipMiddleware, minimum_size=1500)
     
     # Include API routes
     app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -163,8 +155,8 @@ app = create_application()
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions."""
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
-    return JSONResponse(
+    logger.warning("HTTP exception: %s - %s", exc.status_code, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
@@ -173,25 +165,16 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
-    logger.warning(f"Validation error: {exc.errors()}")
-    # Convert validation errors to JSON-serializable format
-    errors = []
-    for error in exc.errors():
-        error_dict = {
-            "loc": error.get("loc", []),
-            "msg": error.get("msg", ""),
-            "type": error.get("type", ""),
-        }
-        # Convert bytes to string if present
-        if "input" in error:
-            input_val = error["input"]
-            if isinstance(input_val, bytes):
-                error_dict["input"] = input_val.decode("utf-8", errors="replace")
-            else:
-                error_dict["input"] = str(input_val)
-        errors.append(error_dict)
-    
-    return JSONResponse(
+    # Keep only the JSON-serializable keys; the raw input (possibly bytes or
+    # a plaintext password) and ctx (may hold exception objects) are left
+    # out of both the log and the response
+    errors = [
+        {"loc": error["loc"], "msg": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
+    logger.warning("Validation error: %s", errors)
+    
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": "Validation error",
@@ -203,10 +186,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     
     if settings.DEBUG:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": f"Internal server error: {str(exc)}",
@@ -214,12 +197,27 @@ async def general_exception_handler(request: Request, exc: Exception):
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Internal server error"}
         )
 
 
+# Settings don't change at runtime, so these bodies are built once
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "app_name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT
+}
+_ROOT_RESPONSE = {
+    "message": f"Welcome to {settings.APP_NAME} API",
+    "version": settings.APP_VERSION,
+    "docs_url": f"{settings.API_V1_STR}/docs" if settings.DEBUG else None,
+    "health_check": "/health"
+}
+
+
 # Health check endpoints
 @app.get("/health")
 async def health_check():
@@ -229,12 +227,7 @@ async def health_check():
     Returns:
         Health status information
     """
-    return {
-        "status": "healthy",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT
-    }
+    return _HEALTH_RESPONSE
 
 
 @app.get("/")
@@ -245,12 +238,7 @@ async def root():
     Returns:
         Application information
     """
-    return {
-        "message": f"Welcome to {settings.APP_NAME} API",
-        "version": settings.APP_VERSION,
-        "docs_url": f"{settings.API_V1_STR}/docs" if settings.DEBUG else None,
-        "health_check": "/health"
-    }
+    return _ROOT_RESPONSE
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+-- Migration: Add expense monthly summary
+-- Description: Creates a per-user/month/category spending summary kept current by a trigger on expenses
+
+-- Create expense_monthly_summary table
+CREATE TABLE IF NOT EXISTS expense_monthly_summary (
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    total_amount FLOAT NOT NULL DEFAULT 0.0,
+    txn_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, year, month, category)
+);
+
+-- Apply every expense insert/update/delete to its summary bucket
+CREATE OR REPLACE FUNCTION expense_monthly_summary_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.date IS NOT NULL THEN
+        UPDATE expense_monthly_summary
+        SET total_amount = total_amount - OLD.amount,
+            txn_count = txn_count - 1
+        WHERE user_id = OLD.user_id
+          AND year = EXTRACT(YEAR FROM OLD.date)::int
+          AND month = EXTRACT(MONTH FROM OLD.date)::int
+          AND category = OLD.category;
+
+        DELETE FROM expense_monthly_summary
+        WHERE user_id = OLD.user_id
+          AND year = EXTRACT(YEAR FROM OLD.date)::int
+          AND month = EXTRACT(MONTH FROM OLD.date)::int
+          AND category = OLD.category
+          AND txn_count <= 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.date IS NOT NULL THEN
+        INSERT INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+        VALUES (
+            NEW.user_id,
+            EXTRACT(YEAR FROM NEW.date)::int,
+            EXTRACT(MONTH FROM NEW.date)::int,
+            NEW.category,
+            NEW.amount,
+            1
+        )
+        ON CONFLICT (user_id, year, month, category) DO UPDATE
+        SET total_amount = expense_monthly_summary.total_amount + EXCLUDED.total_amount,
+            txn_count = expense_monthly_summary.txn_count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_expense_monthly_summary ON expenses;
+CREATE TRIGGER trg_expense_monthly_summary
+AFTER INSERT OR DELETE OR UPDATE OF user_id, amount, category, date ON expenses
+FOR EACH ROW EXECUTE FUNCTION expense_monthly_summary_apply();
+
+-- Backfill from existing expenses
+INSERT INTO expense_monthly_summary (user_id, year, month, category, total_amount, txn_count)
+SELECT user_id, EXTRACT(YEAR FROM date)::int, EXTRACT(MONTH FROM date)::int,
+       category, SUM(amount), COUNT(*)
+FROM expenses
+WHERE date IS NOT NULL
+GROUP BY 1, 2, 3, 4
+ON CONFLICT DO NOTHING;
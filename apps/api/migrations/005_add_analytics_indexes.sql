@@ -0,0 +1,14 @@
+-- Migration: Add composite indexes for analytics filters
+-- Description: Covers the (user_id, date) and (user_id, category, date) expense filters and budget month lookups
+
+-- Supersedes idx_expenses_user_date from 002_add_indexes.sql
+DROP INDEX IF EXISTS idx_expenses_user_date;
+
+CREATE INDEX IF NOT EXISTS ix_expense_user_date
+ON expenses(user_id, date DESC);
+
+CREATE INDEX IF NOT EXISTS ix_expense_user_cat_date
+ON expenses(user_id, category, date);
+
+CREATE INDEX IF NOT EXISTS ix_budget_user_month
+ON budgets(user_id, month);
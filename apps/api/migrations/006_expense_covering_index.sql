@@ -0,0 +1,17 @@
+-- Migration: Covering index for expense date-range aggregates
+-- Description: Lets the overview and category analytics sum amounts with index-only scans
+--
+-- CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so
+-- apply this file in autocommit mode (the psql default), not wrapped in BEGIN.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_expense_user_date_cat
+ON expenses(user_id, date, category) INCLUDE (amount);
+
+-- Superseded by ix_expense_user_date_cat (from 005_add_analytics_indexes.sql)
+DROP INDEX CONCURRENTLY IF EXISTS ix_expense_user_date;
+
+-- Every (user_id, ...) composite index already covers user_id lookups
+DROP INDEX CONCURRENTLY IF EXISTS idx_expenses_user_id;
+
+-- Duplicates the primary key index
+DROP INDEX CONCURRENTLY IF EXISTS ix_expenses_id;
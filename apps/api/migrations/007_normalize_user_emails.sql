@@ -0,0 +1,13 @@
+-- Migration: Normalize user emails to lowercase
+-- Description: Logins compare email with plain equality against the unique index,
+-- so stored addresses must already be trimmed and lowercased.
+--
+-- Accounts whose emails differ only by case collide on the unique constraint;
+-- merge them by hand before applying this file.
+
+UPDATE users
+SET email = lower(btrim(email))
+WHERE email <> lower(btrim(email));
+
+ALTER TABLE users
+ADD CONSTRAINT ck_users_email_lower CHECK (email = lower(email));
@@ -0,0 +1,8 @@
+-- Migration: Enforce one budget per user, category and month
+-- Description: Budget creation relies on ON CONFLICT DO NOTHING against this
+-- constraint instead of a separate existence check before each insert.
+--
+-- Existing duplicate budgets must be merged by hand before applying this file.
+
+ALTER TABLE budgets
+ADD CONSTRAINT uq_budget_user_category_month UNIQUE (user_id, category, month);
@@ -0,0 +1,14 @@
+-- Migration: Add composite indexes for prediction lookups
+-- Description: Covers the (user_id, month) listing filter and the latest
+-- prediction per (user_id, category) lookup ordered by created_at.
+
+-- 002_add_indexes.sql targeted a non-existent "predictions" table, so the
+-- (user_id, month) index was never created on spending_predictions
+CREATE INDEX IF NOT EXISTS ix_prediction_user_month
+ON spending_predictions(user_id, month);
+
+CREATE INDEX IF NOT EXISTS ix_prediction_user_cat_created
+ON spending_predictions(user_id, category, created_at);
+
+-- Both new indexes lead with user_id, which makes this one redundant
+DROP INDEX IF EXISTS idx_predictions_user_id;
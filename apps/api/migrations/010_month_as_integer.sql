@@ -0,0 +1,10 @@
+-- Migration: Store budget and prediction months as YYYYMM integers
+-- Description: The application maps "YYYY-MM" to YYYYMM in the YearMonth
+-- column type; integer keys keep the month indexes smaller and faster to
+-- compare than VARCHAR. Indexes on these columns are rebuilt by the ALTER.
+
+ALTER TABLE budgets
+ALTER COLUMN month TYPE INTEGER USING replace(month, '-', '')::int;
+
+ALTER TABLE spending_predictions
+ALTER COLUMN month TYPE INTEGER USING replace(month, '-', '')::int;
@@ -0,0 +1,43 @@
+-- Migration: Store categories as SMALLINT codes
+-- Description: The application maps CategoryEnum members to their 1-based
+-- declaration order in the SmallIntEnum column type. Two-byte codes narrow
+-- rows and category indexes and make GROUP BY category compare integers.
+-- The summary trigger watches expenses.category, so it is dropped for the
+-- ALTER and recreated after.
+
+-- Codes are 1-based positions in this array, which must list CategoryEnum's
+-- member names in declaration order (checked by tests/test_migrations.py).
+-- Unknown values map to OTHER.
+CREATE FUNCTION pg_temp.category_code(category text) RETURNS smallint AS $$
+    SELECT coalesce(
+        array_position(names, upper(category)),
+        array_position(names, 'OTHER')
+    )::smallint
+    FROM (
+        SELECT ARRAY[
+            'FOOD', 'TRANSPORT', 'ENTERTAINMENT', 'UTILITIES', 'SHOPPING',
+            'HEALTH', 'EDUCATION', 'HOUSING', 'INSURANCE', 'SAVINGS',
+            'INVESTMENTS', 'DEBT', 'GIFTS', 'TRAVEL', 'OTHER'
+        ] AS names
+    ) AS category_names
+$$ LANGUAGE sql IMMUTABLE;
+
+DROP TRIGGER IF EXISTS trg_expense_monthly_summary ON expenses;
+
+ALTER TABLE expenses
+ALTER COLUMN category TYPE SMALLINT USING pg_temp.category_code(category::text);
+
+ALTER TABLE budgets
+ALTER COLUMN category TYPE SMALLINT USING pg_temp.category_code(category::text);
+
+ALTER TABLE spending_predictions
+ALTER COLUMN category TYPE SMALLINT USING pg_temp.category_code(category::text);
+
+ALTER TABLE expense_monthly_summary
+ALTER COLUMN category TYPE SMALLINT USING pg_temp.category_code(category::text);
+
+CREATE TRIGGER trg_expense_monthly_summary
+AFTER INSERT OR DELETE OR UPDATE OF user_id, amount, category, date ON expenses
+FOR EACH ROW EXECUTE FUNCTION expense_monthly_summary_apply();
+
+DROP TYPE IF EXISTS categoryenum;
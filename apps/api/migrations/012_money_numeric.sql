@@ -0,0 +1,33 @@
+-- Migration: Store money amounts as NUMERIC(12, 2)
+-- Description: Fixed-point amounts keep SUM(amount) aggregations exact
+-- instead of accumulating double precision rounding error. The summary
+-- trigger watches expenses.amount, so it is dropped for the ALTER and
+-- recreated after.
+
+DROP TRIGGER IF EXISTS trg_expense_monthly_summary ON expenses;
+
+ALTER TABLE expenses
+ALTER COLUMN amount TYPE NUMERIC(12, 2) USING round(amount::numeric, 2);
+
+ALTER TABLE expense_monthly_summary
+ALTER COLUMN total_amount TYPE NUMERIC(12, 2) USING round(total_amount::numeric, 2);
+
+ALTER TABLE budgets
+ALTER COLUMN limit_amount TYPE NUMERIC(12, 2) USING round(limit_amount::numeric, 2);
+
+ALTER TABLE spending_predictions
+ALTER COLUMN predicted_amount TYPE NUMERIC(12, 2) USING round(predicted_amount::numeric, 2);
+
+ALTER TABLE financial_setups
+ALTER COLUMN current_savings TYPE NUMERIC(12, 2) USING round(current_savings::numeric, 2),
+ALTER COLUMN monthly_income TYPE NUMERIC(12, 2) USING round(monthly_income::numeric, 2);
+
+ALTER TABLE recurring_expenses
+ALTER COLUMN amount TYPE NUMERIC(12, 2) USING round(amount::numeric, 2);
+
+ALTER TABLE user_goals
+ALTER COLUMN target_amount TYPE NUMERIC(12, 2) USING round(target_amount::numeric, 2);
+
+CREATE TRIGGER trg_expense_monthly_summary
+AFTER INSERT OR DELETE OR UPDATE OF user_id, amount, category, date ON expenses
+FOR EACH ROW EXECUTE FUNCTION expense_monthly_summary_apply();
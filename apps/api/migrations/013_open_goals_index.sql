@@ -0,0 +1,9 @@
+-- Migration: Partial index on open goals
+-- Description: Replaces the low-selectivity boolean index on
+-- user_goals.is_completed with a per-user index over open goals only.
+
+DROP INDEX IF EXISTS idx_user_goals_is_completed;
+
+CREATE INDEX IF NOT EXISTS ix_goals_open
+ON user_goals(user_id)
+WHERE is_completed = false;
@@ -0,0 +1,41 @@
+-- Migration: UTC server defaults for created_at/updated_at
+-- Description: The application now lets the database fill timestamps on
+-- insert instead of binding a Python datetime per row. The earlier
+-- CURRENT_TIMESTAMP defaults were in the server time zone; timestamps are
+-- naive UTC throughout the application.
+
+ALTER TABLE users
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+-- The models have always carried updated_at; 001 did not create it
+ALTER TABLE expenses ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+
+ALTER TABLE expenses
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+-- The models have always carried updated_at; 001 did not create it
+ALTER TABLE budgets ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+
+ALTER TABLE budgets
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+ALTER TABLE user_profiles
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+ALTER TABLE financial_setups
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+ALTER TABLE user_goals
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+ALTER COLUMN updated_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+ALTER TABLE spending_predictions
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
+
+ALTER TABLE recurring_expenses
+ALTER COLUMN created_at SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP);
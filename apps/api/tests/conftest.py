@@ -1,53 +1,110 @@
+import asyncio
+import os
+import uuid
+
+# Settings are read once at import: point the app at SQLite and keep the
+# Redis response cache out of the way before anything from app/ is imported
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from database import Base, get_db
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.cache import financial_context_cache
+from app.db.session import Base, get_async_db
 from main import app
-from auth import create_access_token
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# In-memory database shared by every connection through a single pooled one
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite://"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=StaticPool)
+TestingSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-@pytest.fixture(scope="function")
+# Tables kept between tests: the session-wide test user lives here
+PERSISTENT_TABLES = {"users"}
+
+
+def run_sync(fn):
+    """Run a sync function against the test database on its own connection."""
+    async def _run():
+        async with engine.begin() as connection:
+            return await connection.run_sync(fn)
+    return asyncio.run(_run())
+
+
+async def override_get_async_db():
+    async with TestingSessionLocal() as db_session:
+        yield db_session
+
+
+@pytest.fixture(scope="session")
 def db():
-    Base.metadata.create_all(bind=engine)
+    run_sync(Base.metadata.create_all)
     yield
-    Base.metadata.drop_all(bind=engine)
+    run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(request):
+    # Isolate tests with row deletes instead of per-test create/drop DDL
+    yield
+    if "db" not in request.fixturenames:
+        return
+
+    def delete_rows(connection):
+        for table in reversed(Base.metadata.sorted_tables):
+            if table.name not in PERSISTENT_TABLES:
+                connection.execute(table.delete())
+
+    run_sync(delete_rows)
+    financial_context_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def session_client(db):
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
-@pytest.fixture
-def authenticated_client(db):
-    def override_get_db():
-        try:
-            db_session = TestingSessionLocal()
-            yield db_session
-        finally:
-            db_session.close()
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
     client = TestClient(app)
-    
-    # Create user and get token
-    client.post(
-        "/api/v1/auth/signup",
+
+    # Create user and get token once for the whole session
+    response = client.post(
+        "/api/v1/auth/register",
         json={
             "email": "test@example.com",
             "password": "testpassword123",
             "full_name": "Test User"
         }
     )
-    
-    response = client.post(
-        "/api/v1/auth/login",
-        json={"email": "test@example.com", "password": "testpassword123"}
+
+    client.token = response.json()["access_token"]
+    client.user_id = client.get(
+        "/api/v1/auth/me", headers={"Authorization": f"Bearer {client.token}"}
+    ).json()["id"]
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def authenticated_client(session_client):
+    # Only the headers are reset per test; the client and token are shared
+    session_client.headers = {"Authorization": f"Bearer {session_client.token}"}
+    return session_client
+
+
+@pytest.fixture
+def new_user_client(session_client):
+    # For tests that change the user row itself, which outlives each test
+    session_client.headers = {}
+    response = session_client.post(
+        "/api/v1/auth/register",
+        json={"email": f"user-{uuid.uuid4().hex}@example.com", "password": "testpassword123"}
     )
-    
-    token = response.json()["access_token"]
-    client.headers = {"Authorization": f"Bearer {token}"}
-    
-    return client
+    session_client.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return session_client
@@ -0,0 +1,24 @@
+# AI advisor endpoint tests
+from datetime import datetime
+
+
+def test_chat_and_insights_use_category_values(authenticated_client):
+    month = datetime.utcnow().strftime("%Y-%m")
+    authenticated_client.post(
+        "/api/v1/expenses",
+        json={"amount": 250.0, "category": "food", "description": "Groceries"}
+    )
+    authenticated_client.post(
+        "/api/v1/budgets/",
+        json={"category": "food", "limit_amount": 200.0, "month": month}
+    )
+
+    response = authenticated_client.post(
+        "/api/v1/ai/chat", json={"message": "Any alerts?"}
+    )
+    assert response.status_code == 200
+    assert "food" in response.json()["response"]
+
+    response = authenticated_client.get("/api/v1/ai/insights")
+    assert response.status_code == 200
+    assert response.json()["insights"][0]["message"].startswith("Your highest spending is in food")
@@ -0,0 +1,28 @@
+# Analytics endpoint tests
+from datetime import datetime, timedelta
+
+def test_analytics_keep_client_max_age(authenticated_client):
+    response = authenticated_client.get("/api/v1/analytics/trends")
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("private, max-age=")
+
+def test_trends_count_the_first_month_in_full(authenticated_client):
+    months = 3
+    start = datetime.utcnow() - timedelta(days=months * 30)
+    first_day = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_before = first_day - timedelta(days=1)
+    authenticated_client.post(
+        "/api/v1/expenses/bulk",
+        json=[
+            {"amount": 20.0, "category": "food", "description": "First day",
+             "date": first_day.isoformat()},
+            {"amount": 7.0, "category": "food", "description": "Previous month",
+             "date": month_before.isoformat()},
+        ]
+    )
+
+    response = authenticated_client.get("/api/v1/analytics/trends", params={"months": months})
+    assert response.status_code == 200
+    assert response.json()["trends"] == [
+        {"month": f"{first_day:%Y-%m}", "total": 20.0, "count": 1}
+    ]
@@ -1,65 +1,56 @@
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from database import Base, get_db
-from main import app
-from schemas import UserCreate
-
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+import asyncio
+import time
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+import bcrypt
+import pytest
+from sqlalchemy import update
 
-Base.metadata.create_all(bind=engine)
+from app.core import cache, security
+from app.models.user import User
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+from tests.conftest import TestingSessionLocal
 
-app.dependency_overrides[get_db] = override_get_db
 
-client = TestClient(app)
+@pytest.fixture
+def client(session_client):
+    # Auth endpoints are called without the session user's token
+    session_client.headers = {}
+    return session_client
 
-def test_signup():
+def test_signup(client):
     response = client.post(
-        "/api/v1/auth/signup",
+        "/api/v1/auth/register",
         json={
-            "email": "test@example.com",
+            "email": "signup@example.com",
             "password": "testpassword123",
             "full_name": "Test User"
         }
     )
-    assert response.status_code == 200
+    assert response.status_code == 201
     assert "access_token" in response.json()
 
-def test_signup_duplicate_email():
+def test_signup_duplicate_email(client):
     client.post(
-        "/api/v1/auth/signup",
+        "/api/v1/auth/register",
         json={
-            "email": "test@example.com",
+            "email": "duplicate@example.com",
             "password": "testpassword123",
             "full_name": "Test User"
         }
     )
     response = client.post(
-        "/api/v1/auth/signup",
+        "/api/v1/auth/register",
         json={
-            "email": "test@example.com",
+            "email": "duplicate@example.com",
             "password": "testpassword123",
             "full_name": "Test User"
         }
     )
     assert response.status_code == 400
 
-def test_login():
+def test_login(client):
     client.post(
-        "/api/v1/auth/signup",
+        "/api/v1/auth/register",
         json={
             "email": "login@example.com",
             "password": "testpassword123",
@@ -73,9 +64,55 @@ def test_login():
     assert response.status_code == 200
     assert "access_token" in response.json()
 
-def test_login_invalid_credentials():
+def test_login_invalid_credentials(client):
     response = client.post(
         "/api/v1/auth/login",
         json={"email": "nonexistent@example.com", "password": "wrongpassword"}
     )
     assert response.status_code == 401
+
+def test_validation_errors_do_not_log_input(client, caplog):
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": "short@example.com", "password": "hunter2"}
+    )
+    assert response.status_code == 422
+    assert "hunter2" not in response.text
+    assert "hunter2" not in caplog.text
+
+def test_password_rehash_only_upgrades():
+    cost = security.settings.BCRYPT_COST
+    assert security.password_needs_rehash(f"$2b${cost - 1:02d}$salt")
+    assert not security.password_needs_rehash(f"$2b${cost:02d}$salt")
+    assert not security.password_needs_rehash(f"$2b${cost + 2:02d}$salt")
+
+def test_deactivation_takes_effect(new_user_client):
+    response = new_user_client.put("/api/v1/users/me", json={"is_active": False})
+    assert response.status_code == 200
+
+    response = new_user_client.get("/api/v1/users/me")
+    assert response.status_code == 400
+
+def test_deactivation_by_another_worker_takes_effect_within_ttl(new_user_client, monkeypatch):
+    user_id = new_user_client.get("/api/v1/users/me").json()["id"]
+
+    # Another worker's write reaches the database but not this process's cache
+    async def deactivate():
+        async with TestingSessionLocal() as db:
+            await db.execute(update(User).where(User.id == user_id).values(is_active=False))
+            await db.commit()
+
+    asyncio.run(deactivate())
+
+    now = time.monotonic()
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + security.settings.USER_CACHE_TTL + 1)
+    response = new_user_client.get("/api/v1/users/me")
+    assert response.status_code == 400
+
+def test_dummy_hash_matches_slowest_stored_hash():
+    def cost(hashed_password):
+        return int(hashed_password.split("$")[2])
+
+    legacy_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=12)).decode("utf-8")
+    assert cost(security._DUMMY_PASSWORD_HASH) == cost(legacy_hash)
+    assert cost(security._DUMMY_PASSWORD_HASH) >= cost(security.hash_password("password"))
@@ -0,0 +1,18 @@
+# Budget endpoint tests
+
+def test_list_budgets_revalidates_after_write(authenticated_client):
+    response = authenticated_client.get("/api/v1/budgets")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = authenticated_client.get("/api/v1/budgets", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    authenticated_client.post(
+        "/api/v1/budgets/",
+        json={"category": "food", "limit_amount": 300.0, "month": "2024-01"}
+    )
+    response = authenticated_client.get("/api/v1/budgets", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [item["category"] for item in response.json()] == ["food"]
@@ -0,0 +1,27 @@
+# Dashboard endpoint tests
+
+def test_dashboard_month(authenticated_client):
+    authenticated_client.post(
+        "/api/v1/expenses/bulk",
+        json=[
+            {"amount": 40.0, "category": "food", "description": "Groceries", "date": "2024-01-10T12:00:00"},
+            {"amount": 15.0, "category": "transport", "description": "Bus pass", "date": "2024-01-12T12:00:00"},
+            {"amount": 99.0, "category": "food", "description": "Next month", "date": "2024-02-01T12:00:00"},
+        ]
+    )
+    authenticated_client.post(
+        "/api/v1/budgets/",
+        json={"category": "food", "limit_amount": 200.0, "month": "2024-01"}
+    )
+
+    response = authenticated_client.get("/api/v1/dashboard/2024-01")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["month"] == "2024-01"
+    assert data["total_amount"] == 55.0
+    assert data["by_category"] == {"food": 40.0, "transport": 15.0}
+    assert [(item["category"], item["spent"]) for item in data["budgets"]] == [("food", 40.0)]
+
+def test_dashboard_invalid_month(authenticated_client):
+    response = authenticated_client.get("/api/v1/dashboard/2024-1")
+    assert response.status_code == 422
@@ -1,25 +1,105 @@
 # Expense endpoint tests
-import pytest
-from fastapi.testclient import TestClient
-from main import app
-from database import get_db
+import importlib
+import json
+
+# app.crud re-exports the CRUD instance under the module's own name
+crud_expense = importlib.import_module("app.crud.expense")
 
-client = TestClient(app)
 
 def test_create_expense(authenticated_client):
     response = authenticated_client.post(
-        "/api/v1/expenses/",
+        "/api/v1/expenses",
         json={
             "amount": 50.00,
-            "category": "Food",
+            "category": "food",
             "description": "Lunch",
-            "date": "2024-01-15"
+            "date": "2024-01-15T12:00:00"
         }
     )
     assert response.status_code == 201
-    assert response.json()["category"] == "Food"
+    assert response.json()["category"] == "food"
 
 def test_list_expenses(authenticated_client):
-    response = authenticated_client.get("/api/v1/expenses/")
+    response = authenticated_client.get("/api/v1/expenses")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+def test_list_expenses_revalidates_after_write(authenticated_client):
+    response = authenticated_client.get("/api/v1/expenses")
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = authenticated_client.get("/api/v1/expenses", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    authenticated_client.post(
+        "/api/v1/expenses",
+        json={"amount": 12.00, "category": "transport", "description": "Taxi"}
+    )
+    response = authenticated_client.get("/api/v1/expenses", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [item["description"] for item in response.json()] == ["Taxi"]
+
+def _expense(i, category="food"):
+    return {
+        "amount": 10.0 + i,
+        "category": category,
+        "description": f"Expense {i}",
+        "date": f"2024-01-{i % 28 + 1:02d}T12:00:00"
+    }
+
+def test_bulk_create_rejects_empty_and_oversized_batches(authenticated_client):
+    response = authenticated_client.post("/api/v1/expenses/bulk", json=[])
+    assert response.status_code == 422
+
+    response = authenticated_client.post(
+        "/api/v1/expenses/bulk", json=[_expense(i) for i in range(1001)]
+    )
+    assert response.status_code == 422
+
+def test_bulk_create_inserts_every_row(authenticated_client):
+    payload = [_expense(i) for i in range(3)]
+    response = authenticated_client.post("/api/v1/expenses/bulk", json=payload)
+    assert response.status_code == 201
+    assert [item["description"] for item in response.json()] == ["Expense 0", "Expense 1", "Expense 2"]
+
+    response = authenticated_client.get("/api/v1/expenses")
+    assert len(response.json()) == 3
+
+def test_bulk_create_invalidates_user_cache(authenticated_client, monkeypatch):
+    invalidated = []
+
+    async def record(user_id):
+        invalidated.append(user_id)
+
+    monkeypatch.setattr(crud_expense, "invalidate_user_cache_async", record)
+    authenticated_client.post("/api/v1/expenses/bulk", json=[_expense(0)])
+    assert invalidated == [authenticated_client.user_id]
+
+def test_export_empty(authenticated_client):
+    response = authenticated_client.get("/api/v1/expenses/export")
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_export_streams_every_batch(authenticated_client):
+    # More rows than one server-side cursor batch (500)
+    for start in (0, 1000):
+        authenticated_client.post(
+            "/api/v1/expenses/bulk", json=[_expense(i) for i in range(start, start + 600)]
+        )
+
+    response = authenticated_client.get("/api/v1/expenses/export")
+    assert response.status_code == 200
+    exported = json.loads(response.content)
+    assert len(exported) == 1200
+    assert len({item["id"] for item in exported}) == 1200
+
+def test_export_filters_by_category(authenticated_client):
+    authenticated_client.post(
+        "/api/v1/expenses/bulk",
+        json=[_expense(0, "food"), _expense(1, "transport"), _expense(2, "food")]
+    )
+
+    response = authenticated_client.get("/api/v1/expenses/export", params={"category": "food"})
+    assert response.status_code == 200
+    assert [item["description"] for item in response.json()] == ["Expense 0", "Expense 2"]
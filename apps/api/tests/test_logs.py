@@ -0,0 +1,29 @@
+import asyncio
+import threading
+
+from app.middleware import logging as log_middleware
+
+
+def test_stream_replay_and_queue_never_repeat_an_entry():
+    log_middleware.clear_log_buffer()
+
+    async def subscribe_while_logging():
+        writer = threading.Thread(
+            target=lambda: [log_middleware.add_to_log_buffer({"n": n}) for n in range(500)]
+        )
+        writer.start()
+        backlog, queue = log_middleware.subscribe(replay=log_middleware.MAX_BUFFER_SIZE)
+        writer.join()
+        # Let the loop run the hand-offs the writer thread scheduled
+        for _ in range(10):
+            await asyncio.sleep(0)
+        queued = [queue.get_nowait() for _ in range(queue.qsize())]
+        log_middleware.unsubscribe(queue)
+        return backlog + queued
+
+    try:
+        seen = [entry["n"] for entry in asyncio.run(subscribe_while_logging())]
+    finally:
+        log_middleware.clear_log_buffer()
+
+    assert seen == list(range(500))
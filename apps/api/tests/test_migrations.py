@@ -0,0 +1,16 @@
+# SQL migration consistency tests
+import re
+from pathlib import Path
+
+from app.models.expense import CategoryEnum
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+
+def test_category_codes_match_smallint_enum():
+    # Migration 011 maps names to codes by position; SmallIntEnum uses the
+    # 1-based declaration order of CategoryEnum, so the two lists must agree
+    sql = (MIGRATIONS_DIR / "011_category_smallint.sql").read_text()
+    array = re.search(r"ARRAY\[(.*?)\]", sql, re.DOTALL).group(1)
+    names = re.findall(r"'([A-Z_]+)'", array)
+    assert names == [member.name for member in CategoryEnum]
@@ -0,0 +1,65 @@
+# Onboarding endpoint tests
+import pytest
+
+
+def test_snapshot_before_onboarding(new_user_client):
+    response = new_user_client.get("/api/v1/onboarding/snapshot")
+    assert response.status_code == 200
+    assert response.json() == {
+        "is_onboarded": False,
+        "profile": None,
+        "financial_setup": None,
+        "budgets": [],
+        "goals": [],
+    }
+
+def test_snapshot_with_partial_data(new_user_client):
+    new_user_client.post(
+        "/api/v1/onboarding/profile",
+        json={"name": "Ada Lovelace", "currency": "EUR", "theme": "dark"}
+    )
+
+    response = new_user_client.get("/api/v1/onboarding/snapshot")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["is_onboarded"] is False
+    assert (data["profile"]["name"], data["profile"]["currency"], data["profile"]["theme"]) == (
+        "Ada Lovelace", "EUR", "dark"
+    )
+    assert data["financial_setup"] is None
+    assert data["budgets"] == [] and data["goals"] == []
+
+def test_snapshot_after_onboarding(new_user_client):
+    new_user_client.post("/api/v1/onboarding/profile", json={"name": "Ada Lovelace"})
+    new_user_client.post(
+        "/api/v1/onboarding/financial",
+        json={"monthlyIncome": 4000, "currentSavings": 1000,
+              "recurringExpenses": [{"name": "Rent", "amount": 1200}]}
+    )
+    new_user_client.post(
+        "/api/v1/onboarding/budgets", json={"budgets": [{"category": "food", "limit": 300}]}
+    )
+    new_user_client.post(
+        "/api/v1/onboarding/goals",
+        json={"goals": [{"title": "Emergency fund", "targetAmount": 5000,
+                         "targetDate": "2030-01-01T00:00:00"}]}
+    )
+    new_user_client.post("/api/v1/onboarding/complete")
+
+    response = new_user_client.get("/api/v1/onboarding/snapshot")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["is_onboarded"] is True
+    assert data["financial_setup"]["recurring_expenses"][0]["name"] == "Rent"
+    assert [(item["category"], item["limit_amount"]) for item in data["budgets"]] == [("food", 300.0)]
+    assert [goal["title"] for goal in data["goals"]] == ["Emergency fund"]
+
+@pytest.mark.parametrize("full_name", ["B", None])
+def test_snapshot_after_name_is_shortened_or_cleared(new_user_client, full_name):
+    new_user_client.post("/api/v1/onboarding/profile", json={"name": "Ada Lovelace"})
+    new_user_client.post("/api/v1/onboarding/complete")
+    new_user_client.put("/api/v1/users/me", json={"full_name": full_name})
+
+    response = new_user_client.get("/api/v1/onboarding/snapshot")
+    assert response.status_code == 200
+    assert response.json()["profile"]["name"] == (full_name or "")